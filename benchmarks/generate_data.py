@@ -0,0 +1,209 @@
+import argparse
+import random
+import time
+from datetime import date, timedelta
+
+from src.auth.authentication import Authentication
+from src.database.db_config import DatabaseConfig
+from src.database.db_operations import DatabaseOperations, grade
+
+# Every synthetic row is tagged with this prefix so --purge can remove it again
+PREFIX = 'SYN'
+EXAM_TYPES = ['Internal 1', 'Internal 2', 'Internal 3', 'Semester', 'Final']
+STATUSES = ['Present'] * 8 + ['Absent'] * 3 + ['Leave']
+FIRST_NAMES = ['Aarav', 'Diya', 'Ishaan', 'Meera', 'Kabir', 'Ananya', 'Rohan', 'Sara', 'Vivaan', 'Zoya']
+LAST_NAMES = ['Sharma', 'Patel', 'Iyer', 'Khan', 'Reddy', 'Das', 'Gupta', 'Nair', 'Singh', 'Joshi']
+
+
+def chunked(rows, size):
+    chunk = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+class DataGenerator:
+    def __init__(self, db_config, seed=42, batch_size=5000):
+        self.db = db_config
+        self.db_ops = DatabaseOperations(db_config)
+        self.random = random.Random(seed)
+        self.batch_size = batch_size
+
+    # 🔹 Bulk-insert rows in batches on one connection with key checks relaxed
+    def _load(self, query, rows, label):
+        start = time.perf_counter()
+        total = 0
+        backend = self.db.backend
+        query = backend.dialect.translate(query)
+        with self.db.pool.connection() as connection:
+            cursor = backend.cursor(connection)
+            try:
+                for statement in backend.bulk_load_begin:
+                    cursor.execute(statement)
+                for batch in chunked(rows, self.batch_size):
+                    cursor.executemany(query, batch)
+                    connection.commit()
+                    total += len(batch)
+                    print(f"\r  {label}: {total:,} rows", end='', flush=True)
+            finally:
+                for statement in backend.bulk_load_end:
+                    cursor.execute(statement)
+                cursor.close()
+        print(f"\r  {label}: {total:,} rows in {time.perf_counter() - start:.1f}s")
+        return total
+
+    def _name(self):
+        return f"{self.random.choice(FIRST_NAMES)} {self.random.choice(LAST_NAMES)}"
+
+    def generate_courses(self, count):
+        rows = ((f"{PREFIX}C{i:03d}", f"Synthetic Course {i}", 4, 'Synthetic') for i in range(count))
+        self._load("INSERT INTO courses (course_code, course_name, duration, department) VALUES (%s, %s, %s, %s)",
+                   rows, 'courses')
+        return self.db.fetch_all("SELECT course_id FROM courses WHERE course_code LIKE %s", (f"{PREFIX}%",))
+
+    def generate_subjects(self, count, courses):
+        rows = ((f"{PREFIX}S{i:05d}", f"Synthetic Subject {i}", courses[i % len(courses)]['course_id'],
+                 self.random.randint(2, 5), (i // len(courses)) % 8 + 1) for i in range(count))
+        self._load("""INSERT INTO subjects (subject_code, subject_name, course_id, credits, semester)
+                      VALUES (%s, %s, %s, %s, %s)""", rows, 'subjects')
+        return self.db.fetch_all("SELECT subject_id, course_id, semester FROM subjects WHERE subject_code LIKE %s",
+                                 (f"{PREFIX}%",))
+
+    def generate_users(self, role, count, password):
+        hashed = Authentication.hash_password(password)
+        tag = role[0]
+        rows = ((f"{PREFIX.lower()}_{tag}{i:07d}", hashed, role) for i in range(count))
+        self._load("INSERT INTO users (username, password, role) VALUES (%s, %s, %s)", rows, f'{role} users')
+        return [u['user_id'] for u in self.db.fetch_all(
+            "SELECT user_id FROM users WHERE username LIKE %s ORDER BY user_id",
+            (f"{PREFIX.lower()}\\_{tag}%",))]
+
+    def generate_faculty(self, user_ids):
+        rows = ((user_id, f"{PREFIX}F{i:05d}", self._name(), f"faculty{i}@synthetic.edu", '9000000000',
+                 'Synthetic', 'Lecturer') for i, user_id in enumerate(user_ids))
+        self._load("""INSERT INTO faculty (user_id, faculty_code, name, email, phone, department, designation)
+                      VALUES (%s, %s, %s, %s, %s, %s, %s)""", rows, 'faculty')
+        return [f['faculty_id'] for f in self.db.fetch_all(
+            "SELECT faculty_id FROM faculty WHERE faculty_code LIKE %s", (f"{PREFIX}%",))]
+
+    def generate_students(self, user_ids, courses):
+        def rows():
+            for i, user_id in enumerate(user_ids):
+                yield (user_id, f"{PREFIX}{i:07d}", self._name(), f"student{i}@synthetic.edu",
+                       f"9{self.random.randint(0, 999999999):09d}", '2005-01-01',
+                       self.random.choice(['Male', 'Female', 'Other']), 'Synthetic Address',
+                       courses[i % len(courses)]['course_id'], self.random.randint(1, 8), '2024-08-01')
+        self._load("""INSERT INTO students (user_id, roll_number, name, email, phone, date_of_birth, gender,
+                      address, course_id, semester, enrollment_date)
+                      VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)""", rows(), 'students')
+        return self.db.fetch_all("""SELECT student_id, course_id, semester FROM students
+                                    WHERE roll_number LIKE %s""", (f"{PREFIX}%",))
+
+    @staticmethod
+    def _subjects_by_class(subjects):
+        by_class = {}
+        for subject in subjects:
+            by_class.setdefault((subject['course_id'], subject['semester']), []).append(subject['subject_id'])
+        return by_class
+
+    def generate_attendance(self, target, students, subjects, faculty_ids, start=date(2024, 8, 1)):
+        by_class = self._subjects_by_class(subjects)
+        enrolments = [(s['student_id'], by_class.get((s['course_id'], s['semester']), [])) for s in students]
+        enrolments = [(student_id, subject_ids) for student_id, subject_ids in enrolments if subject_ids]
+        if not enrolments:
+            return 0
+
+        def rows():
+            produced = 0
+            day = start
+            while True:
+                # One class per day per enrolled subject; the unique key is (student, subject, date)
+                for student_id, subject_ids in enrolments:
+                    for subject_id in subject_ids:
+                        yield (student_id, subject_id, day, self.random.choice(STATUSES),
+                               self.random.choice(faculty_ids))
+                        produced += 1
+                        if produced >= target:
+                            return
+                day += timedelta(days=1)
+
+        return self._load("""INSERT INTO attendance (student_id, subject_id, attendance_date, status, marked_by)
+                             VALUES (%s, %s, %s, %s, %s)""", rows(), 'attendance')
+
+    def generate_marks(self, target, students, subjects, faculty_ids):
+        by_class = self._subjects_by_class(subjects)
+        # Read the scale once, before _load takes a pool connection for the whole run
+        scheme_id, thresholds, letters = self.db_ops.get_grading_scale()
+
+        def rows():
+            produced = 0
+            while True:
+                for exam_type in EXAM_TYPES:
+                    for student in students:
+                        for subject_id in by_class.get((student['course_id'], student['semester']), []):
+                            obtained = round(self.random.uniform(20, 100), 2)
+                            yield (student['student_id'], subject_id, exam_type, obtained, 100,
+                                   grade(thresholds, letters, obtained, 100), self.random.choice(faculty_ids),
+                                   scheme_id)
+                            produced += 1
+                            if produced >= target:
+                                return
+                if produced == 0:
+                    return
+
+        return self._load("""INSERT INTO marks (student_id, subject_id, exam_type, marks_obtained, max_marks,
+                             grade, entered_by, scheme_id) VALUES (%s, %s, %s, %s, %s, %s, %s, %s)""",
+                          rows(), 'marks')
+
+    def generate(self, students, subjects, courses, faculty, attendance, marks, password='student123'):
+        print("Generating synthetic population...")
+        course_rows = self.generate_courses(courses)
+        subject_rows = self.generate_subjects(subjects, course_rows)
+        faculty_ids = self.generate_faculty(self.generate_users('faculty', faculty, password))
+        student_rows = self.generate_students(self.generate_users('student', students, password), course_rows)
+        self.generate_attendance(attendance, student_rows, subject_rows, faculty_ids)
+        self.generate_marks(marks, student_rows, subject_rows, faculty_ids)
+        self.db.fetch_all("ANALYZE TABLE users, courses, subjects, faculty, students, attendance, marks")
+        print("Done.")
+
+    # 🔹 Remove everything generated above (cascades through students/faculty/subjects)
+    def purge(self):
+        self.db.execute_query("DELETE FROM users WHERE username LIKE %s", (f"{PREFIX.lower()}\\_%",))
+        self.db.execute_query("DELETE FROM courses WHERE course_code LIKE %s", (f"{PREFIX}%",))
+        print("Synthetic data removed.")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load a synthetic population for benchmarking")
+    parser.add_argument('--students', type=int, default=50_000)
+    parser.add_argument('--subjects', type=int, default=500)
+    parser.add_argument('--courses', type=int, default=20)
+    parser.add_argument('--faculty', type=int, default=200)
+    parser.add_argument('--attendance', type=int, default=20_000_000)
+    parser.add_argument('--marks', type=int, default=2_000_000)
+    parser.add_argument('--batch-size', type=int, default=5000)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--purge', action='store_true', help="delete previously generated data and exit")
+    parser.add_argument('--sqlite', metavar='PATH', help="load into this SQLite file instead of MySQL")
+    args = parser.parse_args()
+
+    db_config = DatabaseConfig(query_stats=False, backend='sqlite' if args.sqlite else 'mysql',
+                               sqlite_path=args.sqlite)
+    if not db_config.initialize_database():
+        raise SystemExit(1)
+
+    generator = DataGenerator(db_config, seed=args.seed, batch_size=args.batch_size)
+    if args.purge:
+        generator.purge()
+    else:
+        generator.generate(args.students, args.subjects, args.courses, args.faculty,
+                           args.attendance, args.marks)
+    db_config.disconnect()
+
+
+if __name__ == '__main__':
+    main()
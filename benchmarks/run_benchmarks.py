@@ -0,0 +1,265 @@
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import time
+import uuid
+
+from src.auth.authentication import Authentication
+from src.database.db_config import DatabaseConfig
+from src.database.db_operations import DatabaseOperations
+from benchmarks.generate_data import PREFIX
+
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'results')
+TABLES = ['users', 'courses', 'subjects', 'faculty', 'students', 'attendance', 'marks']
+BENCH_PASSWORD = 'student123'
+# Bench-written attendance/marks use values the generator never produces, so cleanup can find them
+BENCH_DATE = '2030-01-01'
+BENCH_MAX_MARKS = 200
+
+
+def _unique(tag):
+    # Lands inside the generator's purge patterns (syn_% usernames, SYN% codes)
+    return f"{tag}{uuid.uuid4().hex[:10]}"
+
+
+class BenchmarkSuite:
+    def __init__(self, db_config, iterations=20, warmup=2, cold=False):
+        self.db = db_config
+        self.db_ops = DatabaseOperations(db_config)
+        self.auth = Authentication(db_config)
+        self.iterations = iterations
+        self.warmup = warmup
+        self.cold = cold
+
+    # 🔹 Pick real ids from the synthetic population to drive the cases
+    def load_fixtures(self):
+        # A synthetic student that has attendance (the first one the generator wrote)
+        student = self.db.fetch_one(
+            """SELECT s.*, u.username FROM students s JOIN users u ON s.user_id = u.user_id
+               WHERE s.student_id = (SELECT a.student_id FROM attendance a
+                                     JOIN students st ON a.student_id = st.student_id
+                                     WHERE st.roll_number LIKE %s
+                                     ORDER BY a.attendance_id LIMIT 1)""", (f"{PREFIX}%",))
+        if not student:
+            raise SystemExit("No synthetic data found. Run: python -m benchmarks.generate_data")
+        subject = self.db.fetch_one(
+            "SELECT subject_id FROM subjects WHERE course_id = %s AND semester = %s LIMIT 1",
+            (student['course_id'], student['semester']))
+        faculty = self.db.fetch_one("SELECT faculty_id, user_id FROM faculty WHERE faculty_code LIKE %s LIMIT 1",
+                                    (f"{PREFIX}%",))
+        middle = self.db.fetch_one("SELECT MAX(student_id) DIV 2 AS student_id FROM students")
+
+        self.student = student
+        self.subject_id = subject['subject_id'] if subject else None
+        self.faculty = faculty
+        self.middle_id = middle['student_id'] if middle else 0
+        self.course_id = student['course_id']
+        self.roster = [(row['student_id'], 'Present') for row in
+                       self.db_ops.get_class_roster(self.subject_id, BENCH_DATE)] if self.subject_id else []
+
+    def cases(self):
+        s, ops, auth = self.student, self.db_ops, self.auth
+        sid, roll, subject_id = s['student_id'], s['roll_number'], self.subject_id
+        faculty_id = self.faculty['faculty_id'] if self.faculty else None
+        faculty_user = self.faculty['user_id'] if self.faculty else None
+        sheet = [(student_id, 145, BENCH_MAX_MARKS) for student_id, _ in self.roster]
+        scale = ops.get_grading_scale()
+
+        def add_student():
+            user_id = auth.create_user(_unique('syn_bs'), BENCH_PASSWORD, 'student')
+            return ops.add_student(user_id, _unique('SYNB'), 'Bench Student', 'bench@synthetic.edu',
+                                   '9000000000', '2005-01-01', 'Other', 'Bench', self.course_id, 1)
+
+        def add_faculty():
+            user_id = auth.create_user(_unique('syn_bf'), BENCH_PASSWORD, 'faculty')
+            return ops.add_faculty(user_id, _unique('SYNBF'), 'Bench Faculty', 'bench@synthetic.edu',
+                                   '9000000000', 'Synthetic', 'Lecturer')
+
+        def delete_student():
+            ops.delete_student(sid)
+            self.db.execute_query("UPDATE students SET status='Active' WHERE student_id=%s", (sid,))
+
+        return {
+            # DatabaseOperations
+            'ops.add_student': add_student,
+            'ops.get_all_students': ops.get_all_students,
+            'ops.get_students_page.first': lambda: ops.get_students_page(None, 100),
+            'ops.get_students_page.middle': lambda: ops.get_students_page(self.middle_id, 100),
+            'ops.get_student_by_id': lambda: ops.get_student_by_id(sid),
+            'ops.get_student_by_roll': lambda: ops.get_student_by_roll(roll),
+            'ops.update_student': lambda: ops.update_student(sid, s['name'], s['email'], s['phone'],
+                                                             s['address'], s['semester']),
+            'ops.delete_student': delete_student,
+            'ops.add_faculty': add_faculty,
+            'ops.get_all_faculty': ops.get_all_faculty,
+            'ops.get_all_courses': ops.get_all_courses,
+            'ops.get_all_subjects': ops.get_all_subjects,
+            'ops.get_all_subjects.course': lambda: ops.get_all_subjects(self.course_id),
+            'ops.mark_attendance': lambda: ops.mark_attendance(sid, subject_id, BENCH_DATE, 'Present',
+                                                               faculty_id),
+            'ops.mark_attendance_bulk': lambda: ops.mark_attendance_bulk(subject_id, BENCH_DATE, self.roster,
+                                                                         faculty_id),
+            'ops.get_class_roster': lambda: ops.get_class_roster(subject_id, BENCH_DATE),
+            'ops.get_attendance': lambda: ops.get_attendance(sid),
+            'ops.get_attendance.subject': lambda: ops.get_attendance(sid, subject_id),
+            'ops.get_attendance_percentage': lambda: ops.get_attendance_percentage(sid, subject_id),
+            'ops.get_attendance_summary': lambda: ops.get_attendance_summary(sid),
+            'ops.add_marks': lambda: ops.add_marks(sid, subject_id, 'Internal 1', 145, BENCH_MAX_MARKS, faculty_id),
+            'ops.add_marks_bulk': lambda: ops.add_marks_bulk(subject_id, 'Internal 1', sheet, faculty_id),
+            'ops.get_marks': lambda: ops.get_marks(sid),
+            'ops.get_marks.subject': lambda: ops.get_marks(sid, subject_id),
+            'ops.calculate_grade': lambda: ops.calculate_grade(145, BENCH_MAX_MARKS, scale),
+            'ops.calculate_grades': lambda: ops.calculate_grades([(145, BENCH_MAX_MARKS)] * len(sheet)),
+            'ops.get_grading_scale': lambda: ops.get_grading_scale(),
+            'ops.regrade_marks': lambda: ops.regrade_marks(),
+            'ops.add_course': lambda: ops.add_course(_unique('SYNB'), 'Bench Course', 4, 'Synthetic'),
+            'ops.add_subject': lambda: ops.add_subject(_unique('SYNB'), 'Bench Subject', self.course_id, 3, 1),
+            # Authentication
+            'auth.hash_password': lambda: auth.hash_password(BENCH_PASSWORD),
+            'auth.create_user': lambda: auth.create_user(_unique('syn_bu'), BENCH_PASSWORD, 'student'),
+            'auth.verify_login': lambda: auth.verify_login(s['username'], BENCH_PASSWORD),
+            'auth.get_user_details.student': lambda: auth.get_user_details(s['user_id'], 'student'),
+            'auth.get_user_details.faculty': lambda: auth.get_user_details(faculty_user, 'faculty'),
+            'auth.change_password': lambda: auth.change_password(s['user_id'], BENCH_PASSWORD, BENCH_PASSWORD),
+            # Dashboard data paths (the queries each screen issues when opened)
+            'view.login': lambda: (auth.verify_login(s['username'], BENCH_PASSWORD),
+                                   auth.get_user_details(s['user_id'], 'student')),
+            'view.admin.view_students': lambda: ops.get_students_page(None, 100),
+            'view.admin.add_student_form': ops.get_all_courses,
+            'view.faculty.mark_attendance': lambda: (ops.get_all_subjects(), ops.get_student_by_roll(roll)),
+            'view.faculty.class_attendance': lambda: (ops.get_all_subjects(),
+                                                      ops.get_class_roster(subject_id, BENCH_DATE)),
+            'view.faculty.view_attendance': lambda: ops.get_attendance(ops.get_student_by_roll(roll)['student_id']),
+            'view.faculty.view_marks': lambda: ops.get_marks(ops.get_student_by_roll(roll)['student_id']),
+            'view.faculty.marks_sheet': lambda: (ops.get_all_subjects(), ops.get_class_roster(subject_id)),
+            'view.student.profile': lambda: ops.get_student_by_id(sid),
+            'view.student.attendance': lambda: (ops.get_attendance(sid), ops.get_attendance_summary(sid)),
+            'view.student.marks': lambda: ops.get_marks(sid),
+            'view.student.report': lambda: (ops.get_student_by_id(sid), ops.get_attendance_summary(sid),
+                                            ops.get_marks(sid)),
+        }
+
+    def _clear_caches(self):
+        self.db.reference_cache.clear()
+        self.db.student_cache.clear()
+
+    def time_case(self, work):
+        for _ in range(self.warmup):
+            work()
+        samples = []
+        for _ in range(self.iterations):
+            if self.cold:
+                self._clear_caches()
+            start = time.perf_counter()
+            work()
+            samples.append((time.perf_counter() - start) * 1000)
+        samples.sort()
+        return {
+            'iterations': len(samples),
+            'min_ms': round(samples[0], 3),
+            'median_ms': round(statistics.median(samples), 3),
+            'p95_ms': round(samples[min(len(samples) - 1, int(len(samples) * 0.95))], 3),
+            'mean_ms': round(statistics.fmean(samples), 3),
+            'max_ms': round(samples[-1], 3),
+        }
+
+    def run(self, only=None):
+        self.load_fixtures()
+        results = {}
+        for name, work in self.cases().items():
+            if only and not any(pattern in name for pattern in only):
+                continue
+            results[name] = self.time_case(work)
+            print(f"  {name:<40} median {results[name]['median_ms']:>10.3f} ms   "
+                  f"p95 {results[name]['p95_ms']:>10.3f} ms")
+        return results
+
+    def cleanup(self):
+        self.db.execute_query("DELETE FROM attendance WHERE attendance_date = %s", (BENCH_DATE,))
+        self.db.execute_query("DELETE FROM marks WHERE max_marks = %s", (BENCH_MAX_MARKS,))
+        self.db.execute_query("DELETE FROM users WHERE username LIKE 'syn\\_b%'")
+        self.db.execute_query("DELETE FROM courses WHERE course_code LIKE 'SYNB%'")
+        self.db.execute_query("DELETE FROM subjects WHERE subject_code LIKE 'SYNB%'")
+
+    def environment(self):
+        counts = {}
+        for table in TABLES:
+            row = self.db.fetch_one(f"SELECT COUNT(*) AS n FROM {table}")
+            counts[table] = row['n'] if row else None
+        try:
+            commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True,
+                                    text=True, check=True).stdout.strip()
+        except (OSError, subprocess.CalledProcessError):
+            commit = None
+        return {
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'commit': commit,
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'iterations': self.iterations,
+            'cold_caches': self.cold,
+            'backend': self.db.backend.name,
+            'prepared_statements': self.db.prepared_statements,
+            'row_counts': counts,
+        }
+
+
+def compare(current, baseline_path):
+    with open(baseline_path, 'r', encoding='utf-8') as f:
+        baseline = json.load(f)['results']
+    print(f"\nCompared with {baseline_path} (median ms):")
+    for name, result in current.items():
+        before = baseline.get(name)
+        if not before:
+            print(f"  {name:<40} {'new':>10} -> {result['median_ms']:>10.3f}")
+            continue
+        change = (result['median_ms'] - before['median_ms']) / before['median_ms'] * 100 \
+            if before['median_ms'] else 0.0
+        print(f"  {name:<40} {before['median_ms']:>10.3f} -> {result['median_ms']:>10.3f}  ({change:+.1f}%)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time DatabaseOperations, Authentication and dashboard data paths")
+    parser.add_argument('--iterations', type=int, default=20)
+    parser.add_argument('--warmup', type=int, default=2)
+    parser.add_argument('--cold', action='store_true', help="clear the read caches before every iteration")
+    parser.add_argument('--prepared', action='store_true', help="use server-side prepared statements")
+    parser.add_argument('--only', nargs='*', help="run only cases whose name contains one of these")
+    parser.add_argument('--output', help="results file (default benchmarks/results/<timestamp>.json)")
+    parser.add_argument('--compare', help="earlier results file to compare medians against")
+    parser.add_argument('--sqlite', metavar='PATH', help="run against this SQLite file instead of MySQL")
+    args = parser.parse_args()
+
+    db_config = DatabaseConfig(prepared_statements=args.prepared, slow_query_threshold=None,
+                               backend='sqlite' if args.sqlite else 'mysql', sqlite_path=args.sqlite)
+    if not db_config.connect():
+        raise SystemExit(1)
+
+    suite = BenchmarkSuite(db_config, iterations=args.iterations, warmup=args.warmup, cold=args.cold)
+    print("Running benchmarks...")
+    try:
+        results = suite.run(args.only)
+    finally:
+        suite.cleanup()
+
+    report = {
+        'environment': suite.environment(),
+        'results': results,
+        'query_stats': db_config.query_stats.snapshot() if db_config.query_stats else None,
+    }
+    output = args.output or os.path.join(RESULTS_DIR, time.strftime('%Y%m%d-%H%M%S') + '.json')
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+    print(f"\nResults saved to {output}")
+
+    if args.compare:
+        compare(results, args.compare)
+    db_config.disconnect()
+
+
+if __name__ == '__main__':
+    main()
@@ -1,95 +1,59 @@
+import time
+
+# Taken before anything else is imported so startup timings cover the imports too
+STARTED = time.perf_counter()
+
+import os
 import sys
-import tkinter as tk
-from tkinter import messagebox
-from src.database.db_config import DatabaseConfig
-from src.gui.login_window import LoginWindow
-from src.gui.admin_dashboard import AdminDashboard
-from src.gui.faculty_dashboard import FacultyDashboard
-from src.gui.student_dashboard import StudentDashboard
+from src.gui.app import Application
+from src.utils.startup import StartupTimer
 
 def main():
+    timer = StartupTimer(STARTED)
     print("Starting Student Academic Record Management System...")
+    timer.mark('imports done')
     
     print("\n" + "="*60)
     print("  Student Academic Record Management System")
     print("="*60)
     print("\nInitializing database connection...")
     
-    db_config = DatabaseConfig(
-        host='localhost',
-        user='root',
-        password='password',
-        database='student_management'
-    )
+    # Set SQLITE_DB to a file path to run on the embedded SQLite engine instead of MySQL
+    sqlite_path = os.environ.get('SQLITE_DB')
     
-    print("Checking database connection...")
-    if not db_config.connect():
-        print("\nERROR: Could not connect to MySQL database!")
-        print("\nPlease ensure:")
-        print("  1. MySQL server is running")
-        print("  2. Database credentials are correct in src/database/db_config.py")
-        print("  3. Database 'student_management' exists or will be created\n")
-        
-        root = tk.Tk()
-        root.withdraw()
-        result = messagebox.askyesno(
-            "Database Connection Error",
-            "Could not connect to MySQL database!\n\n"
-            "Would you like to initialize the database?\n\n"
-            "Make sure MySQL is running and credentials are correct."
+    # 🔹 Runs on a background thread while the login window is already showing,
+    # so loading the database driver and connecting don't hold up the first frame
+    def open_database():
+        from src.database.db_config import DatabaseConfig
+        return DatabaseConfig(
+            host='localhost',
+            user='root',
+            password='password',
+            database='student_management',
+            prepared_statements=True,
+            backend='sqlite' if sqlite_path else 'mysql',
+            sqlite_path=sqlite_path
         )
-        root.destroy()
-        
-        if result:
-            print("\nAttempting to initialize database...")
-            if db_config.initialize_database():
-                print("Database initialized successfully!")
-                db_config.connect()
-            else:
-                print("Failed to initialize database. Please check MySQL connection.")
-                sys.exit(1)
-        else:
-            sys.exit(1)
     
-    print("Database connected successfully!\n")
+    print("Opening login window...")
+    app = Application(open_database, timer)
+    exit_code = app.run()
+    db_config = app.db_config
     
-    print("Default Login Credentials:")
-    print("-" * 40)
-    print("Admin:")
-    print("  Username: admin")
-    print("  Password: admin123")
-    print("\nNote: You can add faculty and students through admin panel")
-    print("-" * 40 + "\n")
+    stats_file = os.environ.get('QUERY_STATS_FILE')
+    if stats_file and db_config and db_config.query_stats:
+        db_config.query_stats.dump_json(stats_file)
+        print(f"Query statistics written to {stats_file}")
     
-    while True:
-        print("Opening login window...")
-        login_window = LoginWindow(db_config)
-        user_data = login_window.run()
-        
-        if not user_data:
-            print("\nLogin cancelled. Exiting application...")
-            break
-        
-        print(f"\nLogin successful!")
-        print(f"Role: {user_data['role']}")
-        print(f"Username: {user_data['username']}")
-        
-        if user_data['role'] == 'admin':
-            print("Opening Admin Dashboard...")
-            dashboard = AdminDashboard(db_config, user_data)
-            dashboard.run()
-        elif user_data['role'] == 'faculty':
-            print("Opening Faculty Dashboard...")
-            dashboard = FacultyDashboard(db_config, user_data)
-            dashboard.run()
-        elif user_data['role'] == 'student':
-            print("Opening Student Dashboard...")
-            dashboard = StudentDashboard(db_config, user_data)
-            dashboard.run()
-        
-        print("\nDashboard closed. Returning to login...")
+    startup_file = os.environ.get('STARTUP_STATS_FILE')
+    if startup_file:
+        timer.dump_json(startup_file)
+        print(f"Startup timings written to {startup_file}")
     
-    db_config.disconnect()
+    if db_config:
+        db_config.disconnect()
+    if exit_code:
+        sys.exit(exit_code)
     print("\nThank you for using Student Academic Record Management System!")
     print("Application terminated.\n")
 
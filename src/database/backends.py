@@ -0,0 +1,152 @@
+import re
+import sqlite3
+
+from src.database.dialects import MySQLDialect, SQLiteDialect
+
+# A backend knows how to open connections to one engine, which errors mean the link
+# is gone, and which dialect its SQL needs. DatabaseConfig talks to engines only
+# through this interface.
+
+# Client error codes meaning the socket is gone and a fresh connection may succeed:
+# 2006 server has gone away, 2013 lost connection during query,
+# 2055 lost connection at handshake/reading, 4031 disconnected for inactivity
+MYSQL_RECONNECT_ERRNOS = {2006, 2013, 2055, 4031}
+
+
+class MySQLBackend:
+    name = 'mysql'
+    label = 'MySQL'
+    supports_prepared = True
+    # An unbuffered result still being streamed blocks the connection until fully read,
+    # so a half-read stream is abandoned by dropping the connection
+    drop_on_unread = True
+    dialect = MySQLDialect()
+
+    def __init__(self, host, user, password, database):
+        # Imported here so SQLite-only installs never load the MySQL driver
+        import mysql.connector
+        from mysql.connector import errors
+
+        self._driver = mysql.connector
+        self.Error = errors.Error
+        self.disconnect_errors = (errors.OperationalError, errors.InterfaceError)
+        self.host = host
+        self.user = user
+        self.password = password
+        self.database = database
+
+    def connect(self):
+        return self._driver.connect(
+            host=self.host,
+            user=self.user,
+            password=self.password,
+            database=self.database
+        )
+
+    # 🔹 Create the database itself (needs a server connection without a default schema)
+    def create_database(self):
+        connection = self._driver.connect(host=self.host, user=self.user, password=self.password)
+        try:
+            cursor = connection.cursor()
+            cursor.execute(f"CREATE DATABASE IF NOT EXISTS `{self.database}`")
+            cursor.close()
+        finally:
+            connection.close()
+
+    def cursor(self, connection, dictionary=False, buffered=False, prepared=False):
+        if prepared:
+            return connection.cursor(prepared=True, dictionary=dictionary)
+        return connection.cursor(dictionary=dictionary, buffered=buffered)
+
+    def is_disconnect(self, error):
+        return isinstance(error, self.disconnect_errors) and \
+            getattr(error, 'errno', None) in MYSQL_RECONNECT_ERRNOS
+
+    # 🔹 Pool health check: raises if the server dropped this connection
+    def ping(self, connection):
+        connection.ping(reconnect=False)
+
+    # Statements wrapped around bulk loads on one connection
+    bulk_load_begin = ["SET SESSION unique_checks = 0, foreign_key_checks = 0"]
+    bulk_load_end = ["SET SESSION unique_checks = 1, foreign_key_checks = 1"]
+
+
+def _dict_row(cursor, row):
+    return {column[0]: value for column, value in zip(cursor.description, row)}
+
+
+_WORD = re.compile(r"\w+")
+
+
+# 🔹 MySQL's MATCH (columns) AGAINST (query IN BOOLEAN MODE) for SQLite, which has no FULLTEXT
+# indexes: +term must match, -term must not, term* matches words starting with term. Returns
+# the number of matched terms (0 = no match) so it can also order results by relevance.
+def _fulltext_match(query, *values):
+    words = [word for value in values if value for word in _WORD.findall(str(value).lower())]
+    score = 0
+    for term in (query or '').lower().split():
+        operator = term[0] if term[0] in '+-' else ''
+        prefix = term.endswith('*')
+        term = term.strip('+-*')
+        if not term:
+            continue
+        found = any(word.startswith(term) if prefix else word == term for word in words)
+        if operator == '-' and found or operator == '+' and not found:
+            return 0
+        if found and operator != '-':
+            score += 1
+    return score
+
+
+class SQLiteBackend:
+    name = 'sqlite'
+    label = 'SQLite'
+    # sqlite3 keeps its own per-connection statement cache (cached_statements)
+    supports_prepared = False
+    drop_on_unread = False
+    dialect = SQLiteDialect()
+    Error = sqlite3.Error
+    disconnect_errors = ()
+
+    def __init__(self, path=':memory:', statement_cache_size=64, busy_timeout=10):
+        self.path = path
+        self.statement_cache_size = statement_cache_size
+        self.busy_timeout = busy_timeout
+
+    @property
+    def in_memory(self):
+        # An in-memory database lives and dies with its single connection
+        return self.path == ':memory:'
+
+    def connect(self):
+        connection = sqlite3.connect(
+            self.path,
+            timeout=self.busy_timeout,
+            check_same_thread=False,     # the pool hands a connection to one thread at a time
+            cached_statements=self.statement_cache_size
+        )
+        connection.execute("PRAGMA foreign_keys = ON")
+        connection.create_function('fulltext_match', -1, _fulltext_match, deterministic=True)
+        if not self.in_memory:
+            connection.execute("PRAGMA journal_mode = WAL")
+            connection.execute("PRAGMA synchronous = NORMAL")
+        return connection
+
+    def create_database(self):
+        # sqlite3.connect creates the file on first use
+        pass
+
+    def cursor(self, connection, dictionary=False, buffered=False, prepared=False):
+        cursor = connection.cursor()
+        if dictionary:
+            cursor.row_factory = _dict_row
+        return cursor
+
+    def is_disconnect(self, error):
+        return False
+
+    # The database file can't go away under an open connection
+    ping = None
+
+    bulk_load_begin = ["PRAGMA foreign_keys = OFF"]
+    bulk_load_end = ["PRAGMA foreign_keys = ON"]
@@ -0,0 +1,78 @@
+import threading
+import time
+from collections import OrderedDict
+
+
+# Size-bounded LRU cache whose entries also expire `ttl` seconds after being stored
+class TTLCache:
+    def __init__(self, maxsize=128, ttl=300):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries = OrderedDict()   # key -> (expires_at, value)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    # 🔹 Cached value for key, or call loader() and remember its result
+    def get_or_load(self, key, loader, cache_empty=True):
+        found, value = self.get(key)
+        if found:
+            return value
+        value = loader()
+        if value or cache_empty:
+            self.set(key, value)
+        return value
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at > time.monotonic():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return True, value
+                del self._entries[key]
+            self.misses += 1
+            return False, None
+
+    def set(self, key, value):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    # 🔹 Drop one key, or every tuple key whose first element is `key` when prefix=True
+    def invalidate(self, key, prefix=False):
+        with self._lock:
+            if not prefix:
+                self._entries.pop(key, None)
+                return
+            for cached_key in [k for k in self._entries if isinstance(k, tuple) and k[0] == key]:
+                del self._entries[cached_key]
+
+    # 🔹 Drop every entry for which predicate(key, value) is true
+    def invalidate_where(self, predicate):
+        with self._lock:
+            for cached_key in [k for k, (_, v) in self._entries.items() if predicate(k, v)]:
+                del self._entries[cached_key]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'size': len(self._entries),
+                'maxsize': self.maxsize,
+                'ttl': self.ttl,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_rate': round(self.hits / lookups, 3) if lookups else 0.0,
+            }
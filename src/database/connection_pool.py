@@ -0,0 +1,168 @@
+import threading
+import time
+from contextlib import contextmanager
+
+from src.database.statement_cache import StatementCache
+
+
+class PoolError(Exception):
+    pass
+
+
+# connect() opens a new DB-API connection; an exception in disconnect_errors raised
+# while a connection is checked out means that connection is dead and gets dropped.
+# ping(connection) raises if a connection is dead; connections idle for more than
+# ping_after seconds are checked with it before being handed out again.
+class ConnectionPool:
+    def __init__(self, connect, size=5, timeout=10, recycle=3600, statement_cache_size=64,
+                 disconnect_errors=(), ping=None, ping_after=30):
+        self.connect = connect
+        self.size = size
+        self.timeout = timeout
+        self.recycle = recycle
+        self.statement_cache_size = statement_cache_size
+        self.disconnect_errors = tuple(disconnect_errors)
+        self.ping = ping
+        self.ping_after = ping_after
+
+        self._idle = []          # (connection, created_at, idle_since) ready for checkout
+        self._created = {}       # id(connection) -> created_at for every open connection
+        self._statements = {}    # id(connection) -> StatementCache
+        self._lock = threading.Condition()
+        self._closed = False
+
+    def _discard(self, connection):
+        self._created.pop(id(connection), None)
+        cache = self._statements.pop(id(connection), None)
+        if cache is not None:
+            cache.close()
+        try:
+            connection.close()
+        except Exception:
+            pass
+
+    def _is_fresh(self, created_at):
+        return not self.recycle or time.monotonic() - created_at <= self.recycle
+
+    # Recently used connections are trusted without a round trip; a dead link that slips
+    # through surfaces on first use (reads are retried, see DatabaseConfig._with_connection)
+    def _is_alive(self, connection, idle_since):
+        if self.ping is None or time.monotonic() - idle_since <= self.ping_after:
+            return True
+        try:
+            self.ping(connection)
+            return True
+        except Exception:
+            return False
+
+    # 🔹 Borrow a connection, waiting up to `timeout` seconds for one to free up
+    def get_connection(self):
+        deadline = time.monotonic() + self.timeout
+        placeholder = object()
+        while True:
+            connection, idle_since = self._checkout(deadline, placeholder)
+            if connection is None:
+                break
+            # Pinged outside the lock so a slow server doesn't hold up other threads
+            if self._is_alive(connection, idle_since):
+                return connection
+            self.release(connection, discard=True)
+
+        try:
+            connection = self.connect()
+        except Exception:
+            with self._lock:
+                self._created.pop(id(placeholder), None)
+                self._lock.notify()
+            raise
+
+        with self._lock:
+            self._created.pop(id(placeholder), None)
+            self._created[id(connection)] = time.monotonic()
+        return connection
+
+    # An idle connection as (connection, idle_since), or (None, None) once a slot for a
+    # new connection is reserved under id(placeholder)
+    def _checkout(self, deadline, placeholder):
+        with self._lock:
+            while True:
+                if self._closed:
+                    raise PoolError("Connection pool is closed")
+
+                while self._idle:
+                    connection, created_at, idle_since = self._idle.pop()
+                    if self._is_fresh(created_at):
+                        return connection, idle_since
+                    self._discard(connection)
+
+                if len(self._created) < self.size:
+                    # Reserve the slot before releasing the lock to connect
+                    self._created[id(placeholder)] = None
+                    return None, None
+
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise PoolError(f"No free connection within {self.timeout}s (pool size {self.size})")
+                self._lock.wait(remaining)
+
+    # 🔹 Hand a connection back to the pool
+    def release(self, connection, discard=False):
+        with self._lock:
+            created_at = self._created.get(id(connection))
+            if created_at is None:
+                return
+            if discard or self._closed:
+                self._discard(connection)
+            else:
+                try:
+                    # Drop anything the caller left uncommitted
+                    if connection.in_transaction:
+                        connection.rollback()
+                    self._idle.append((connection, created_at, time.monotonic()))
+                except Exception:
+                    self._discard(connection)
+            self._lock.notify()
+
+    @contextmanager
+    def connection(self):
+        connection = self.get_connection()
+        try:
+            yield connection
+        except Exception as e:
+            self.release(connection, discard=isinstance(e, self.disconnect_errors))
+            raise
+        else:
+            self.release(connection)
+
+    # 🔹 Prepared-statement cache belonging to a checked-out connection
+    def statement_cache(self, connection, open_cursor):
+        cache = self._statements.get(id(connection))
+        if cache is None:
+            cache = StatementCache(open_cursor, self.statement_cache_size)
+            with self._lock:
+                self._statements[id(connection)] = cache
+        return cache
+
+    # 🔹 Drop every idle connection, e.g. after the server restarted under us
+    def invalidate_idle(self):
+        with self._lock:
+            while self._idle:
+                self._discard(self._idle.pop()[0])
+            self._lock.notify_all()
+
+    # 🔹 Close every idle connection and refuse new checkouts
+    def close_all(self):
+        with self._lock:
+            self._closed = True
+        self.invalidate_idle()
+
+    def stats(self):
+        with self._lock:
+            return {
+                'size': self.size,
+                'open': len(self._created),
+                'idle': len(self._idle),
+                'in_use': len(self._created) - len(self._idle),
+                'prepared_hits': sum(c.hits for c in self._statements.values()),
+                'prepared_misses': sum(c.misses for c in self._statements.values()),
+            }
@@ -1,5 +1,14 @@
-import mysql.connector
-from mysql.connector import Error
+import threading
+import time
+from contextlib import contextmanager
+
+from src.database.backends import MySQLBackend, SQLiteBackend
+from src.database.cache import TTLCache
+from src.database.connection_pool import ConnectionPool, PoolError
+from src.database.group_commit import GroupCommitter
+from src.database.migrator import MigrationRunner
+from src.database.query_stats import QueryStats
+from src.database.records import Record, record_reader, record_type
 
 class DatabaseConfig:
     def __init__(
@@ -7,122 +16,430 @@ class DatabaseConfig:
         host='localhost',
         user='root',
         password='password',  # 🔹 change this to your actual MySQL Workbench password
-        database='student_management'         # 🔹 the database you created in Workbench
+        database='student_management',        # 🔹 the database you created in Workbench
+        pool_size=5,          # 🔹 max simultaneous connections
+        pool_timeout=10,      # 🔹 seconds to wait for a free connection
+        pool_recycle=3600,    # 🔹 reopen connections older than this (seconds)
+        pool_ping_after=30,   # 🔹 check connections idle longer than this before reuse (seconds)
+        prepared_statements=False,   # 🔹 reuse server-side prepared statements per connection
+        statement_cache_size=64,     # 🔹 prepared statements kept per connection (LRU)
+        reference_cache_ttl=300,     # 🔹 seconds to keep courses/subjects/faculty lists
+        reference_cache_size=128,    # 🔹 max cached reference lists
+        student_cache_ttl=3600,      # 🔹 seconds to keep roll-number lookups
+        student_cache_size=1024,     # 🔹 max cached roll numbers
+        query_stats=True,            # 🔹 per-query timing and latency histograms
+        slow_query_threshold=0.5,    # 🔹 log queries slower than this (seconds)
+        slow_query_log=None,         # 🔹 file to append slow queries to (None = print)
+        backend='mysql',             # 🔹 'mysql' (server) or 'sqlite' (embedded, no server needed)
+        sqlite_path=None,            # 🔹 SQLite database file (None = in-memory)
+        group_commit_ms=0,           # 🔹 batch group=True writes and commit them together every few ms (0 = off)
+        row_type='dict'              # 🔹 default fetch_all/fetch_one rows: 'dict', 'tuple' or 'record'
     ):
         self.host = host
         self.user = user
         self.password = password
         self.database = database
-        self.connection = None
+        self.pool_size = pool_size
+        self.pool_timeout = pool_timeout
+        self.pool_recycle = pool_recycle
+        self.pool_ping_after = pool_ping_after
+        self.statement_cache_size = statement_cache_size
+        self.row_type = row_type
+        self.pool = None
+
+        if backend == 'sqlite':
+            self.backend = SQLiteBackend(sqlite_path or ':memory:', statement_cache_size)
+            if self.backend.in_memory:
+                # Every new connection would see its own empty in-memory database
+                self.pool_size = 1
+                self.pool_recycle = 0
+        elif backend == 'mysql':
+            self.backend = MySQLBackend(host, user, password, database)
+        else:
+            raise ValueError(f"Unknown database backend: {backend}")
+        self.prepared_statements = prepared_statements and self.backend.supports_prepared
+        self.Error = (self.backend.Error, PoolError)
+
+        # Shared by every DatabaseOperations built on this config
+        self.reference_cache = TTLCache(maxsize=reference_cache_size, ttl=reference_cache_ttl)
+        self.student_cache = TTLCache(maxsize=student_cache_size, ttl=student_cache_ttl)
+        self.query_stats = QueryStats(slow_query_threshold, slow_query_log) if query_stats else None
+
+        # The connection of the transaction() block open on each thread, if any
+        self._local = threading.local()
+        # The committer thread needs a connection of its own next to the waiting callers'
+        if group_commit_ms and self.pool_size < 2:
+            raise ValueError("Group commit needs a pool of at least 2 connections (not an in-memory database)")
+        self.group_commit = GroupCommitter(self._write_batch, group_commit_ms / 1000) if group_commit_ms else None
 
-    # 🔹 Connect to the MySQL database
+    # 🔹 Connect to the database (opens the connection pool)
     def connect(self):
         try:
-            self.connection = mysql.connector.connect(
-                host=self.host,
-                user=self.user,
-                password=self.password,
-                database=self.database
+            pool = ConnectionPool(
+                self.backend.connect,
+                size=self.pool_size,
+                timeout=self.pool_timeout,
+                recycle=self.pool_recycle,
+                statement_cache_size=self.statement_cache_size,
+                disconnect_errors=self.backend.disconnect_errors,
+                ping=self.backend.ping,
+                ping_after=self.pool_ping_after
             )
-            if self.connection.is_connected():
-                print("Connected to MySQL successfully!")
-                return self.connection
-        except Error as e:
-            print(f" Error connecting to MySQL: {e}")
+            # Open one connection up front so bad credentials fail here
+            with pool.connection():
+                pass
+            # Reconnecting replaces the pool; connections of the old one are closed (busy ones on release)
+            if self.pool:
+                self.pool.close_all()
+            self.pool = pool
+            print(f"Connected to {self.backend.label} successfully!")
+            return self.pool
+        except self.Error as e:
+            print(f" Error connecting to {self.backend.label}: {e}")
             return None
 
     # 🔹 Disconnect from database
     def disconnect(self):
-        if self.connection and self.connection.is_connected():
-            self.connection.close()
-            print("MySQL connection closed.")
-
-    # 🔹 Execute insert/update/delete query
-    def execute_query(self, query, params=None):
-        if not self.connection or not self.connection.is_connected():
-            print("No active MySQL connection. Run connect() first.")
+        if self.group_commit:
+            self.group_commit.close()
+        if self.pool:
+            self.pool.close_all()
+            self.pool = None
+            print(f"{self.backend.label} connection closed.")
+
+    # 🔹 Run work(connection) on a pooled connection. If the link dropped, idle connections
+    # are dropped too, and with retry=True work runs once more on a fresh connection.
+    # Only pass retry for reads: a write may have been applied before the link dropped.
+    def _with_connection(self, work, retry=False):
+        connection = self._transaction_connection()
+        if connection is not None:
+            # Part of an open transaction: no retry, a lost link fails the whole block
+            return work(connection)
+
+        if not self.pool and not self.connect():
+            raise PoolError(f"No active {self.backend.label} connection")
+
+        try:
+            with self.pool.connection() as connection:
+                return work(connection)
+        except self.backend.Error as e:
+            if not self.backend.is_disconnect(e):
+                raise
+            self.pool.invalidate_idle()
+            if not retry:
+                raise
+            print(f" Lost {self.backend.label} connection ({e}), reconnecting...")
+
+        with self.pool.connection() as connection:
+            return work(connection)
+
+    def _transaction_connection(self):
+        return getattr(self._local, 'connection', None)
+
+    # 🔹 Commit a single statement, unless it belongs to a transaction() block,
+    # which commits once when the block exits
+    def _commit(self, connection):
+        if connection is not self._transaction_connection():
+            connection.commit()
+
+    # 🔹 Run the statements of the with-block on one connection and commit them together;
+    # any exception rolls everything back and is re-raised. Inside the block the execute_*
+    # and fetch_* methods raise database errors instead of printing them, so a failed step
+    # can't be committed by mistake. A nested transaction() joins the outer one.
+    @contextmanager
+    def transaction(self):
+        if self._transaction_connection() is not None:
+            yield
+            return
+
+        if not self.pool and not self.connect():
+            raise PoolError(f"No active {self.backend.label} connection")
+
+        with self.pool.connection() as connection:
+            self._local.connection = connection
+            try:
+                yield
+                connection.commit()
+            except Exception:
+                try:
+                    connection.rollback()
+                except self.backend.Error:
+                    pass  # the link is gone and the server discards the transaction itself
+                raise
+            finally:
+                self._local.connection = None
+
+    # 🔹 Group commit: run (query, params, result) statements on one connection with one commit
+    def _write_batch(self, statements):
+        def work(connection):
+            results = []
+            try:
+                for query, params, result in statements:
+                    start = time.perf_counter()
+                    with self._cursor(connection, query) as cursor:
+                        self._execute(cursor, query, params)
+                        results.append(cursor.lastrowid if result == 'lastrowid' else cursor.rowcount)
+                        rows = cursor.rowcount
+                    if self.query_stats:
+                        self.query_stats.record(query, time.perf_counter() - start, rows, False)
+                connection.commit()
+                return results
+            except Exception:
+                connection.rollback()
+                raise
+
+        return self._with_connection(work)
+
+    # 🔹 Cursor for one statement: a cached prepared cursor in prepared mode,
+    # otherwise a plain cursor that is closed afterwards
+    @contextmanager
+    def _cursor(self, connection, query, dictionary=False, buffered=False):
+        if not self.prepared_statements:
+            cursor = self.backend.cursor(connection, dictionary=dictionary, buffered=buffered)
+            try:
+                yield cursor
+            finally:
+                cursor.close()
+            return
+
+        cache = self.pool.statement_cache(
+            connection, lambda dictionary: self.backend.cursor(connection, dictionary=dictionary, prepared=True))
+        cursor = cache.get(query, dictionary)
+        try:
+            yield cursor
+        except Exception:
+            cache.evict(query, dictionary)
+            raise
+
+    # 🔹 Run work(connection) -> (result, row_count) and record its timing under the SQL fingerprint
+    # (retry as in _with_connection)
+    def _run(self, query, work, retry=False):
+        start = time.perf_counter()
+        rows, failed = 0, True
+        try:
+            result, rows = self._with_connection(work, retry)
+            failed = False
+            return result
+        finally:
+            if self.query_stats:
+                self.query_stats.record(query, time.perf_counter() - start, rows, failed)
+
+    # 🔹 Row factory for a result with these column names, or None to keep the driver's tuples.
+    # row_type: 'dict', 'tuple', 'record' (a __slots__ class built from the columns) or a
+    # Record subclass such as records.Student
+    @staticmethod
+    def _row_factory(columns, row_type):
+        if row_type == 'dict':
+            return lambda row: dict(zip(columns, row))
+        if row_type == 'record':
+            return record_type(columns)._make
+        if row_type == 'tuple':
             return None
+        if isinstance(row_type, type) and issubclass(row_type, Record):
+            return record_reader(row_type, columns)
+        raise ValueError(f"Unknown row_type: {row_type}")
+
+    def _execute(self, cursor, query, params):
+        query = self.backend.dialect.translate(query)
+        if params:
+            cursor.execute(query, params)
+        else:
+            cursor.execute(query)
+
+    # 🔹 Execute insert/update/delete query. group=True lets a small, independent write share
+    # a commit with others (see group_commit_ms); it is committed on its own otherwise.
+    def execute_query(self, query, params=None, group=False):
+        def work(connection):
+            with self._cursor(connection, query) as cursor:
+                self._execute(cursor, query, params)
+                self._commit(connection)
+                return cursor.lastrowid, cursor.rowcount
 
-        cursor = None
         try:
-            cursor = self.connection.cursor()
-            if params:
-                cursor.execute(query, params)
-            else:
-                cursor.execute(query)
-            self.connection.commit()
-            return cursor.lastrowid
-        except Error as e:
+            if group and self.group_commit and self._transaction_connection() is None:
+                return self.group_commit.submit(query, params, 'lastrowid')
+            return self._run(query, work)
+        except self.Error as e:
+            if self._transaction_connection() is not None:
+                raise
             print(f" Error executing query: {e}")
             return None
-        finally:
-            if cursor:
+
+    # 🔹 Execute update/delete query and return the number of rows it changed (group as in execute_query)
+    def execute_update(self, query, params=None, group=False):
+        def work(connection):
+            with self._cursor(connection, query) as cursor:
+                self._execute(cursor, query, params)
+                self._commit(connection)
+                return cursor.rowcount, cursor.rowcount
+
+        try:
+            if group and self.group_commit and self._transaction_connection() is None:
+                return self.group_commit.submit(query, params, 'rowcount')
+            return self._run(query, work)
+        except self.Error as e:
+            if self._transaction_connection() is not None:
+                raise
+            print(f" Error executing query: {e}")
+            return None
+
+    # 🔹 Execute one statement for many parameter rows in a single transaction
+    # (the driver folds INSERT ... VALUES into multi-row batches)
+    def execute_many(self, query, params_list):
+        params_list = list(params_list)
+        if not params_list:
+            return 0
+
+        def work(connection):
+            cursor = self.backend.cursor(connection)
+            try:
+                cursor.executemany(self.backend.dialect.translate(query), params_list)
+                self._commit(connection)
+                return cursor.rowcount, cursor.rowcount
+            except Exception:
+                if connection is not self._transaction_connection():
+                    connection.rollback()
+                raise
+            finally:
                 cursor.close()
 
-    # 🔹 Fetch multiple rows
-    def fetch_all(self, query, params=None):
-        if not self.connection or not self.connection.is_connected():
-            print("No active MySQL connection. Run connect() first.")
-            return []
+        try:
+            return self._run(query, work)
+        except self.Error as e:
+            if self._transaction_connection() is not None:
+                raise
+            print(f" Error executing batch: {e}")
+            return None
+
+    # 🔹 Fetch multiple rows (row_type as in iter_rows; None = the config's row_type)
+    def fetch_all(self, query, params=None, row_type=None):
+        row_type = row_type or self.row_type
         
-        cursor = None
+        def work(connection):
+            dictionary = row_type == 'dict'
+            with self._cursor(connection, query, dictionary=dictionary) as cursor:
+                self._execute(cursor, query, params)
+                rows = cursor.fetchall()
+                make_row = None if dictionary else self._row_factory(
+                    tuple(column[0] for column in cursor.description), row_type)
+                if make_row:
+                    rows = list(map(make_row, rows))
+                return rows, len(rows)
+
         try:
-            cursor = self.connection.cursor(dictionary=True)
-            if params:
-                cursor.execute(query, params)
-            else:
-                cursor.execute(query)
-            return cursor.fetchall()
-        except Error as e:
+            return self._run(query, work, retry=True)
+        except self.Error as e:
+            if self._transaction_connection() is not None:
+                raise
             print(f"Error fetching data: {e}")
             return []
-        finally:
-            if cursor:
-                cursor.close()
 
     # 🔹 Fetch single row
-    def fetch_one(self, query, params=None):
-        if not self.connection or not self.connection.is_connected():
-            print("No active MySQL connection. Run connect() first.")
-            return None
+    def fetch_one(self, query, params=None, row_type=None):
+        row_type = row_type or self.row_type
         
-        cursor = None
+        def work(connection):
+            dictionary = row_type == 'dict'
+            with self._cursor(connection, query, dictionary=dictionary, buffered=True) as cursor:
+                self._execute(cursor, query, params)
+                # Drain the result so a reused prepared cursor starts clean
+                rows = cursor.fetchall()
+                if not rows:
+                    return None, 0
+                make_row = None if dictionary else self._row_factory(
+                    tuple(column[0] for column in cursor.description), row_type)
+                return (make_row(rows[0]) if make_row else rows[0]), len(rows)
+
         try:
-            cursor = self.connection.cursor(dictionary=True)
-            if params:
-                cursor.execute(query, params)
-            else:
-                cursor.execute(query)
-            return cursor.fetchone()
-        except Error as e:
+            return self._run(query, work, retry=True)
+        except self.Error as e:
+            if self._transaction_connection() is not None:
+                raise
             print(f"Error fetching data: {e}")
             return None
-        finally:
-            if cursor:
-                cursor.close()
 
-    # 🔹 Initialize database structure from SQL file
-    def initialize_database(self):
+    # 🔹 Stream a result set batch_size rows at a time from an unbuffered cursor instead of
+    # materializing it. row_type: 'dict', 'tuple' (as the driver returns them), 'record'
+    # (__slots__ objects with one attribute per column) or a Record subclass. The connection stays checked out
+    # until the generator is exhausted or closed, and errors are raised, not swallowed,
+    # so a failed export is never mistaken for a short one.
+    def iter_rows(self, query, params=None, batch_size=1000, row_type='dict'):
+        if not self.pool and not self.connect():
+            raise PoolError(f"No active {self.backend.label} connection")
+
+        connection = cursor = None
+        finished = False
+        failed = True
+        rows = 0
+        elapsed = 0.0
         try:
-            init_connection = mysql.connector.connect(
-                host=self.host,
-                user=self.user,
-                password=self.password
-            )
-            cursor = init_connection.cursor()
+            start = time.perf_counter()
+            connection, cursor = self._start_stream(query, params)
+            make_row = self._row_factory(tuple(column[0] for column in cursor.description), row_type)
 
-            with open('src/database/db_init.sql', 'r') as f:
-                sql_script = f.read()
+            while True:
+                batch = cursor.fetchmany(batch_size)
+                elapsed += time.perf_counter() - start
+                if not batch:
+                    break
+                rows += len(batch)
+                if make_row is None:
+                    yield from batch
+                else:
+                    yield from map(make_row, batch)
+                start = time.perf_counter()
+            finished = True
+            failed = False
+        except GeneratorExit:
+            failed = False
+            raise
+        finally:
+            if connection is not None:
+                drop = not finished and self.backend.drop_on_unread
+                if not drop:
+                    cursor.close()
+                self.pool.release(connection, discard=drop)
+            if self.query_stats:
+                self.query_stats.record(query, elapsed, rows, failed)
 
-            for statement in sql_script.split(';'):
-                if statement.strip():
-                    cursor.execute(statement)
+    # 🔹 Check out a connection and run query on a new cursor -> (connection, cursor).
+    # Nothing has been read yet, so a dropped link is retried once on a fresh connection.
+    def _start_stream(self, query, params):
+        for attempt in (1, 2):
+            connection = self.pool.get_connection()
+            cursor = None
+            try:
+                cursor = self.backend.cursor(connection)
+                self._execute(cursor, query, params)
+                return connection, cursor
+            except Exception as e:
+                retry = attempt == 1 and isinstance(e, self.backend.Error) and self.backend.is_disconnect(e)
+                drop = retry or self.backend.drop_on_unread
+                if cursor is not None and not drop:
+                    cursor.close()
+                self.pool.release(connection, discard=drop)
+                if not retry:
+                    raise
+                print(f" Lost {self.backend.label} connection ({e}), reconnecting...")
+                self.pool.invalidate_idle()
 
-            init_connection.commit()
-            cursor.close()
-            init_connection.close()
+    # 🔹 Create the database if needed and apply all pending schema migrations
+    def initialize_database(self):
+        try:
+            self.backend.create_database()
+            if self.migrate() is None:
+                return False
             print(" Database initialized successfully!")
             return True
-        except Error as e:
+        except self.Error as e:
             print(f" Error initializing database: {e}")
             return False
+
+    # 🔹 Bring an existing database up to the latest schema version
+    def migrate(self):
+        try:
+            return self._with_connection(
+                lambda connection: MigrationRunner(connection, dialect=self.backend.dialect).apply_pending())
+        except self.Error as e:
+            print(f" Error applying migrations: {e}")
+            return None
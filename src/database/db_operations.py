@@ -1,8 +1,26 @@
+import re
+from bisect import bisect_right
+from datetime import date, timedelta
 from src.database.db_config import DatabaseConfig
+from src.database.records import AttendanceRecord, Course, MarkRecord, Student, Subject
+
+# Lower percentage bound of each grade above the lowest, ascending. Used only when no
+# grading scheme is active; the configurable bands live in grading_schemes/grade_bands.
+GRADE_THRESHOLDS = [40, 50, 60, 70, 80, 90]
+GRADE_LETTERS = ['F', 'D', 'C', 'B', 'B+', 'A', 'A+']
+
+# Words of a search_students query that are matched against names and emails
+SEARCH_WORD = re.compile(r"\w+")
+
+# 🔹 Grade for marks_obtained out of max_marks on a scale from get_grading_scale()
+def grade(thresholds, letters, marks_obtained, max_marks):
+    return letters[bisect_right(thresholds, marks_obtained * 100 / max_marks)]
 
 class DatabaseOperations:
     def __init__(self, db_config):
         self.db = db_config
+        self.reference_cache = db_config.reference_cache
+        self.student_cache = db_config.student_cache
     
     def add_student(self, user_id, roll_number, name, email, phone, dob, gender, address, course_id, semester):
         query = """INSERT INTO students (user_id, roll_number, name, email, phone, date_of_birth, 
@@ -17,54 +35,154 @@ class DatabaseOperations:
                    LEFT JOIN courses c ON s.course_id = c.course_id 
                    LEFT JOIN users u ON s.user_id = u.user_id 
                    WHERE s.status = 'Active'"""
-        return self.db.fetch_all(query)
+        return self.db.fetch_all(query, row_type=Student)
+    
+    def get_students_page(self, after_id=None, limit=100, filters=None, before_id=None):
+        # Keyset pagination: the next `limit` students with student_id > after_id, or with
+        # before_id the `limit` students just before it (still in student_id order).
+        # filters may set 'status' (default 'Active'), 'course_id' and 'semester'.
+        filters = filters or {}
+        conditions = ["s.status = %s", "s.student_id > %s"]
+        params = [filters.get('status', 'Active'), after_id or 0]
+        if filters.get('course_id'):
+            conditions.append("s.course_id = %s")
+            params.append(filters['course_id'])
+        if filters.get('semester'):
+            conditions.append("s.semester = %s")
+            params.append(filters['semester'])
+        if before_id is not None:
+            conditions.append("s.student_id < %s")
+            params.append(before_id)
+        params.append(limit)
+        
+        query = f"""SELECT s.student_id, s.roll_number, s.name, s.email, s.phone, 
+                   s.semester, s.status, c.course_name 
+                   FROM students s 
+                   LEFT JOIN courses c ON s.course_id = c.course_id 
+                   WHERE {' AND '.join(conditions)} 
+                   ORDER BY s.student_id {'DESC' if before_id is not None else ''} 
+                   LIMIT %s"""
+        students = self.db.fetch_all(query, tuple(params), row_type=Student)
+        return students[::-1] if before_id is not None else students
     
     def get_student_by_id(self, student_id):
         query = "SELECT * FROM students WHERE student_id = %s"
-        return self.db.fetch_one(query, (student_id,))
+        return self.db.fetch_one(query, (student_id,), row_type=Student)
     
     def get_student_by_roll(self, roll_number):
+        # Faculty screens look the same roll numbers up all day; misses aren't cached
         query = "SELECT * FROM students WHERE roll_number = %s"
-        return self.db.fetch_one(query, (roll_number,))
+        return self.student_cache.get_or_load(('roll', roll_number), 
+                                              lambda: self.db.fetch_one(query, (roll_number,), row_type=Student), 
+                                              cache_empty=False)
+    
+    def search_students(self, query, limit=20):
+        # Type-ahead lookup among active students. Roll numbers starting with query come first
+        # (range scan on the unique roll_number index), then students whose name or email has
+        # a word starting with every word of query (FULLTEXT index), best match first.
+        query = query.strip()
+        if not query:
+            return []
+        
+        columns = """s.student_id, s.roll_number, s.name, s.email, s.phone,
+                   s.semester, s.status, c.course_name"""
+        prefix = query.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_') + '%'
+        students = self.db.fetch_all(f"""SELECT {columns}
+                   FROM students s
+                   LEFT JOIN courses c ON s.course_id = c.course_id
+                   WHERE s.roll_number LIKE %s AND s.status = 'Active'
+                   ORDER BY s.roll_number
+                   LIMIT %s""", (prefix, limit), row_type=Student)
+        
+        # Only word characters reach the boolean-mode query, so input can't inject operators
+        words = SEARCH_WORD.findall(query)
+        if len(students) >= limit or not words:
+            return students
+        
+        terms = ' '.join(f'+{word}*' for word in words)
+        found = {student.student_id for student in students}
+        matches = self.db.fetch_all(f"""SELECT {columns}
+                   FROM students s
+                   LEFT JOIN courses c ON s.course_id = c.course_id
+                   WHERE MATCH (s.name, s.email) AGAINST (%s IN BOOLEAN MODE) AND s.status = 'Active'
+                   ORDER BY MATCH (s.name, s.email) AGAINST (%s IN BOOLEAN MODE) DESC, s.name
+                   LIMIT %s""", (terms, terms, limit + len(found)), row_type=Student)
+        students += [student for student in matches if student.student_id not in found]
+        return students[:limit]
+    
+    def invalidate_student(self, student_id):
+        self.student_cache.invalidate_where(lambda key, student: student['student_id'] == student_id)
     
     def update_student(self, student_id, name, email, phone, address, semester):
         query = """UPDATE students SET name=%s, email=%s, phone=%s, address=%s, semester=%s 
                    WHERE student_id=%s"""
         params = (name, email, phone, address, semester, student_id)
-        return self.db.execute_query(query, params)
+        result = self.db.execute_query(query, params)
+        self.invalidate_student(student_id)
+        return result
     
     def delete_student(self, student_id):
         query = "UPDATE students SET status='Inactive' WHERE student_id=%s"
-        return self.db.execute_query(query, (student_id,))
+        result = self.db.execute_query(query, (student_id,))
+        self.invalidate_student(student_id)
+        return result
     
     def add_faculty(self, user_id, faculty_code, name, email, phone, department, designation):
         query = """INSERT INTO faculty (user_id, faculty_code, name, email, phone, department, designation) 
                    VALUES (%s, %s, %s, %s, %s, %s, %s)"""
         params = (user_id, faculty_code, name, email, phone, department, designation)
-        return self.db.execute_query(query, params)
+        result = self.db.execute_query(query, params)
+        self.reference_cache.invalidate('faculty', prefix=True)
+        return result
     
+    # Reference lists below are read through self.reference_cache; don't mutate the returned rows.
+    # Empty results are not cached so a failed query isn't remembered for the whole TTL.
     def get_all_faculty(self):
         query = "SELECT * FROM faculty"
-        return self.db.fetch_all(query)
+        return self.reference_cache.get_or_load(('faculty',), lambda: self.db.fetch_all(query), 
+                                                cache_empty=False)
     
     def get_all_courses(self):
         query = "SELECT * FROM courses"
-        return self.db.fetch_all(query)
+        return self.reference_cache.get_or_load(('courses',), 
+                                                lambda: self.db.fetch_all(query, row_type=Course), 
+                                                cache_empty=False)
     
     def get_all_subjects(self, course_id=None):
         if course_id:
             query = "SELECT * FROM subjects WHERE course_id = %s"
-            return self.db.fetch_all(query, (course_id,))
+            loader = lambda: self.db.fetch_all(query, (course_id,), row_type=Subject)
         else:
             query = "SELECT * FROM subjects"
-            return self.db.fetch_all(query)
+            loader = lambda: self.db.fetch_all(query, row_type=Subject)
+        return self.reference_cache.get_or_load(('subjects', course_id), loader, cache_empty=False)
     
     def mark_attendance(self, student_id, subject_id, date, status, marked_by):
         query = """INSERT INTO attendance (student_id, subject_id, attendance_date, status, marked_by) 
                    VALUES (%s, %s, %s, %s, %s) 
                    ON DUPLICATE KEY UPDATE status=%s, marked_by=%s"""
         params = (student_id, subject_id, date, status, marked_by, status, marked_by)
-        return self.db.execute_query(query, params)
+        # Faculty mark students one by one from several screens: let these share commits
+        return self.db.execute_query(query, params, group=True)
+    
+    def mark_attendance_bulk(self, subject_id, date, statuses, marked_by):
+        # statuses: iterable of (student_id, status) for the whole class
+        query = """INSERT INTO attendance (student_id, subject_id, attendance_date, status, marked_by) 
+                   VALUES (%s, %s, %s, %s, %s) 
+                   ON DUPLICATE KEY UPDATE status=VALUES(status), marked_by=VALUES(marked_by)"""
+        params = [(student_id, subject_id, date, status, marked_by) for student_id, status in statuses]
+        return self.db.execute_many(query, params)
+    
+    def get_class_roster(self, subject_id, date=None):
+        # Every active student of the subject's course/semester, with any status already marked on `date`
+        query = """SELECT st.student_id, st.roll_number, st.name, a.status 
+                   FROM subjects sub 
+                   JOIN students st ON st.course_id = sub.course_id AND st.semester = sub.semester 
+                   LEFT JOIN attendance a ON a.student_id = st.student_id 
+                        AND a.subject_id = sub.subject_id AND a.attendance_date = %s 
+                   WHERE sub.subject_id = %s AND st.status = 'Active' 
+                   ORDER BY st.roll_number"""
+        return self.db.fetch_all(query, (date, subject_id))
     
     def get_attendance(self, student_id, subject_id=None):
         if subject_id:
@@ -72,69 +190,299 @@ class DatabaseOperations:
                        JOIN subjects s ON a.subject_id = s.subject_id 
                        WHERE a.student_id = %s AND a.subject_id = %s 
                        ORDER BY a.attendance_date DESC"""
-            return self.db.fetch_all(query, (student_id, subject_id))
+            return self.db.fetch_all(query, (student_id, subject_id), row_type=AttendanceRecord)
         else:
             query = """SELECT a.*, s.subject_name FROM attendance a 
                        JOIN subjects s ON a.subject_id = s.subject_id 
                        WHERE a.student_id = %s 
                        ORDER BY a.attendance_date DESC"""
-            return self.db.fetch_all(query, (student_id,))
+            return self.db.fetch_all(query, (student_id,), row_type=AttendanceRecord)
     
+    # Percentages come from attendance_summary, which triggers keep in step with attendance
     def get_attendance_percentage(self, student_id, subject_id):
-        query = """SELECT 
-                   COUNT(*) as total,
-                   SUM(CASE WHEN status = 'Present' THEN 1 ELSE 0 END) as present
-                   FROM attendance 
+        query = """SELECT total, present FROM attendance_summary 
                    WHERE student_id = %s AND subject_id = %s"""
         result = self.db.fetch_one(query, (student_id, subject_id))
         if result and result['total'] > 0:
             return round((result['present'] / result['total']) * 100, 2)
         return 0.0
     
+    def get_attendance_summary(self, student_id):
+        # Totals and percentage for every subject the student has attendance in
+        query = """SELECT s.subject_id, s.subject_name, a.total, a.present, a.on_leave 
+                   FROM attendance_summary a 
+                   JOIN subjects s ON a.subject_id = s.subject_id 
+                   WHERE a.student_id = %s AND a.total > 0 
+                   ORDER BY s.subject_name"""
+        summary = self.db.fetch_all(query, (student_id,))
+        for row in summary:
+            row['percentage'] = round((row['present'] / row['total']) * 100, 2) if row['total'] else 0.0
+        return summary
+    
+    # 🔹 Recompute attendance_summary from the raw attendance rows (repairs any drift)
+    def rebuild_attendance_summary(self):
+        query = """INSERT INTO attendance_summary (student_id, subject_id, total, present, on_leave) 
+                   SELECT student_id, subject_id, COUNT(*), 
+                   SUM(CASE WHEN status = 'Present' THEN 1 ELSE 0 END), 
+                   SUM(CASE WHEN status = 'Leave' THEN 1 ELSE 0 END) 
+                   FROM attendance 
+                   GROUP BY student_id, subject_id 
+                   ON DUPLICATE KEY UPDATE total = VALUES(total), present = VALUES(present), 
+                   on_leave = VALUES(on_leave)"""
+        if self.db.execute_query(query) is None:
+            return False
+        
+        # Pairs whose attendance was all deleted
+        query = """DELETE FROM attendance_summary 
+                   WHERE NOT EXISTS (SELECT 1 FROM attendance a 
+                                     WHERE a.student_id = attendance_summary.student_id 
+                                     AND a.subject_id = attendance_summary.subject_id)"""
+        return self.db.execute_query(query) is not None
+    
     def add_marks(self, student_id, subject_id, exam_type, marks_obtained, max_marks, entered_by):
-        grade = self.calculate_grade(marks_obtained, max_marks)
-        query = """INSERT INTO marks (student_id, subject_id, exam_type, marks_obtained, max_marks, grade, entered_by) 
-                   VALUES (%s, %s, %s, %s, %s, %s, %s)"""
-        params = (student_id, subject_id, exam_type, marks_obtained, max_marks, grade, entered_by)
-        return self.db.execute_query(query, params)
+        scheme_id, thresholds, letters = self.get_grading_scale()
+        query = """INSERT INTO marks (student_id, subject_id, exam_type, marks_obtained, max_marks, grade, 
+                   entered_by, scheme_id) VALUES (%s, %s, %s, %s, %s, %s, %s, %s)"""
+        params = (student_id, subject_id, exam_type, marks_obtained, max_marks, 
+                  grade(thresholds, letters, marks_obtained, max_marks), entered_by, scheme_id)
+        result = self.db.execute_query(query, params)
+        if result is not None:
+            self._regrade_if_scheme_changed(scheme_id)
+        return result
+    
+    def add_marks_bulk(self, subject_id, exam_type, entries, entered_by):
+        # entries: iterable of (student_id, marks_obtained, max_marks) for a whole exam sheet
+        entries = list(entries)
+        scheme_id, thresholds, letters = self.get_grading_scale()
+        query = """INSERT INTO marks (student_id, subject_id, exam_type, marks_obtained, max_marks, grade, 
+                   entered_by, scheme_id) VALUES (%s, %s, %s, %s, %s, %s, %s, %s)"""
+        params = [(student_id, subject_id, exam_type, obtained, maximum, 
+                   grade(thresholds, letters, obtained, maximum), entered_by, scheme_id)
+                  for student_id, obtained, maximum in entries]
+        result = self.db.execute_many(query, params)
+        if result is not None:
+            self._regrade_if_scheme_changed(scheme_id)
+        return result
+    
+    # 🔹 Marks were graded with scheme_id. If another client activated a different scheme
+    # between that read and our commit, its regrade may have run before our rows existed,
+    # so regrade the stale rows now. A scheme activated after this check regrades them itself.
+    def _regrade_if_scheme_changed(self, scheme_id):
+        active = self.db.fetch_one("SELECT scheme_id FROM grading_schemes WHERE is_active = TRUE")
+        if active and active['scheme_id'] != scheme_id:
+            self.regrade_marks(active['scheme_id'])
     
     def get_marks(self, student_id, subject_id=None):
         if subject_id:
             query = """SELECT m.*, s.subject_name FROM marks m 
                        JOIN subjects s ON m.subject_id = s.subject_id 
                        WHERE m.student_id = %s AND m.subject_id = %s"""
-            return self.db.fetch_all(query, (student_id, subject_id))
+            return self.db.fetch_all(query, (student_id, subject_id), row_type=MarkRecord)
         else:
             query = """SELECT m.*, s.subject_name FROM marks m 
                        JOIN subjects s ON m.subject_id = s.subject_id 
                        WHERE m.student_id = %s"""
-            return self.db.fetch_all(query, (student_id,))
-    
-    def calculate_grade(self, marks_obtained, max_marks):
-        percentage = (marks_obtained / max_marks) * 100
-        if percentage >= 90:
-            return 'A+'
-        elif percentage >= 80:
-            return 'A'
-        elif percentage >= 70:
-            return 'B+'
-        elif percentage >= 60:
-            return 'B'
-        elif percentage >= 50:
-            return 'C'
-        elif percentage >= 40:
-            return 'D'
-        else:
-            return 'F'
+            return self.db.fetch_all(query, (student_id,), row_type=MarkRecord)
+    
+    # 🔹 No database access: scale is a get_grading_scale() result the caller read once
+    @staticmethod
+    def calculate_grade(marks_obtained, max_marks, scale):
+        _, thresholds, letters = scale
+        return grade(thresholds, letters, marks_obtained, max_marks)
+    
+    def calculate_grades(self, marks):
+        # Grade a whole sheet of (marks_obtained, max_marks) pairs with one read of the scale
+        _, thresholds, letters = self.get_grading_scale()
+        return [grade(thresholds, letters, obtained, maximum) for obtained, maximum in marks]
+    
+    # 🔹 Active grading scheme as (scheme_id, thresholds, letters) for bisect lookups:
+    # letters[i] is the grade for percentages from thresholds[i - 1] up to thresholds[i].
+    # Read fresh every time, not through the shared TTL cache: another client may have
+    # activated a new scheme since, and marks graded with the old bands would stay wrong.
+    def get_grading_scale(self):
+        query = """SELECT b.scheme_id, b.min_percentage, b.grade 
+                   FROM grading_schemes s 
+                   JOIN grade_bands b ON b.scheme_id = s.scheme_id 
+                   WHERE s.is_active = TRUE 
+                   ORDER BY b.min_percentage"""
+        bands = self.db.fetch_all(query)
+        if not bands:
+            return (None, GRADE_THRESHOLDS, GRADE_LETTERS)
+        return (bands[0]['scheme_id'], [float(b['min_percentage']) for b in bands[1:]],
+                [b['grade'] for b in bands])
+    
+    def get_grading_schemes(self):
+        query = """SELECT s.scheme_id, s.name, s.is_active, s.created_at, COUNT(b.grade) as bands 
+                   FROM grading_schemes s 
+                   LEFT JOIN grade_bands b ON b.scheme_id = s.scheme_id 
+                   GROUP BY s.scheme_id, s.name, s.is_active, s.created_at 
+                   ORDER BY s.scheme_id"""
+        return self.db.fetch_all(query)
+    
+    def get_grade_bands(self, scheme_id):
+        query = """SELECT min_percentage, max_percentage, grade FROM grade_bands 
+                   WHERE scheme_id = %s ORDER BY min_percentage"""
+        return self.db.fetch_all(query, (scheme_id,))
+    
+    # 🔹 Store a new scheme version. bands: (min_percentage, grade) pairs, the lowest starting at 0.
+    # Schemes are never edited afterwards; change the scale by creating and activating a new one.
+    def create_grading_scheme(self, name, bands, activate=False):
+        bands = sorted(bands)
+        if not bands or bands[0][0] != 0:
+            print(" Error creating grading scheme: the lowest band must start at 0%")
+            return None
+        
+        uppers = [minimum for minimum, _ in bands[1:]] + [None]
+        query = """INSERT INTO grade_bands (scheme_id, min_percentage, max_percentage, grade) 
+                   VALUES (%s, %s, %s, %s)"""
+        try:
+            with self.db.transaction():
+                scheme_id = self.db.execute_query("INSERT INTO grading_schemes (name) VALUES (%s)", (name,))
+                self.db.execute_many(query, [(scheme_id, minimum, upper, grade)
+                                             for (minimum, grade), upper in zip(bands, uppers)])
+        except self.db.Error as e:
+            print(f" Error creating grading scheme: {e}")
+            return None
+        
+        if activate:
+            self.activate_grading_scheme(scheme_id)
+        return scheme_id
+    
+    # 🔹 Make scheme_id the scheme for new marks and (by default) regrade existing marks with it
+    def activate_grading_scheme(self, scheme_id, regrade=True):
+        if not self.get_grade_bands(scheme_id):
+            print(f" Error activating grading scheme: scheme {scheme_id} has no grade bands")
+            return None
+        
+        # One statement, so exactly one scheme is active at any moment
+        query = "UPDATE grading_schemes SET is_active = (scheme_id = %s)"
+        if self.db.execute_update(query, (scheme_id,)) is None:
+            return None
+        return self.regrade_marks(scheme_id) if regrade else 0
+    
+    # 🔹 Regrade marks with one set-based UPDATE ... JOIN against the scheme's bands;
+    # only_stale skips rows already graded by that scheme. Returns the number of rows changed.
+    def regrade_marks(self, scheme_id=None, only_stale=True):
+        if scheme_id is None:
+            active = self.db.fetch_one("SELECT scheme_id FROM grading_schemes WHERE is_active = TRUE")
+            if not active:
+                print(" Error regrading marks: no active grading scheme")
+                return None
+            scheme_id = active['scheme_id']
+        
+        query = """UPDATE marks m 
+                   JOIN grade_bands b ON b.scheme_id = %s 
+                        AND m.marks_obtained * 100 >= b.min_percentage * m.max_marks 
+                        AND (b.max_percentage IS NULL OR m.marks_obtained * 100 < b.max_percentage * m.max_marks) 
+                   SET m.grade = b.grade, m.scheme_id = b.scheme_id"""
+        params = (scheme_id,)
+        if only_stale:
+            query += " WHERE m.scheme_id IS NULL OR m.scheme_id <> %s"
+            params += (scheme_id,)
+        return self.db.execute_update(query, params)
+    
+    # 🔹 WHERE clause shared by the exports: course and semester of the subject, plus a date range
+    @staticmethod
+    def _export_filters(date_column, course_id, semester, date_from, date_to, date_is_timestamp=False):
+        conditions, params = [], []
+        if course_id is not None:
+            conditions.append("sub.course_id = %s")
+            params.append(course_id)
+        if semester is not None:
+            conditions.append("sub.semester = %s")
+            params.append(semester)
+        if date_from:
+            conditions.append(f"{date_column} >= %s")
+            params.append(str(date_from))
+        if date_to:
+            if date_is_timestamp:
+                # Whole last day, without wrapping the indexed column in DATE()
+                conditions.append(f"{date_column} < %s")
+                params.append((date.fromisoformat(str(date_to)) + timedelta(days=1)).isoformat())
+            else:
+                conditions.append(f"{date_column} <= %s")
+                params.append(str(date_to))
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        return where, tuple(params)
+    
+    # 🔹 Stream marks for export without materializing them (see DatabaseConfig.iter_rows)
+    def iter_marks(self, course_id=None, semester=None, date_from=None, date_to=None, 
+                   batch_size=5000, row_type='tuple'):
+        where, params = self._export_filters('m.entry_date', course_id, semester, date_from, date_to, 
+                                             date_is_timestamp=True)
+        query = f"""SELECT st.roll_number, st.name AS student_name, c.course_code, sub.semester, 
+                   sub.subject_code, sub.subject_name, m.exam_type, m.marks_obtained, m.max_marks, 
+                   m.grade, m.entry_date 
+                   FROM marks m 
+                   JOIN students st ON m.student_id = st.student_id 
+                   JOIN subjects sub ON m.subject_id = sub.subject_id 
+                   LEFT JOIN courses c ON sub.course_id = c.course_id 
+                   {where} 
+                   ORDER BY m.mark_id"""
+        return self.db.iter_rows(query, params, batch_size, row_type)
+    
+    def iter_attendance(self, course_id=None, semester=None, date_from=None, date_to=None, 
+                        batch_size=5000, row_type='tuple'):
+        where, params = self._export_filters('a.attendance_date', course_id, semester, date_from, date_to)
+        query = f"""SELECT st.roll_number, st.name AS student_name, c.course_code, sub.semester, 
+                   sub.subject_code, sub.subject_name, a.attendance_date, a.status 
+                   FROM attendance a 
+                   JOIN students st ON a.student_id = st.student_id 
+                   JOIN subjects sub ON a.subject_id = sub.subject_id 
+                   LEFT JOIN courses c ON sub.course_id = c.course_id 
+                   {where} 
+                   ORDER BY a.attendance_id"""
+        return self.db.iter_rows(query, params, batch_size, row_type)
+    
+    # 🔹 Bulk reads for per-course batch jobs (report cards): one query each for the whole course
+    def get_course_students(self, course_id, semester=None):
+        query = """SELECT st.student_id, st.roll_number, st.name, st.semester, c.course_name 
+                   FROM students st 
+                   JOIN courses c ON st.course_id = c.course_id 
+                   WHERE st.course_id = %s AND st.status = 'Active'"""
+        params = (course_id,)
+        if semester is not None:
+            query += " AND st.semester = %s"
+            params += (semester,)
+        return self.db.fetch_all(query + " ORDER BY st.student_id", params, row_type=Student)
+    
+    def iter_course_attendance_summary(self, course_id, semester=None):
+        query = """SELECT a.student_id, sub.subject_name, a.total, a.present 
+                   FROM attendance_summary a 
+                   JOIN students st ON a.student_id = st.student_id 
+                   JOIN subjects sub ON a.subject_id = sub.subject_id 
+                   WHERE st.course_id = %s AND st.status = 'Active' AND a.total > 0"""
+        params = (course_id,)
+        if semester is not None:
+            query += " AND st.semester = %s"
+            params += (semester,)
+        return self.db.iter_rows(query + " ORDER BY a.student_id, sub.subject_name", params, row_type='tuple')
+    
+    def iter_course_marks(self, course_id, semester=None):
+        query = """SELECT m.student_id, sub.subject_name, m.exam_type, m.marks_obtained, m.max_marks, m.grade 
+                   FROM marks m 
+                   JOIN students st ON m.student_id = st.student_id 
+                   JOIN subjects sub ON m.subject_id = sub.subject_id 
+                   WHERE st.course_id = %s AND st.status = 'Active'"""
+        params = (course_id,)
+        if semester is not None:
+            query += " AND st.semester = %s"
+            params += (semester,)
+        return self.db.iter_rows(query + " ORDER BY m.student_id, sub.subject_name, m.mark_id", params, 
+                                 row_type='tuple')
     
     def add_course(self, course_code, course_name, duration, department):
         query = """INSERT INTO courses (course_code, course_name, duration, department) 
                    VALUES (%s, %s, %s, %s)"""
         params = (course_code, course_name, duration, department)
-        return self.db.execute_query(query, params)
+        result = self.db.execute_query(query, params)
+        self.reference_cache.invalidate('courses', prefix=True)
+        return result
     
     def add_subject(self, subject_code, subject_name, course_id, credits, semester):
         query = """INSERT INTO subjects (subject_code, subject_name, course_id, credits, semester) 
                    VALUES (%s, %s, %s, %s, %s)"""
         params = (subject_code, subject_name, course_id, credits, semester)
-        return self.db.execute_query(query, params)
+        result = self.db.execute_query(query, params)
+        self.reference_cache.invalidate('subjects', prefix=True)
+        return result
@@ -0,0 +1,130 @@
+import re
+from functools import lru_cache
+
+# The application's SQL is written for MySQL. A dialect turns one of those statements
+# into the equivalent text for another engine; MySQL itself passes through untouched.
+
+
+class MySQLDialect:
+    name = 'mysql'
+    # (table, index) / (table, column) -> a row if it already exists; see MigrationRunner
+    index_exists = """SELECT 1 FROM information_schema.statistics 
+                      WHERE table_schema = DATABASE() AND table_name = %s AND index_name = %s"""
+    column_exists = """SELECT 1 FROM information_schema.columns 
+                       WHERE table_schema = DATABASE() AND table_name = %s AND column_name = %s"""
+
+    def translate(self, query):
+        return query
+
+
+_STRING_OR_PLACEHOLDER = re.compile(r"('(?:[^'\\]|\\.|'')*')|%s")
+_AUTO_INCREMENT_PK = re.compile(r"\bINT\s+AUTO_INCREMENT\s+PRIMARY\s+KEY\b", re.IGNORECASE)
+_ENUM_COLUMN = re.compile(r"(\w+)\s+ENUM\s*\(([^)]*)\)", re.IGNORECASE)
+_UNIQUE_KEY = re.compile(r"\bUNIQUE\s+KEY\s+\w+\s*\(", re.IGNORECASE)
+_ALTER_ADD_INDEX = re.compile(
+    r"^\s*ALTER\s+TABLE\s+(\w+)\s+ADD\s+(UNIQUE\s+|FULLTEXT\s+)?INDEX\s+(\w+)\s*(\([^)]*\))\s*$", re.IGNORECASE)
+_ANALYZE_TABLE = re.compile(r"^\s*ANALYZE\s+TABLE\b.*$", re.IGNORECASE | re.DOTALL)
+_ON_DUPLICATE = re.compile(r"\bON\s+DUPLICATE\s+KEY\s+UPDATE\b(.*)$", re.IGNORECASE | re.DOTALL)
+_VALUES_REF = re.compile(r"\bVALUES\s*\(\s*(\w+)\s*\)", re.IGNORECASE)
+_SELF_ASSIGN = re.compile(r"^\s*(\w+)\s*=\s*\1\s*$")
+_INSERT_INTO = re.compile(r"^\s*INSERT\s+INTO\b", re.IGNORECASE)
+_INSERT_SELECT = re.compile(r"\)\s*SELECT\b", re.IGNORECASE)
+_CREATE_TRIGGER = re.compile(r"^(\s*CREATE\s+TRIGGER\s+.*?\bFOR\s+EACH\s+ROW)\s+(?!BEGIN\b)(.*)$",
+                             re.IGNORECASE | re.DOTALL)
+_UPDATE_JOIN = re.compile(
+    r"^\s*UPDATE\s+(\w+)\s+(?:AS\s+)?(\w+)\s+(?:INNER\s+)?JOIN\s+(\w+)\s+(?:AS\s+)?(\w+)\s+ON\s+(.*?)"
+    r"\s+SET\s+(.*?)(?:\s+WHERE\s+(.*))?$", re.IGNORECASE | re.DOTALL)
+_WHERE_OR_GROUP = re.compile(r"\b(?:WHERE|GROUP\s+BY)\b", re.IGNORECASE)
+_MATCH_AGAINST = re.compile(r"\bMATCH\s*\(([^)]*)\)\s*AGAINST\s*\(\s*\?\s+IN\s+BOOLEAN\s+MODE\s*\)",
+                            re.IGNORECASE)
+_LIKE_OPERAND = re.compile(r"\bLIKE\s+(\?|'(?:[^'\\]|\\.|'')*')", re.IGNORECASE)
+_FUNCTIONS = [
+    (re.compile(r"\bCURDATE\(\s*\)", re.IGNORECASE), "DATE('now', 'localtime')"),
+    (re.compile(r"\bNOW\(\s*\)", re.IGNORECASE), "DATETIME('now', 'localtime')"),
+    (re.compile(r"\s+DIV\s+", re.IGNORECASE), " / "),
+]
+
+
+def _split_assignments(clause):
+    parts, depth, current = [], 0, []
+    for ch in clause:
+        if ch == '(':
+            depth += 1
+        elif ch == ')':
+            depth -= 1
+        if ch == ',' and depth == 0:
+            parts.append(''.join(current))
+            current = []
+        else:
+            current.append(ch)
+    parts.append(''.join(current))
+    return [part.strip() for part in parts if part.strip()]
+
+
+class SQLiteDialect:
+    name = 'sqlite'
+    index_exists = "SELECT 1 FROM sqlite_master WHERE type = 'index' AND tbl_name = %s AND name = %s"
+    column_exists = "SELECT 1 FROM pragma_table_info(%s) WHERE name = %s"
+
+    def translate(self, query):
+        return _translate_for_sqlite(query)
+
+
+@lru_cache(maxsize=1024)
+def _translate_for_sqlite(query):
+    # Placeholders: %s -> ? (string literals are left alone)
+    query = _STRING_OR_PLACEHOLDER.sub(lambda m: m.group(1) or '?', query)
+
+    if _ANALYZE_TABLE.match(query):
+        return 'ANALYZE'
+
+    # MySQL allows a bare single-statement trigger body; SQLite always wants BEGIN ... END
+    match = _CREATE_TRIGGER.match(query)
+    if match:
+        return f"{match.group(1)} BEGIN {_translate_for_sqlite(match.group(2).rstrip())}; END"
+
+    match = _ALTER_ADD_INDEX.match(query)
+    if match:
+        table, kind, index, columns = match.groups()
+        if kind and kind.strip().upper() == 'FULLTEXT':
+            # No FULLTEXT indexes here; MATCH ... AGAINST becomes fulltext_match() (see below)
+            return 'SELECT 1'
+        return f"CREATE {'UNIQUE ' if kind else ''}INDEX IF NOT EXISTS {index} ON {table} {columns}"
+
+    # DDL column types and inline keys
+    query = _AUTO_INCREMENT_PK.sub('INTEGER PRIMARY KEY AUTOINCREMENT', query)
+    query = _ENUM_COLUMN.sub(lambda m: f"{m.group(1)} TEXT CHECK ({m.group(1)} IN ({m.group(2)}))", query)
+    query = _UNIQUE_KEY.sub('UNIQUE (', query)
+
+    for pattern, replacement in _FUNCTIONS:
+        query = pattern.sub(replacement, query)
+
+    # MATCH (cols) AGAINST (? IN BOOLEAN MODE) -> fulltext_match(?, cols), registered by SQLiteBackend
+    query = _MATCH_AGAINST.sub(lambda m: f"fulltext_match(?, {m.group(1).strip()})", query)
+
+    # MySQL's LIKE escapes with backslash by default; SQLite needs it spelled out
+    query = _LIKE_OPERAND.sub(lambda m: f"LIKE {m.group(1)} ESCAPE '\\'", query)
+
+    # Upserts: ON DUPLICATE KEY UPDATE -> ON CONFLICT DO UPDATE / INSERT OR IGNORE
+    match = _ON_DUPLICATE.search(query)
+    if match:
+        head = query[:match.start()].rstrip()
+        assignments = _split_assignments(match.group(1))
+        if all(_SELF_ASSIGN.match(a) for a in assignments):
+            query = _INSERT_INTO.sub('INSERT OR IGNORE INTO', head, count=1)
+        else:
+            updates = ', '.join(_VALUES_REF.sub(r'excluded.\1', a) for a in assignments)
+            # INSERT ... SELECT needs a WHERE before ON CONFLICT to parse unambiguously
+            if _INSERT_SELECT.search(head) and not _WHERE_OR_GROUP.search(head):
+                head += ' WHERE true'
+            query = f"{head} ON CONFLICT DO UPDATE SET {updates}"
+
+    # Multi-table UPDATE t a JOIN u b ON ... SET ... -> UPDATE t AS a SET ... FROM u AS b WHERE ...
+    match = _UPDATE_JOIN.match(query)
+    if match:
+        table, alias, joined, joined_alias, on, assignments, where = match.groups()
+        sets = ', '.join(re.sub(rf"^{alias}\.", '', a) for a in _split_assignments(assignments))
+        condition = f"({on})" + (f" AND ({where})" if where else '')
+        query = f"UPDATE {table} AS {alias} SET {sets} FROM {joined} AS {joined_alias} WHERE {condition}"
+
+    return query
@@ -0,0 +1,177 @@
+import argparse
+import csv
+import gzip
+import time
+from datetime import date, datetime
+from decimal import Decimal
+
+from src.database.db_config import DatabaseConfig
+from src.database.db_operations import DatabaseOperations
+
+# Column names and types of each export, in the order the DatabaseOperations.iter_* queries select them
+EXPORTS = {
+    'marks': [
+        ('roll_number', 'string'), ('student_name', 'string'), ('course_code', 'string'),
+        ('semester', 'int'), ('subject_code', 'string'), ('subject_name', 'string'),
+        ('exam_type', 'string'), ('marks_obtained', 'float'), ('max_marks', 'float'),
+        ('grade', 'string'), ('entry_date', 'timestamp'),
+    ],
+    'attendance': [
+        ('roll_number', 'string'), ('student_name', 'string'), ('course_code', 'string'),
+        ('semester', 'int'), ('subject_code', 'string'), ('subject_name', 'string'),
+        ('attendance_date', 'date'), ('status', 'string'),
+    ],
+}
+FORMATS = ['csv', 'csv.gz', 'parquet', 'arrow']
+
+
+def _to_float(value):
+    return float(value) if isinstance(value, Decimal) else value
+
+
+def _to_date(value):
+    return date.fromisoformat(value) if isinstance(value, str) else value
+
+
+def _to_timestamp(value):
+    return datetime.fromisoformat(value) if isinstance(value, str) else value
+
+
+# Drivers return DECIMAL as Decimal and (on SQLite) dates as text; Arrow wants real types
+ARROW_CONVERTERS = {'float': _to_float, 'date': _to_date, 'timestamp': _to_timestamp}
+
+
+def _arrow_schema(pa, columns):
+    types = {'string': pa.string(), 'int': pa.int32(), 'float': pa.float64(),
+             'date': pa.date32(), 'timestamp': pa.timestamp('s')}
+    return pa.schema([(name, types[kind]) for name, kind in columns])
+
+
+def _chunks(rows, size):
+    chunk = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+# Writes one export from a row stream. Nothing holds more than batch_size rows:
+# CSV is written row by row, Parquet/Arrow one row group / record batch per chunk.
+class Exporter:
+    def __init__(self, db_config, batch_size=5000):
+        self.db_ops = DatabaseOperations(db_config)
+        self.batch_size = batch_size
+
+    def rows(self, dataset, **filters):
+        if dataset == 'marks':
+            return self.db_ops.iter_marks(batch_size=self.batch_size, **filters)
+        if dataset == 'attendance':
+            return self.db_ops.iter_attendance(batch_size=self.batch_size, **filters)
+        raise ValueError(f"Unknown export: {dataset}")
+
+    # 🔹 Export dataset to path in fmt; returns the number of rows written
+    def export(self, dataset, path, fmt='csv', progress=None, **filters):
+        columns = EXPORTS[dataset]
+        rows = self.rows(dataset, **filters)
+        try:
+            if fmt in ('csv', 'csv.gz'):
+                return self._write_csv(rows, columns, path, fmt == 'csv.gz', progress)
+            if fmt in ('parquet', 'arrow'):
+                return self._write_arrow(rows, columns, path, fmt, progress)
+            raise ValueError(f"Unknown export format: {fmt}")
+        finally:
+            rows.close()
+
+    def _write_csv(self, rows, columns, path, compress, progress):
+        opener = gzip.open if compress else open
+        written = 0
+        with opener(path, 'wt', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow([name for name, _ in columns])
+            for chunk in _chunks(rows, self.batch_size):
+                writer.writerows(chunk)
+                written += len(chunk)
+                if progress:
+                    progress(written)
+        return written
+
+    def _write_arrow(self, rows, columns, path, fmt, progress):
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise RuntimeError("Parquet/Arrow export needs pyarrow: pip install pyarrow")
+
+        schema = _arrow_schema(pa, columns)
+        converters = [ARROW_CONVERTERS.get(kind) for _, kind in columns]
+        if fmt == 'parquet':
+            writer = pq.ParquetWriter(path, schema, compression='snappy')
+        else:
+            writer = pa.ipc.new_file(path, schema)
+
+        written = 0
+        try:
+            for chunk in _chunks(rows, self.batch_size):
+                arrays = []
+                for index, (field, convert) in enumerate(zip(schema, converters)):
+                    values = [row[index] for row in chunk]
+                    if convert:
+                        values = [convert(value) for value in values]
+                    arrays.append(pa.array(values, type=field.type))
+                batch = pa.RecordBatch.from_arrays(arrays, schema=schema)
+                if fmt == 'parquet':
+                    writer.write_batch(batch)
+                else:
+                    writer.write(batch)
+                written += len(chunk)
+                if progress:
+                    progress(written)
+        finally:
+            writer.close()
+        return written
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export marks or attendance")
+    parser.add_argument('dataset', choices=sorted(EXPORTS))
+    parser.add_argument('output')
+    parser.add_argument('--format', choices=FORMATS, help="default: from the output file extension")
+    parser.add_argument('--course', metavar='CODE', help="only subjects of this course code")
+    parser.add_argument('--semester', type=int)
+    parser.add_argument('--from', dest='date_from', metavar='YYYY-MM-DD')
+    parser.add_argument('--to', dest='date_to', metavar='YYYY-MM-DD')
+    parser.add_argument('--batch-size', type=int, default=5000)
+    parser.add_argument('--sqlite', metavar='PATH', help="export from this SQLite file instead of MySQL")
+    args = parser.parse_args()
+
+    fmt = args.format or next((f for f in sorted(FORMATS, key=len, reverse=True)
+                               if args.output.endswith('.' + f)), 'csv')
+
+    db_config = DatabaseConfig(query_stats=False, backend='sqlite' if args.sqlite else 'mysql',
+                               sqlite_path=args.sqlite)
+    if not db_config.connect():
+        raise SystemExit(1)
+
+    exporter = Exporter(db_config, batch_size=args.batch_size)
+    course_id = None
+    if args.course:
+        courses = {c['course_code']: c['course_id'] for c in exporter.db_ops.get_all_courses()}
+        if args.course not in courses:
+            raise SystemExit(f"Unknown course code: {args.course}")
+        course_id = courses[args.course]
+
+    start = time.perf_counter()
+    written = exporter.export(args.dataset, args.output, fmt,
+                              progress=lambda n: print(f"\r  {n:,} rows", end='', flush=True),
+                              course_id=course_id, semester=args.semester,
+                              date_from=args.date_from, date_to=args.date_to)
+    print(f"\rExported {written:,} {args.dataset} rows to {args.output} ({fmt}) "
+          f"in {time.perf_counter() - start:.1f}s")
+    db_config.disconnect()
+
+
+if __name__ == '__main__':
+    main()
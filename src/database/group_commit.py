@@ -0,0 +1,82 @@
+import queue
+import threading
+import time
+from concurrent.futures import Future
+
+_STOP = object()
+
+
+# Collects small writes from any number of threads and commits them together. The first
+# write of a batch opens a window of `window` seconds (or until max_batch writes arrive);
+# the whole batch then goes to write_batch(statements), which runs it on one connection
+# and commits once. Each caller still blocks until its own write is committed, so it gets
+# the same result (or error) it would have got from committing alone.
+class GroupCommitter:
+    def __init__(self, write_batch, window=0.005, max_batch=100):
+        self.write_batch = write_batch
+        self.window = window
+        self.max_batch = max_batch
+        self._queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._thread = None
+
+    # 🔹 Queue one statement and wait for its commit; returns its lastrowid or rowcount (result)
+    def submit(self, query, params=None, result='lastrowid'):
+        future = Future()
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name='group-commit', daemon=True)
+                self._thread.start()
+            self._queue.put((query, params, result, future))
+        return future.result()
+
+    # 🔹 Commit whatever is queued and stop the writer thread
+    def close(self):
+        with self._lock:
+            thread, self._thread = self._thread, None
+            if thread is None:
+                return
+            self._queue.put(_STOP)
+        thread.join()
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            if item is _STOP:
+                return
+
+            batch = [item]
+            stop = False
+            deadline = time.monotonic() + self.window
+            while len(batch) < self.max_batch:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    stop = True
+                    break
+                batch.append(item)
+
+            self._commit(batch)
+            if stop:
+                return
+
+    # One bad statement must not fail its neighbours: if the batch is rejected,
+    # every statement is retried in a transaction of its own
+    def _commit(self, batch):
+        try:
+            results = self.write_batch([item[:3] for item in batch])
+        except Exception as e:
+            if len(batch) == 1:
+                batch[0][3].set_exception(e)
+                return
+            for item in batch:
+                self._commit([item])
+            return
+
+        for item, value in zip(batch, results):
+            item[3].set_result(value)
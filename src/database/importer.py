@@ -0,0 +1,222 @@
+import argparse
+import csv
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from itertools import islice
+
+from src.auth.authentication import Authentication
+from src.database.db_config import DatabaseConfig
+from src.database.db_operations import DatabaseOperations
+from src.utils.helpers import validate_email, validate_phone
+
+REQUIRED_COLUMNS = ['username', 'password', 'roll_number', 'name', 'email', 'phone', 'course_code', 'semester']
+OPTIONAL_COLUMNS = ['date_of_birth', 'gender', 'address']
+GENDERS = ['Male', 'Female', 'Other']
+
+USER_INSERT = "INSERT INTO users (username, password, role) VALUES (%s, %s, 'student')"
+# Same columns as DatabaseOperations.add_student, so imported students look like ones added by hand
+STUDENT_INSERT = """INSERT INTO students (user_id, roll_number, name, email, phone, date_of_birth, gender,
+                    address, course_id, semester, enrollment_date)
+                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, CURDATE())"""
+
+
+class ImportResult:
+    def __init__(self):
+        self.processed = 0
+        self.imported = 0
+        self.errors = []        # (line number, roll number, message) per rejected row
+
+    @property
+    def failed(self):
+        return len(self.errors)
+
+    def write_error_report(self, path):
+        with open(path, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(['line', 'roll_number', 'error'])
+            writer.writerows(self.errors)
+
+
+# Streams a CSV of students into users + students. Rows are validated, checked against
+# existing usernames/roll numbers, and inserted chunk_size at a time in one transaction
+# per chunk; a chunk the database rejects is retried row by row to pin down the bad rows.
+# hash_workers > 1 hashes passwords in a process pool.
+class StudentImporter:
+    def __init__(self, db_config, chunk_size=500, hash_workers=0):
+        self.db = db_config
+        self.db_ops = DatabaseOperations(db_config)
+        self.chunk_size = chunk_size
+        self.hash_workers = hash_workers
+
+    # 🔹 Import path; progress(processed, imported, failed) is called after every chunk
+    def import_csv(self, path, progress=None):
+        if not self.db.pool and not self.db.connect():
+            return None
+
+        result = ImportResult()
+        courses = {c['course_code']: c['course_id'] for c in self.db_ops.get_all_courses()}
+        seen_usernames, seen_rolls = set(), set()
+        executor = ProcessPoolExecutor(self.hash_workers) if self.hash_workers > 1 else None
+        try:
+            with open(path, newline='', encoding='utf-8-sig') as f:
+                reader = csv.DictReader(f)
+                missing = [c for c in REQUIRED_COLUMNS if c not in (reader.fieldnames or [])]
+                if missing:
+                    raise ValueError(f"CSV is missing columns: {', '.join(missing)}")
+
+                rows = ((reader.line_num, row) for row in reader)
+                while True:
+                    chunk = list(islice(rows, self.chunk_size))
+                    if not chunk:
+                        break
+
+                    records = []
+                    for line, row in chunk:
+                        record, error = self._validate(row, courses, seen_usernames, seen_rolls)
+                        if error:
+                            result.errors.append((line, (row.get('roll_number') or '').strip(), error))
+                        else:
+                            records.append((line, record))
+                    records = self._drop_existing(records, result)
+
+                    if records:
+                        self._hash_passwords(records, executor)
+                        self._insert_chunk(records, result)
+
+                    result.processed += len(chunk)
+                    if progress:
+                        progress(result.processed, result.imported, result.failed)
+        finally:
+            if executor:
+                executor.shutdown()
+        return result
+
+    # 🔹 (record, None) for a usable row, (None, message) otherwise
+    def _validate(self, row, courses, seen_usernames, seen_rolls):
+        record = {column: (row.get(column) or '').strip() for column in REQUIRED_COLUMNS + OPTIONAL_COLUMNS}
+        problems = [f"{column} is required" for column in REQUIRED_COLUMNS if not record[column]]
+        if problems:
+            return None, '; '.join(problems)
+
+        if not validate_email(record['email']):
+            problems.append("invalid email")
+        if not validate_phone(record['phone']):
+            problems.append("phone must be 10 digits")
+        if record['course_code'] not in courses:
+            problems.append(f"unknown course {record['course_code']}")
+        if not record['semester'].isdigit() or not 1 <= int(record['semester']) <= 8:
+            problems.append("semester must be 1-8")
+        if record['gender'] and record['gender'] not in GENDERS:
+            problems.append(f"gender must be one of {', '.join(GENDERS)}")
+        if record['date_of_birth']:
+            try:
+                datetime.strptime(record['date_of_birth'], '%Y-%m-%d')
+            except ValueError:
+                problems.append("date_of_birth must be YYYY-MM-DD")
+        if record['username'] in seen_usernames:
+            problems.append("duplicate username in file")
+        if record['roll_number'] in seen_rolls:
+            problems.append("duplicate roll number in file")
+        if problems:
+            return None, '; '.join(problems)
+
+        seen_usernames.add(record['username'])
+        seen_rolls.add(record['roll_number'])
+        record['course_id'] = courses[record['course_code']]
+        record['semester'] = int(record['semester'])
+        return record, None
+
+    # 🔹 Reject rows whose username or roll number is already in the database (two queries per chunk)
+    def _drop_existing(self, records, result):
+        if not records:
+            return records
+        usernames = [record['username'] for _, record in records]
+        rolls = [record['roll_number'] for _, record in records]
+        taken_usernames = {row['username'] for row in self.db.fetch_all(
+            f"SELECT username FROM users WHERE username IN ({', '.join(['%s'] * len(usernames))})", usernames)}
+        taken_rolls = {row['roll_number'] for row in self.db.fetch_all(
+            f"SELECT roll_number FROM students WHERE roll_number IN ({', '.join(['%s'] * len(rolls))})", rolls)}
+
+        kept = []
+        for line, record in records:
+            if record['username'] in taken_usernames:
+                result.errors.append((line, record['roll_number'], "username already exists"))
+            elif record['roll_number'] in taken_rolls:
+                result.errors.append((line, record['roll_number'], "roll number already exists"))
+            else:
+                kept.append((line, record))
+        return kept
+
+    def _hash_passwords(self, records, executor):
+        passwords = [record['password'] for _, record in records]
+        if executor:
+            hashes = executor.map(Authentication.hash_password, passwords,
+                                  chunksize=max(1, len(passwords) // self.hash_workers))
+        else:
+            hashes = map(Authentication.hash_password, passwords)
+        for (_, record), hashed in zip(records, hashes):
+            record['password'] = hashed
+
+    def _insert_chunk(self, records, result):
+        try:
+            self._insert([record for _, record in records])
+            result.imported += len(records)
+            return
+        except self.db.Error as e:
+            if len(records) == 1:
+                result.errors.append((records[0][0], records[0][1]['roll_number'], str(e)))
+                return
+
+        for line, record in records:
+            try:
+                self._insert([record])
+                result.imported += 1
+            except self.db.Error as e:
+                result.errors.append((line, record['roll_number'], str(e)))
+
+    # 🔹 users then students for a set of records, in one transaction
+    def _insert(self, records):
+        usernames = [record['username'] for record in records]
+        with self.db.transaction():
+            self.db.execute_many(USER_INSERT, [(r['username'], r['password']) for r in records])
+            user_ids = {row['username']: row['user_id'] for row in self.db.fetch_all(
+                f"SELECT user_id, username FROM users WHERE username IN ({', '.join(['%s'] * len(usernames))})",
+                usernames)}
+            self.db.execute_many(STUDENT_INSERT, [
+                (user_ids[r['username']], r['roll_number'], r['name'], r['email'], r['phone'],
+                 r['date_of_birth'] or None, r['gender'] or None, r['address'] or None,
+                 r['course_id'], r['semester']) for r in records])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Import students from a CSV file")
+    parser.add_argument('csv_file')
+    parser.add_argument('--chunk-size', type=int, default=500)
+    parser.add_argument('--hash-workers', type=int, default=0, help="hash passwords in this many processes")
+    parser.add_argument('--errors', metavar='PATH', help="write rejected rows to this CSV file")
+    parser.add_argument('--sqlite', metavar='PATH', help="import into this SQLite file instead of MySQL")
+    args = parser.parse_args()
+
+    db_config = DatabaseConfig(backend='sqlite' if args.sqlite else 'mysql', sqlite_path=args.sqlite)
+    importer = StudentImporter(db_config, chunk_size=args.chunk_size, hash_workers=args.hash_workers)
+    start = time.perf_counter()
+    result = importer.import_csv(args.csv_file, progress=lambda processed, imported, failed: print(
+        f"\r  {processed:,} rows: {imported:,} imported, {failed:,} rejected", end='', flush=True))
+    if result is None:
+        raise SystemExit(1)
+
+    print(f"\nImported {result.imported:,} of {result.processed:,} students "
+          f"in {time.perf_counter() - start:.1f}s")
+    if result.errors:
+        if args.errors:
+            result.write_error_report(args.errors)
+            print(f"{result.failed:,} rejected rows written to {args.errors}")
+        else:
+            for line, roll_number, error in result.errors:
+                print(f"  line {line} ({roll_number or '-'}): {error}")
+    db_config.disconnect()
+
+
+if __name__ == '__main__':
+    main()
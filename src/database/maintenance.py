@@ -0,0 +1,112 @@
+import argparse
+import time
+
+from src.database.db_config import DatabaseConfig
+from src.database.db_operations import DatabaseOperations
+
+
+def rebuild_attendance_summary(db_ops, args):
+    start = time.perf_counter()
+    if not db_ops.rebuild_attendance_summary():
+        return False
+    print(f" Attendance summary rebuilt in {time.perf_counter() - start:.1f}s")
+    return True
+
+
+def regrade_marks(db_ops, args):
+    start = time.perf_counter()
+    changed = db_ops.regrade_marks(only_stale=False)
+    if changed is None:
+        return False
+    print(f" Regraded marks with the active grading scheme: {changed:,} rows changed "
+          f"in {time.perf_counter() - start:.1f}s")
+    return True
+
+
+def list_schemes(db_ops, args):
+    for scheme in db_ops.get_grading_schemes():
+        bands = ', '.join(f"{float(band['min_percentage']):g}%={band['grade']}"
+                          for band in db_ops.get_grade_bands(scheme['scheme_id']))
+        active = ' (active)' if scheme['is_active'] else ''
+        print(f" {scheme['scheme_id']}: {scheme['name']}{active}  {bands}")
+    return True
+
+
+# 🔹 "0=F,40=D,50=C" -> [(0.0, 'F'), (40.0, 'D'), (50.0, 'C')]
+def parse_bands(text):
+    bands = []
+    for item in text.split(','):
+        minimum, separator, grade = item.partition('=')
+        try:
+            bands.append((float(minimum), grade.strip()))
+        except ValueError:
+            separator = ''
+        if not separator or not grade.strip():
+            raise argparse.ArgumentTypeError(f"bands must look like 0=F,40=D,50=C (got {item.strip()!r})")
+    return bands
+
+
+def create_scheme(db_ops, args):
+    scheme_id = db_ops.create_grading_scheme(args.name, args.bands)
+    if scheme_id is None:
+        return False
+    print(f" Created grading scheme {scheme_id} ({args.name})")
+    if not args.activate:
+        return True
+    args.scheme_id = scheme_id
+    return activate_scheme(db_ops, args)
+
+
+def activate_scheme(db_ops, args):
+    start = time.perf_counter()
+    changed = db_ops.activate_grading_scheme(args.scheme_id, regrade=not args.no_regrade)
+    if changed is None:
+        return False
+    if args.no_regrade:
+        print(f" Activated grading scheme {args.scheme_id} for new marks; existing marks keep their grades")
+    else:
+        print(f" Activated grading scheme {args.scheme_id}: {changed:,} marks regraded "
+              f"in {time.perf_counter() - start:.1f}s")
+    return True
+
+
+def main():
+    # Accepted after the command name as well as before it
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument('--sqlite', metavar='PATH', default=argparse.SUPPRESS,
+                        help="run against this SQLite file instead of MySQL")
+    parser = argparse.ArgumentParser(description="Database maintenance tasks", parents=[common])
+    commands = parser.add_subparsers(dest='command', required=True)
+    commands.add_parser('rebuild-attendance-summary', parents=[common]).set_defaults(run=rebuild_attendance_summary)
+    commands.add_parser('regrade-marks', parents=[common]).set_defaults(run=regrade_marks)
+    commands.add_parser('list-schemes', parents=[common],
+                        help="show grading schemes and their bands").set_defaults(run=list_schemes)
+
+    create = commands.add_parser('create-scheme', parents=[common], help="store a new grading scheme")
+    create.add_argument('name')
+    create.add_argument('bands', type=parse_bands,
+                        help="lowest percentage of each grade, e.g. 0=F,40=D,50=C,60=B,70=A")
+    create.add_argument('--activate', action='store_true', help="also make it the active scheme")
+    create.add_argument('--no-regrade', action='store_true', help="with --activate, leave existing marks alone")
+    create.set_defaults(run=create_scheme)
+
+    activate = commands.add_parser('activate-scheme', parents=[common],
+                                   help="make a scheme active and regrade marks with it")
+    activate.add_argument('scheme_id', type=int)
+    activate.add_argument('--no-regrade', action='store_true', help="grade only new marks with it")
+    activate.set_defaults(run=activate_scheme)
+    args = parser.parse_args()
+    sqlite = getattr(args, 'sqlite', None)
+
+    db_config = DatabaseConfig(query_stats=False, backend='sqlite' if sqlite else 'mysql', sqlite_path=sqlite)
+    if not db_config.connect():
+        raise SystemExit(1)
+
+    ok = args.run(DatabaseOperations(db_config), args)
+    db_config.disconnect()
+    if not ok:
+        raise SystemExit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,8 +1,5 @@
--- Active: 1762077113688@@127.0.0.1@3306@student_management
-
-
-CREATE DATABASE IF NOT EXISTS student_management;
-USE student_management;
+-- Migration 001: base schema and sample data
+-- The migration runner creates and selects the database before applying this file.
 
 -- Users table for authentication
 CREATE TABLE IF NOT EXISTS users (
@@ -0,0 +1,15 @@
+-- Migration 002: secondary indexes for the DatabaseOperations query paths
+-- MySQL commits each ALTER TABLE on its own; if this file fails part-way, the indexes it already
+-- created are skipped when it runs again (see MigrationRunner._already_applied).
+
+-- get_marks / report cards filter marks by student and subject
+ALTER TABLE marks ADD INDEX idx_marks_student_subject (student_id, subject_id);
+
+-- Class-level attendance scans (roster for a subject on a date)
+ALTER TABLE attendance ADD INDEX idx_attendance_subject_date (subject_id, attendance_date);
+
+-- get_all_students / get_students_page: status filter plus keyset order on student_id
+ALTER TABLE students ADD INDEX idx_students_status_id (status, student_id);
+
+-- get_class_roster: active students of a course/semester
+ALTER TABLE students ADD INDEX idx_students_course_semester (course_id, semester, status);
@@ -0,0 +1,49 @@
+-- Migration 003: per-student, per-subject attendance totals kept up to date by triggers,
+-- so attendance percentages are a primary-key read instead of a scan of every marked day.
+-- Rebuild it from the raw rows with: python -m src.database.maintenance rebuild-attendance-summary
+
+CREATE TABLE IF NOT EXISTS attendance_summary (
+    student_id INT NOT NULL,
+    subject_id INT NOT NULL,
+    total INT NOT NULL DEFAULT 0,
+    present INT NOT NULL DEFAULT 0,
+    on_leave INT NOT NULL DEFAULT 0,
+    PRIMARY KEY (student_id, subject_id),
+    FOREIGN KEY (student_id) REFERENCES students(student_id) ON DELETE CASCADE,
+    FOREIGN KEY (subject_id) REFERENCES subjects(subject_id) ON DELETE CASCADE
+);
+
+-- A new attendance row adds one class to the pair's totals
+CREATE TRIGGER trg_attendance_summary_insert AFTER INSERT ON attendance
+FOR EACH ROW
+    INSERT INTO attendance_summary (student_id, subject_id, total, present, on_leave)
+    VALUES (NEW.student_id, NEW.subject_id, 1, NEW.status = 'Present', NEW.status = 'Leave')
+    ON DUPLICATE KEY UPDATE total = total + 1,
+                            present = present + VALUES(present),
+                            on_leave = on_leave + VALUES(on_leave);
+
+-- A changed status (including the ON DUPLICATE KEY UPDATE path of mark_attendance) moves
+-- the class between buckets; the application never changes a row's student or subject
+CREATE TRIGGER trg_attendance_summary_update AFTER UPDATE ON attendance
+FOR EACH ROW
+    UPDATE attendance_summary
+    SET present = present + (NEW.status = 'Present') - (OLD.status = 'Present'),
+        on_leave = on_leave + (NEW.status = 'Leave') - (OLD.status = 'Leave')
+    WHERE student_id = NEW.student_id AND subject_id = NEW.subject_id;
+
+CREATE TRIGGER trg_attendance_summary_delete AFTER DELETE ON attendance
+FOR EACH ROW
+    UPDATE attendance_summary
+    SET total = total - 1,
+        present = present - (OLD.status = 'Present'),
+        on_leave = on_leave - (OLD.status = 'Leave')
+    WHERE student_id = OLD.student_id AND subject_id = OLD.subject_id;
+
+-- Backfill from the attendance already recorded
+INSERT INTO attendance_summary (student_id, subject_id, total, present, on_leave)
+SELECT student_id, subject_id, COUNT(*),
+       SUM(CASE WHEN status = 'Present' THEN 1 ELSE 0 END),
+       SUM(CASE WHEN status = 'Leave' THEN 1 ELSE 0 END)
+FROM attendance
+GROUP BY student_id, subject_id
+ON DUPLICATE KEY UPDATE total = VALUES(total), present = VALUES(present), on_leave = VALUES(on_leave);
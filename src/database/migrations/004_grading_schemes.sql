@@ -0,0 +1,35 @@
+-- Migration 004: versioned grading schemes. A scheme's bands never change once created;
+-- a new scale is a new scheme, and marks.scheme_id records which scheme graded each row.
+
+CREATE TABLE IF NOT EXISTS grading_schemes (
+    scheme_id INT AUTO_INCREMENT PRIMARY KEY,
+    name VARCHAR(100) NOT NULL,
+    is_active BOOLEAN NOT NULL DEFAULT FALSE,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Percentage bands: min_percentage inclusive, max_percentage exclusive (NULL for the top band)
+CREATE TABLE IF NOT EXISTS grade_bands (
+    scheme_id INT NOT NULL,
+    min_percentage DECIMAL(5,2) NOT NULL,
+    max_percentage DECIMAL(5,2),
+    grade VARCHAR(2) NOT NULL,
+    PRIMARY KEY (scheme_id, min_percentage),
+    FOREIGN KEY (scheme_id) REFERENCES grading_schemes(scheme_id) ON DELETE CASCADE
+);
+
+-- The bands previously hard-coded in DatabaseOperations.calculate_grade
+INSERT INTO grading_schemes (scheme_id, name, is_active) VALUES (1, 'Default (10-point bands)', TRUE);
+
+INSERT INTO grade_bands (scheme_id, min_percentage, max_percentage, grade) VALUES
+(1, 0, 40, 'F'),
+(1, 40, 50, 'D'),
+(1, 50, 60, 'C'),
+(1, 60, 70, 'B'),
+(1, 70, 80, 'B+'),
+(1, 80, 90, 'A'),
+(1, 90, NULL, 'A+');
+
+ALTER TABLE marks ADD COLUMN scheme_id INT;
+
+UPDATE marks SET scheme_id = 1;
@@ -0,0 +1,5 @@
+-- Migration 005: full-text index for DatabaseOperations.search_students
+-- Roll-number prefixes are already served by the UNIQUE index on students.roll_number;
+-- names and emails are matched word by word (boolean mode prefix terms) through this index.
+
+ALTER TABLE students ADD FULLTEXT INDEX ft_students_name_email (name, email);
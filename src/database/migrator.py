@@ -0,0 +1,179 @@
+import os
+import re
+
+from src.database.dialects import MySQLDialect
+
+MIGRATIONS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'migrations')
+MIGRATION_FILE = re.compile(r'^(\d+)_(\w+)\.sql$')
+_ADD_INDEX = re.compile(r"^\s*ALTER\s+TABLE\s+(\w+)\s+ADD\s+(?:UNIQUE\s+|FULLTEXT\s+)?INDEX\s+(\w+)\b", re.IGNORECASE)
+_ADD_COLUMN = re.compile(r"^\s*ALTER\s+TABLE\s+(\w+)\s+ADD\s+COLUMN\s+(\w+)\b", re.IGNORECASE)
+
+
+# 🔹 Split a SQL script into statements, ignoring ';' inside quotes and comments.
+# Supports the mysql client's DELIMITER directive for routines/triggers.
+def split_sql_statements(script):
+    statements = []
+    current = []
+    delimiter = ';'
+    i = 0
+    n = len(script)
+    at_line_start = True
+
+    while i < n:
+        if at_line_start:
+            line_end = script.find('\n', i)
+            line_end = n if line_end == -1 else line_end
+            line = script[i:line_end].strip()
+            if line.upper().startswith('DELIMITER '):
+                delimiter = line.split(None, 1)[1].strip()
+                i = line_end + 1
+                continue
+        at_line_start = False
+
+        ch = script[i]
+        two = script[i:i + 2]
+
+        if two == '--' or ch == '#':
+            line_end = script.find('\n', i)
+            i = n if line_end == -1 else line_end
+            continue
+        if two == '/*':
+            end = script.find('*/', i + 2)
+            i = n if end == -1 else end + 2
+            continue
+        if ch in ("'", '"', '`'):
+            j = i + 1
+            while j < n:
+                if script[j] == '\\' and ch != '`':
+                    j += 2
+                    continue
+                if script[j] == ch:
+                    if script[j + 1:j + 2] == ch:   # doubled quote escape
+                        j += 2
+                        continue
+                    break
+                j += 1
+            current.append(script[i:j + 1])
+            i = j + 1
+            continue
+        if script.startswith(delimiter, i):
+            statement = ''.join(current).strip()
+            if statement:
+                statements.append(statement)
+            current = []
+            i += len(delimiter)
+            continue
+
+        current.append(ch)
+        if ch == '\n':
+            at_line_start = True
+        i += 1
+
+    statement = ''.join(current).strip()
+    if statement:
+        statements.append(statement)
+    return statements
+
+
+# 🔹 (version, name, path) for every migration file, in version order
+def discover_migrations(directory=MIGRATIONS_DIR):
+    migrations = []
+    for filename in os.listdir(directory):
+        match = MIGRATION_FILE.match(filename)
+        if match:
+            migrations.append((int(match.group(1)), match.group(2), os.path.join(directory, filename)))
+    migrations.sort()
+
+    versions = [version for version, _, _ in migrations]
+    if len(versions) != len(set(versions)):
+        raise ValueError(f"Duplicate migration versions in {directory}")
+    return migrations
+
+
+class MigrationRunner:
+    # Migrations are written for MySQL; dialect translates each statement for other engines
+    def __init__(self, connection, directory=MIGRATIONS_DIR, dialect=None):
+        self.connection = connection
+        self.directory = directory
+        self.dialect = dialect or MySQLDialect()
+
+    def _execute(self, cursor, statement, params=None):
+        statement = self.dialect.translate(statement)
+        if params:
+            cursor.execute(statement, params)
+        else:
+            cursor.execute(statement)
+
+    # 🔹 True for an ALTER TABLE ... ADD INDEX / ADD COLUMN whose index or column already exists.
+    # MySQL commits each DDL statement on its own, so a migration that failed part-way keeps
+    # its earlier indexes and columns without being recorded; re-running it skips those.
+    def _already_applied(self, cursor, statement):
+        for pattern, query in ((_ADD_INDEX, self.dialect.index_exists), (_ADD_COLUMN, self.dialect.column_exists)):
+            match = pattern.match(statement)
+            if match:
+                self._execute(cursor, query, match.groups())
+                return bool(cursor.fetchall())
+        return False
+
+    def ensure_version_table(self):
+        cursor = self.connection.cursor()
+        try:
+            self._execute(cursor, """CREATE TABLE IF NOT EXISTS schema_version (
+                                  version INT PRIMARY KEY,
+                                  name VARCHAR(100) NOT NULL,
+                                  applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                              )""")
+            self.connection.commit()
+        finally:
+            cursor.close()
+
+    def applied_versions(self):
+        cursor = self.connection.cursor()
+        try:
+            self._execute(cursor, "SELECT version FROM schema_version")
+            return {row[0] for row in cursor.fetchall()}
+        finally:
+            cursor.close()
+
+    def pending(self):
+        applied = self.applied_versions()
+        return [m for m in discover_migrations(self.directory) if m[0] not in applied]
+
+    # 🔹 Apply every pending migration in order; returns the versions applied.
+    # MySQL commits DDL implicitly, so each file is recorded as soon as it finishes
+    # and a failure stops the run with earlier migrations kept.
+    def apply_pending(self):
+        self.ensure_version_table()
+        applied = []
+        for version, name, path in self.pending():
+            with open(path, 'r', encoding='utf-8') as f:
+                statements = split_sql_statements(f.read())
+
+            cursor = self.connection.cursor()
+            try:
+                for statement in statements:
+                    if not self._already_applied(cursor, statement):
+                        self._execute(cursor, statement)
+                self._execute(cursor, "INSERT INTO schema_version (version, name) VALUES (%s, %s)",
+                              (version, name))
+                self.connection.commit()
+            except Exception:
+                self.connection.rollback()
+                raise
+            finally:
+                cursor.close()
+
+            print(f" Applied migration {version:03d} ({name})")
+            applied.append(version)
+        return applied
+
+    def current_version(self):
+        applied = self.applied_versions()
+        return max(applied) if applied else 0
+
+
+if __name__ == '__main__':
+    from src.database.db_config import DatabaseConfig
+
+    if not DatabaseConfig().initialize_database():
+        raise SystemExit(1)
@@ -0,0 +1,139 @@
+import json
+import math
+import re
+import threading
+import time
+from functools import lru_cache
+
+# Histogram buckets grow by 25% from 50µs, so any percentile is within ~12% of the real value
+BUCKET_START = 0.00005
+BUCKET_GROWTH = 1.25
+BUCKET_COUNT = 64
+
+_STRING_LITERAL = re.compile(r"'(?:[^'\\]|\\.|'')*'|\"(?:[^\"\\]|\\.|\"\")*\"")
+_NUMBER_LITERAL = re.compile(r"(?<![\w.])-?\d+(?:\.\d+)?\b")
+_PLACEHOLDER = re.compile(r"%s|%\(\w+\)s|\?")
+_IN_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_VALUES_LIST = re.compile(r"(VALUES\s*\([^)]*\))(?:\s*,\s*\([^)]*\))+", re.IGNORECASE)
+_WHITESPACE = re.compile(r"\s+")
+
+
+# 🔹 Normalized SQL shape: literals and placeholders become ?, lists collapse, whitespace folds
+@lru_cache(maxsize=1024)
+def fingerprint(query):
+    shape = _STRING_LITERAL.sub('?', query)
+    shape = _NUMBER_LITERAL.sub('?', shape)
+    shape = _PLACEHOLDER.sub('?', shape)
+    shape = _IN_LIST.sub('(?+)', shape)
+    shape = _VALUES_LIST.sub(r'\1, ...', shape)
+    return _WHITESPACE.sub(' ', shape).strip()
+
+
+def _bucket_index(seconds):
+    if seconds <= BUCKET_START:
+        return 0
+    index = int(math.log(seconds / BUCKET_START, BUCKET_GROWTH)) + 1
+    return min(index, BUCKET_COUNT - 1)
+
+
+def _bucket_upper(index):
+    return BUCKET_START * BUCKET_GROWTH ** index
+
+
+class LatencyHistogram:
+    def __init__(self):
+        self.buckets = [0] * BUCKET_COUNT
+        self.count = 0
+        self.errors = 0
+        self.rows = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, seconds, rows, failed=False):
+        self.buckets[_bucket_index(seconds)] += 1
+        self.count += 1
+        self.rows += rows
+        self.total += seconds
+        self.max = max(self.max, seconds)
+        if failed:
+            self.errors += 1
+
+    def percentile(self, fraction):
+        if not self.count:
+            return 0.0
+        target = math.ceil(self.count * fraction)
+        seen = 0
+        for index, hits in enumerate(self.buckets):
+            seen += hits
+            if seen >= target:
+                return min(_bucket_upper(index), self.max)
+        return self.max
+
+    def summary(self):
+        return {
+            'count': self.count,
+            'errors': self.errors,
+            'rows': self.rows,
+            'total_ms': round(self.total * 1000, 3),
+            'mean_ms': round(self.total / self.count * 1000, 3) if self.count else 0.0,
+            'p50_ms': round(self.percentile(0.50) * 1000, 3),
+            'p95_ms': round(self.percentile(0.95) * 1000, 3),
+            'p99_ms': round(self.percentile(0.99) * 1000, 3),
+            'max_ms': round(self.max * 1000, 3),
+        }
+
+
+# Per-fingerprint latency histograms plus a slow-query log. Thresholds are in seconds;
+# slow queries are appended to slow_query_log when set, otherwise printed.
+class QueryStats:
+    def __init__(self, slow_query_threshold=0.5, slow_query_log=None):
+        self.slow_query_threshold = slow_query_threshold
+        self.slow_query_log = slow_query_log
+        self.started_at = time.time()
+        self._histograms = {}
+        self._lock = threading.Lock()
+
+    def record(self, query, seconds, rows=0, failed=False):
+        shape = fingerprint(query)
+        with self._lock:
+            histogram = self._histograms.get(shape)
+            if histogram is None:
+                histogram = self._histograms[shape] = LatencyHistogram()
+            histogram.record(seconds, rows, failed)
+
+        if self.slow_query_threshold is not None and seconds >= self.slow_query_threshold:
+            self._log_slow(shape, seconds, rows)
+
+    def _log_slow(self, shape, seconds, rows):
+        line = f"{time.strftime('%Y-%m-%d %H:%M:%S')} slow query {seconds * 1000:.1f} ms, {rows} rows: {shape}"
+        if self.slow_query_log:
+            with open(self.slow_query_log, 'a', encoding='utf-8') as f:
+                f.write(line + '\n')
+        else:
+            print(line)
+
+    # 🔹 Stats per fingerprint, slowest total time first
+    def snapshot(self):
+        with self._lock:
+            queries = [dict(fingerprint=shape, **histogram.summary())
+                       for shape, histogram in self._histograms.items()]
+        queries.sort(key=lambda q: q['total_ms'], reverse=True)
+        return {
+            'since': time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(self.started_at)),
+            'slow_query_threshold_ms': None if self.slow_query_threshold is None
+                                       else self.slow_query_threshold * 1000,
+            'queries': queries,
+        }
+
+    # 🔹 Write the snapshot as JSON to path, or return it as a string
+    def dump_json(self, path=None):
+        data = json.dumps(self.snapshot(), indent=2)
+        if path:
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(data)
+        return data
+
+    def reset(self):
+        with self._lock:
+            self._histograms.clear()
+            self.started_at = time.time()
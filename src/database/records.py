@@ -0,0 +1,100 @@
+from functools import lru_cache
+
+
+# Base for compact row objects: one slot per column instead of a per-row dict.
+# Subclasses list their columns in __slots__; values are given in that order.
+# Rows can also be read like the dicts they replace (row['name'], row.get('name')),
+# but only declared fields exist: a typo is an error instead of a silent new key.
+class Record:
+    __slots__ = ()
+
+    def __init__(self, *values):
+        for field, value in zip(self.__slots__, values):
+            setattr(self, field, value)
+
+    @classmethod
+    def _make(cls, values):
+        return cls(*values)
+
+    def __iter__(self):
+        return (getattr(self, field, None) for field in self.__slots__)
+
+    def __eq__(self, other):
+        return type(other) is type(self) and tuple(self) == tuple(other)
+
+    def __repr__(self):
+        values = ', '.join(f"{field}={getattr(self, field)!r}" for field in self.keys())
+        return f"{type(self).__name__}({values})"
+
+    def __getitem__(self, field):
+        try:
+            return getattr(self, field)
+        except (AttributeError, TypeError):
+            raise KeyError(field) from None
+
+    def __contains__(self, field):
+        return isinstance(field, str) and hasattr(self, field)
+
+    def get(self, field, default=None):
+        return getattr(self, field, default)
+
+    # Fields the query actually selected; the rest of a typed record's slots stay unset
+    def keys(self):
+        return [field for field in self.__slots__ if hasattr(self, field)]
+
+    def as_dict(self):
+        return {field: getattr(self, field) for field in self.keys()}
+
+
+# 🔹 Typed rows returned by DatabaseOperations. A query may select any subset of the
+# fields (in any order); columns the type doesn't declare are left out of the record,
+# so a migration adding a column doesn't break the SELECT s.* queries.
+class Student(Record):
+    __slots__ = ('student_id', 'user_id', 'roll_number', 'name', 'email', 'phone', 'date_of_birth',
+                 'gender', 'address', 'course_id', 'semester', 'enrollment_date', 'status',
+                 'course_name', 'username')
+
+
+class Course(Record):
+    __slots__ = ('course_id', 'course_code', 'course_name', 'duration', 'department', 'created_at')
+
+
+class Subject(Record):
+    __slots__ = ('subject_id', 'subject_code', 'subject_name', 'course_id', 'credits', 'semester')
+
+
+class AttendanceRecord(Record):
+    __slots__ = ('attendance_id', 'student_id', 'subject_id', 'attendance_date', 'status', 'marked_by',
+                 'subject_name')
+
+
+class MarkRecord(Record):
+    __slots__ = ('mark_id', 'student_id', 'subject_id', 'exam_type', 'marks_obtained', 'max_marks', 'grade',
+                 'entered_by', 'entry_date', 'scheme_id', 'subject_name')
+
+
+# 🔹 Function turning a result row (values in `columns` order) into a cls instance.
+# Columns cls doesn't declare are skipped.
+@lru_cache(maxsize=256)
+def record_reader(cls, columns):
+    if columns == cls.__slots__:
+        return cls._make
+    fields = [(index, column) for index, column in enumerate(columns) if column in cls.__slots__]
+
+    def read(values):
+        record = cls()
+        for index, column in fields:
+            setattr(record, column, values[index])
+        return record
+    return read
+
+
+# 🔹 Record subclass for a given column list, created once and reused for every row
+@lru_cache(maxsize=256)
+def record_type(columns):
+    invalid = [column for column in columns if not column.isidentifier()]
+    if invalid:
+        raise ValueError(f"Columns need identifier names for record rows (alias them): {', '.join(invalid)}")
+    if len(set(columns)) != len(columns):
+        raise ValueError(f"Duplicate column names in record rows: {', '.join(columns)}")
+    return type('Row', (Record,), {'__slots__': tuple(columns)})
@@ -0,0 +1,51 @@
+from collections import OrderedDict
+
+
+# LRU of server-side prepared cursors for one connection, keyed by SQL text.
+# open_cursor(dictionary) creates a new prepared cursor on that connection.
+class StatementCache:
+    def __init__(self, open_cursor, size=64):
+        self.open_cursor = open_cursor
+        self.size = size
+        self._cursors = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    # 🔹 Get the prepared cursor for this SQL, preparing it on first use
+    def get(self, query, dictionary=False):
+        key = (query, dictionary)
+        cursor = self._cursors.get(key)
+        if cursor is not None:
+            self._cursors.move_to_end(key)
+            self.hits += 1
+            return cursor
+
+        self.misses += 1
+        cursor = self.open_cursor(dictionary)
+        self._cursors[key] = cursor
+        if len(self._cursors) > self.size:
+            _, oldest = self._cursors.popitem(last=False)
+            self._close(oldest)
+        return cursor
+
+    # 🔹 Forget a statement whose cursor hit an error
+    def evict(self, query, dictionary=False):
+        cursor = self._cursors.pop((query, dictionary), None)
+        if cursor is not None:
+            self._close(cursor)
+
+    def close(self):
+        while self._cursors:
+            _, cursor = self._cursors.popitem()
+            self._close(cursor)
+
+    @staticmethod
+    def _close(cursor):
+        # Closing a prepared cursor deallocates the statement on the server
+        try:
+            cursor.close()
+        except Exception:
+            pass
+
+    def __len__(self):
+        return len(self._cursors)
@@ -1,20 +1,30 @@
 import tkinter as tk
-from tkinter import ttk, messagebox
+from tkinter import ttk, messagebox, filedialog
 from src.database.db_operations import DatabaseOperations
+from src.database.importer import StudentImporter, REQUIRED_COLUMNS, OPTIONAL_COLUMNS
 from src.auth.authentication import Authentication
-from src.utils.helpers import center_window, show_message, clear_frame
+from src.utils.background import TaskRunner
+from src.utils.helpers import center_window, show_message, clear_frame, show_loading
+from src.utils.typeahead import StudentSearch
+from src.utils.views import TreeRows, ViewManager
 from datetime import datetime
 
 class AdminDashboard:
-    def __init__(self, db_config, user_data):
+    STUDENT_PAGE_SIZE = 100
+    STUDENT_WINDOW = 500      # rows kept in the All Students tree while scrolling
+    
+    def __init__(self, master, db_config, user_data, on_close=None):
         self.db_config = db_config
         self.db_ops = DatabaseOperations(db_config)
         self.auth = Authentication(db_config)
         self.user_data = user_data
+        self.on_close = on_close
         
-        self.window = tk.Tk()
+        self.window = tk.Toplevel(master)
+        self.window.protocol('WM_DELETE_WINDOW', self.close)
         self.window.title("Admin Dashboard - Student Management System")
         self.window.geometry("1200x700")
+        self.tasks = TaskRunner(self.window, max_workers=db_config.pool_size)
         center_window(self.window, 1200, 700)
         
         self.setup_ui()
@@ -35,6 +45,7 @@ class AdminDashboard:
         buttons = [
             ("View Students", self.view_students),
             ("Add Student", self.add_student),
+            ("Import Students", self.import_students),
             ("Update Student", self.update_student),
             ("Delete Student", self.delete_student),
             ("Add Course", self.add_course),
@@ -50,57 +61,169 @@ class AdminDashboard:
         
         self.content_frame = tk.Frame(self.window, bg='white')
         self.content_frame.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True, padx=10, pady=10)
+        self.views = ViewManager(self.content_frame)
         
         self.view_students()
     
     def view_students(self):
-        clear_frame(self.content_frame)
-        
-        tk.Label(self.content_frame, text="All Students", font=('Arial', 16, 'bold'), 
+        self.views.show('students', self.build_students)
+    
+    def add_student(self):
+        self.views.show('add_student', self.build_add_student, max_age=0)
+    
+    def import_students(self):
+        self.views.show('import_students', self.build_import_students)
+    
+    def update_student(self):
+        self.views.show('update_student', self.build_update_student)
+    
+    def delete_student(self):
+        self.views.show('delete_student', self.build_delete_student)
+    
+    def add_course(self):
+        self.views.show('add_course', self.build_add_course)
+    
+    def add_subject(self):
+        self.views.show('add_subject', self.build_add_subject, max_age=0)
+    
+    # 🔹 Point a course combobox at the current course list, loaded in the background
+    def fill_courses(self, combo, course_dict):
+        def show(courses):
+            course_dict.clear()
+            course_dict.update({c['course_name']: c['course_id'] for c in courses})
+            combo.config(values=list(course_dict))
+            if course_dict and combo.get() not in course_dict:
+                combo.current(0)
+        
+        self.tasks.submit(self.db_ops.get_all_courses, show, self.show_load_error, 
+                          key=('courses', str(combo)))
+    
+    # 🔹 Each build_* creates its view once and returns the refresh() that reloads it in place
+    def build_students(self, frame):
+        tk.Label(frame, text="All Students", font=('Arial', 16, 'bold'), 
                 bg='white').pack(pady=10)
         
-        frame = tk.Frame(self.content_frame, bg='white')
-        frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        table_frame = tk.Frame(frame, bg='white')
+        table_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
         
-        scrollbar_y = tk.Scrollbar(frame)
+        scrollbar_y = tk.Scrollbar(table_frame)
         scrollbar_y.pack(side=tk.RIGHT, fill=tk.Y)
         
-        scrollbar_x = tk.Scrollbar(frame, orient=tk.HORIZONTAL)
+        scrollbar_x = tk.Scrollbar(table_frame, orient=tk.HORIZONTAL)
         scrollbar_x.pack(side=tk.BOTTOM, fill=tk.X)
         
         columns = ('ID', 'Roll No', 'Name', 'Email', 'Phone', 'Course', 'Semester', 'Status')
-        tree = ttk.Treeview(frame, columns=columns, show='headings', 
-                           yscrollcommand=scrollbar_y.set, xscrollcommand=scrollbar_x.set)
+        tree = ttk.Treeview(table_frame, columns=columns, show='headings', 
+                           xscrollcommand=scrollbar_x.set)
         
         for col in columns:
             tree.heading(col, text=col)
             tree.column(col, width=120)
         
-        scrollbar_y.config(command=tree.yview)
         scrollbar_x.config(command=tree.xview)
+        rows = TreeRows(tree)
+        
+        # Pages are fetched by keyset as the user scrolls near either end. At most
+        # STUDENT_WINDOW rows stay in the tree: pages far above or below the viewport are
+        # dropped and fetched again if the user scrolls back to them.
+        page = {'done': False, 'more_above': False, 'loading': False}
+        loading = show_loading(frame)
         
-        students = self.db_ops.get_all_students()
-        for student in students:
-            tree.insert('', tk.END, values=(
+        def entries(students):
+            return [(student['student_id'], (
                 student['student_id'],
                 student['roll_number'],
                 student['name'],
                 student['email'],
                 student['phone'],
-                student.get('course_name', 'N/A'),
+                student.get('course_name') or 'N/A',
                 student['semester'],
                 student['status']
-            ))
+            )) for student in students]
+        
+        def load(work, show):
+            page['loading'] = True
+            self.tasks.submit(work, lambda students: loaded(students, show), page_failed, key='students')
+        
+        def loaded(students, show):
+            page['loading'] = False
+            loading.pack_forget()
+            show(students)
+        
+        def page_failed(error):
+            page['loading'] = False
+            self.show_load_error(error)
+        
+        # 🔹 Apply change() while keeping the same rows in view; above = rows it adds (or,
+        # negative, removes) above them
+        def keep_view(above, change):
+            top = tree.yview()[0] * len(rows.rows)
+            change()
+            if rows.rows:
+                tree.yview_moveto(max(0, top + above) / len(rows.rows))
+        
+        def load_below():
+            if page['done'] or page['loading']:
+                return
+            shown = tree.get_children()
+            after_id = int(shown[-1]) if shown else None
+            load(lambda: self.db_ops.get_students_page(after_id, self.STUDENT_PAGE_SIZE), show_below)
+        
+        def show_below(students):
+            page['done'] = len(students) < self.STUDENT_PAGE_SIZE
+            rows.extend(entries(students))
+            excess = len(rows.rows) - self.STUDENT_WINDOW
+            if excess > 0:
+                keep_view(-excess, lambda: rows.remove(tree.get_children()[:excess]))
+                page['more_above'] = True
+        
+        def load_above():
+            if not page['more_above'] or page['loading']:
+                return
+            before_id = int(tree.get_children()[0])
+            load(lambda: self.db_ops.get_students_page(limit=self.STUDENT_PAGE_SIZE, before_id=before_id), 
+                 show_above)
+        
+        def show_above(students):
+            page['more_above'] = len(students) == self.STUDENT_PAGE_SIZE
+            keep_view(len(students), lambda: rows.prepend(entries(students)))
+            excess = len(rows.rows) - self.STUDENT_WINDOW
+            if excess > 0:
+                keep_view(0, lambda: rows.remove(tree.get_children()[-excess:]))
+                page['done'] = False
+        
+        # 🔹 Reload the rows currently in the tree with one query and diff them in
+        def refresh():
+            shown = tree.get_children()
+            after_id = int(shown[0]) - 1 if shown and page['more_above'] else None
+            limit = max(len(shown), self.STUDENT_PAGE_SIZE)
+            load(lambda: self.db_ops.get_students_page(after_id, limit), 
+                 lambda students: show_window(students, limit))
+        
+        def show_window(students, limit):
+            rows.update(entries(students))
+            page['done'] = len(students) < limit
+            if not students:
+                page['more_above'] = False
+        
+        def on_scroll(first, last):
+            scrollbar_y.set(first, last)
+            if float(last) >= 0.9:
+                load_below()
+            elif float(first) <= 0.1:
+                load_above()
+        
+        tree.config(yscrollcommand=on_scroll)
+        scrollbar_y.config(command=tree.yview)
         
         tree.pack(fill=tk.BOTH, expand=True)
+        return refresh
     
-    def add_student(self):
-        clear_frame(self.content_frame)
-        
-        tk.Label(self.content_frame, text="Add New Student", font=('Arial', 16, 'bold'), 
+    def build_add_student(self, frame):
+        tk.Label(frame, text="Add New Student", font=('Arial', 16, 'bold'), 
                 bg='white').pack(pady=10)
         
-        form_frame = tk.Frame(self.content_frame, bg='white')
+        form_frame = tk.Frame(frame, bg='white')
         form_frame.pack(pady=20)
         
         fields = {}
@@ -126,15 +249,11 @@ class AdminDashboard:
         
         tk.Label(form_frame, text="Course:", font=('Arial', 10), 
                 bg='white').grid(row=len(labels)+1, column=0, sticky='w', pady=5, padx=10)
-        courses = self.db_ops.get_all_courses()
-        course_dict = {f"{c['course_name']}": c['course_id'] for c in courses}
+        course_dict = {}
         course_var = tk.StringVar()
         course_combo = ttk.Combobox(form_frame, textvariable=course_var, 
-                                   values=list(course_dict.keys()), 
                                    state='readonly', font=('Arial', 10), width=28)
         course_combo.grid(row=len(labels)+1, column=1, pady=5, padx=10)
-        if course_dict:
-            course_combo.current(0)
         
         tk.Label(form_frame, text="Semester:", font=('Arial', 10), 
                 bg='white').grid(row=len(labels)+2, column=0, sticky='w', pady=5, padx=10)
@@ -153,11 +272,6 @@ class AdminDashboard:
                     show_message("Error", "Username and password are required!", "error")
                     return
                 
-                user_id = self.auth.create_user(username, password, 'student')
-                if not user_id:
-                    show_message("Error", "Username already exists!", "error")
-                    return
-                
                 roll_number = fields['Roll Number'].get().strip()
                 name = fields['Name'].get().strip()
                 email = fields['Email'].get().strip()
@@ -167,33 +281,126 @@ class AdminDashboard:
                 gender = gender_var.get()
                 course_id = course_dict[course_var.get()]
                 semester = int(semester_var.get())
-                
-                self.db_ops.add_student(user_id, roll_number, name, email, phone, 
-                                       dob, gender, address, course_id, semester)
-                show_message("Success", "Student added successfully!", "success")
-                self.view_students()
             except Exception as e:
                 show_message("Error", f"Failed to add student: {str(e)}", "error")
+                return
+            
+            # 🔹 Both rows or neither: a rejected student must not leave its login behind
+            def work():
+                with self.db_config.transaction():
+                    user_id = self.auth.create_user(username, password, 'student')
+                    self.db_ops.add_student(user_id, roll_number, name, email, phone, 
+                                           dob, gender, address, course_id, semester)
+            
+            def added(result):
+                show_message("Success", "Student added successfully!", "success")
+                for field in fields.values():
+                    field.delete(0, tk.END)
+                self.views.invalidate('students')
+                self.view_students()
+            
+            def failed(e):
+                if isinstance(e, self.db_config.Error):
+                    show_message("Error", f"Failed to add student (username or roll number may already exist): {e}", "error")
+                else:
+                    show_message("Error", f"Failed to add student: {str(e)}", "error")
+            
+            self.tasks.submit(work, added, failed)
         
         tk.Button(form_frame, text="Add Student", command=submit, bg='#27ae60', 
                  fg='white', font=('Arial', 11, 'bold'), width=20, cursor='hand2').grid(
                  row=len(labels)+3, column=0, columnspan=2, pady=20)
+        
+        return lambda: self.fill_courses(course_combo, course_dict)
     
-    def update_student(self):
-        clear_frame(self.content_frame)
+    def build_import_students(self, frame):
+        tk.Label(frame, text="Import Students from CSV", font=('Arial', 16, 'bold'), 
+                bg='white').pack(pady=10)
         
-        tk.Label(self.content_frame, text="Update Student", font=('Arial', 16, 'bold'), 
+        tk.Label(frame, text="Columns: " + ", ".join(REQUIRED_COLUMNS) + 
+                " (optional: " + ", ".join(OPTIONAL_COLUMNS) + ")", font=('Arial', 9), 
+                bg='white', fg='gray', wraplength=800).pack(pady=5)
+        
+        status_label = tk.Label(frame, text="", font=('Arial', 11), bg='white')
+        
+        columns = ('Line', 'Roll No', 'Error')
+        tree = ttk.Treeview(frame, columns=columns, show='headings', height=15)
+        for col in columns:
+            tree.heading(col, text=col)
+        tree.column('Line', width=80)
+        tree.column('Roll No', width=150)
+        tree.column('Error', width=550)
+        
+        state = {'result': None}
+        
+        def save_report():
+            path = filedialog.asksaveasfilename(defaultextension='.csv', filetypes=[('CSV files', '*.csv')])
+            if path:
+                state['result'].write_error_report(path)
+                show_message("Success", f"Error report saved to {path}", "success")
+        
+        report_button = tk.Button(frame, text="Save Error Report", command=save_report, 
+                                 bg='#3498db', fg='white', font=('Arial', 10), cursor='hand2')
+        
+        def show_progress(counts):
+            processed, imported, failed = counts
+            status_label.config(text=f"Processed {processed:,} rows: {imported:,} imported, {failed:,} rejected")
+        
+        def finished(result):
+            import_button.config(state=tk.NORMAL)
+            if result is None:
+                show_message("Error", "Could not connect to the database", "error")
+                return
+            state['result'] = result
+            status_label.config(text=f"Imported {result.imported:,} of {result.processed:,} students, "
+                                     f"{result.failed:,} rejected")
+            for line, roll_number, error in result.errors:
+                tree.insert('', tk.END, values=(line, roll_number, error))
+            if result.errors:
+                report_button.pack(pady=5)
+            if result.imported:
+                self.views.invalidate('students')
+        
+        def failed(error):
+            import_button.config(state=tk.NORMAL)
+            show_message("Error", f"Import failed: {error}", "error")
+        
+        def choose_file():
+            path = filedialog.askopenfilename(filetypes=[('CSV files', '*.csv'), ('All files', '*.*')])
+            if not path:
+                return
+            import_button.config(state=tk.DISABLED)
+            tree.delete(*tree.get_children())
+            report_button.pack_forget()
+            status_label.config(text="Importing...")
+            
+            report = self.tasks.reporter(show_progress)
+            importer = StudentImporter(self.db_config)
+            self.tasks.submit(lambda: importer.import_csv(path, lambda *counts: report(counts)), 
+                              finished, failed)
+        
+        import_button = tk.Button(frame, text="Choose CSV File...", command=choose_file, 
+                                 bg='#27ae60', fg='white', font=('Arial', 11, 'bold'), width=20, 
+                                 cursor='hand2')
+        import_button.pack(pady=10)
+        status_label.pack(pady=5)
+        tree.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+    
+    def build_update_student(self, frame):
+        tk.Label(frame, text="Update Student", font=('Arial', 16, 'bold'), 
                 bg='white').pack(pady=10)
         
-        search_frame = tk.Frame(self.content_frame, bg='white')
+        search_frame = tk.Frame(frame, bg='white')
         search_frame.pack(pady=10)
         
         tk.Label(search_frame, text="Roll Number:", font=('Arial', 10), 
                 bg='white').pack(side=tk.LEFT, padx=5)
-        roll_entry = tk.Entry(search_frame, font=('Arial', 10), width=20)
+        # Type a roll number, name or email and pick the student from the suggestions
+        roll_entry = StudentSearch(search_frame, self.tasks, self.db_ops, 
+                                   on_select=lambda student: search_student(), width=20)
         roll_entry.pack(side=tk.LEFT, padx=5)
         
-        form_frame = tk.Frame(self.content_frame, bg='white')
+        form_frame = tk.Frame(frame, bg='white')
         form_frame.pack(pady=20)
         
         fields = {}
@@ -201,8 +408,12 @@ class AdminDashboard:
         def search_student():
             clear_frame(form_frame)
             roll_number = roll_entry.get().strip()
-            student = self.db_ops.get_student_by_roll(roll_number)
-            
+            # A newer search supersedes one still in flight
+            self.tasks.submit(lambda: self.db_ops.get_student_by_roll(roll_number), show_student, 
+                              self.show_load_error, key='update_student')
+        
+        def show_student(student):
+            clear_frame(form_frame)
             if not student:
                 show_message("Error", "Student not found!", "error")
                 return
@@ -226,13 +437,22 @@ class AdminDashboard:
                     phone = fields['Phone'].get().strip()
                     address = fields['Address'].get().strip()
                     semester = int(fields['Semester'].get().strip())
-                    
-                    self.db_ops.update_student(student['student_id'], name, email, 
-                                              phone, address, semester)
-                    show_message("Success", "Student updated successfully!", "success")
-                    self.view_students()
                 except Exception as e:
                     show_message("Error", f"Failed to update: {str(e)}", "error")
+                    return
+                
+                def updated(result):
+                    if result is None:
+                        show_message("Error", "Failed to update student!", "error")
+                        return
+                    show_message("Success", "Student updated successfully!", "success")
+                    self.views.invalidate('students')
+                    self.view_students()
+                
+                self.tasks.submit(lambda: self.db_ops.update_student(student['student_id'], name, email, 
+                                                                     phone, address, semester), 
+                                  updated, 
+                                  lambda e: show_message("Error", f"Failed to update: {str(e)}", "error"))
             
             tk.Button(form_frame, text="Update", command=update, bg='#3498db', 
                      fg='white', font=('Arial', 11, 'bold'), width=20, 
@@ -241,53 +461,61 @@ class AdminDashboard:
         tk.Button(search_frame, text="Search", command=search_student, bg='#3498db', 
                  fg='white', font=('Arial', 10, 'bold'), cursor='hand2').pack(side=tk.LEFT, padx=5)
     
-    def delete_student(self):
-        clear_frame(self.content_frame)
-        
-        tk.Label(self.content_frame, text="Delete Student", font=('Arial', 16, 'bold'), 
+    def build_delete_student(self, frame):
+        tk.Label(frame, text="Delete Student", font=('Arial', 16, 'bold'), 
                 bg='white').pack(pady=10)
         
-        frame = tk.Frame(self.content_frame, bg='white')
-        frame.pack(pady=20)
+        form_frame = tk.Frame(frame, bg='white')
+        form_frame.pack(pady=20)
         
-        tk.Label(frame, text="Roll Number:", font=('Arial', 10), 
+        tk.Label(form_frame, text="Roll Number:", font=('Arial', 10), 
                 bg='white').grid(row=0, column=0, pady=5, padx=10)
-        roll_entry = tk.Entry(frame, font=('Arial', 10), width=30)
+        roll_entry = StudentSearch(form_frame, self.tasks, self.db_ops, width=30)
         roll_entry.grid(row=0, column=1, pady=5, padx=10)
         
         def delete():
             roll_number = roll_entry.get().strip()
-            student = self.db_ops.get_student_by_roll(roll_number)
-            
+            self.tasks.submit(lambda: self.db_ops.get_student_by_roll(roll_number), confirm, 
+                              self.show_load_error, key='delete_student')
+        
+        def confirm(student):
             if not student:
                 show_message("Error", "Student not found!", "error")
                 return
             
-            if messagebox.askyesno("Confirm", f"Delete student {student['name']}?"):
-                self.db_ops.delete_student(student['student_id'])
+            if not messagebox.askyesno("Confirm", f"Delete student {student['name']}?"):
+                return
+            
+            def deleted(result):
+                if result is None:
+                    show_message("Error", "Failed to delete student!", "error")
+                    return
                 show_message("Success", "Student deleted successfully!", "success")
+                roll_entry.delete(0, tk.END)
+                self.views.invalidate('students')
                 self.view_students()
+            
+            self.tasks.submit(lambda: self.db_ops.delete_student(student['student_id']), deleted, 
+                              lambda e: show_message("Error", f"Failed to delete: {str(e)}", "error"))
         
-        tk.Button(frame, text="Delete", command=delete, bg='#e74c3c', 
+        tk.Button(form_frame, text="Delete", command=delete, bg='#e74c3c', 
                  fg='white', font=('Arial', 11, 'bold'), width=20, 
                  cursor='hand2').grid(row=1, column=0, columnspan=2, pady=20)
     
-    def add_course(self):
-        clear_frame(self.content_frame)
-        
-        tk.Label(self.content_frame, text="Add New Course", font=('Arial', 16, 'bold'), 
+    def build_add_course(self, frame):
+        tk.Label(frame, text="Add New Course", font=('Arial', 16, 'bold'), 
                 bg='white').pack(pady=10)
         
-        frame = tk.Frame(self.content_frame, bg='white')
-        frame.pack(pady=20)
+        form_frame = tk.Frame(frame, bg='white')
+        form_frame.pack(pady=20)
         
         fields = {}
         labels = ['Course Code', 'Course Name', 'Duration (Years)', 'Department']
         
         for i, label in enumerate(labels):
-            tk.Label(frame, text=label + ":", font=('Arial', 10), 
+            tk.Label(form_frame, text=label + ":", font=('Arial', 10), 
                     bg='white').grid(row=i, column=0, sticky='w', pady=5, padx=10)
-            entry = tk.Entry(frame, font=('Arial', 10), width=30)
+            entry = tk.Entry(form_frame, font=('Arial', 10), width=30)
             entry.grid(row=i, column=1, pady=5, padx=10)
             fields[label] = entry
         
@@ -297,61 +525,62 @@ class AdminDashboard:
                 name = fields['Course Name'].get().strip()
                 duration = int(fields['Duration (Years)'].get().strip())
                 department = fields['Department'].get().strip()
-                
-                self.db_ops.add_course(code, name, duration, department)
+            except Exception as e:
+                show_message("Error", f"Failed to add course: {str(e)}", "error")
+                return
+            
+            def added(result):
+                if result is None:
+                    show_message("Error", "Failed to add course (the course code may already exist)!", "error")
+                    return
                 show_message("Success", "Course added successfully!", "success")
                 for field in fields.values():
                     field.delete(0, tk.END)
-            except Exception as e:
-                show_message("Error", f"Failed to add course: {str(e)}", "error")
+            
+            self.tasks.submit(lambda: self.db_ops.add_course(code, name, duration, department), added, 
+                              lambda e: show_message("Error", f"Failed to add course: {str(e)}", "error"))
         
-        tk.Button(frame, text="Add Course", command=submit, bg='#27ae60', 
+        tk.Button(form_frame, text="Add Course", command=submit, bg='#27ae60', 
                  fg='white', font=('Arial', 11, 'bold'), width=20, 
                  cursor='hand2').grid(row=len(labels), column=0, columnspan=2, pady=20)
     
-    def add_subject(self):
-        clear_frame(self.content_frame)
-        
-        tk.Label(self.content_frame, text="Add New Subject", font=('Arial', 16, 'bold'), 
+    def build_add_subject(self, frame):
+        tk.Label(frame, text="Add New Subject", font=('Arial', 16, 'bold'), 
                 bg='white').pack(pady=10)
         
-        frame = tk.Frame(self.content_frame, bg='white')
-        frame.pack(pady=20)
+        form_frame = tk.Frame(frame, bg='white')
+        form_frame.pack(pady=20)
         
-        tk.Label(frame, text="Subject Code:", font=('Arial', 10), 
+        tk.Label(form_frame, text="Subject Code:", font=('Arial', 10), 
                 bg='white').grid(row=0, column=0, sticky='w', pady=5, padx=10)
-        code_entry = tk.Entry(frame, font=('Arial', 10), width=30)
+        code_entry = tk.Entry(form_frame, font=('Arial', 10), width=30)
         code_entry.grid(row=0, column=1, pady=5, padx=10)
         
-        tk.Label(frame, text="Subject Name:", font=('Arial', 10), 
+        tk.Label(form_frame, text="Subject Name:", font=('Arial', 10), 
                 bg='white').grid(row=1, column=0, sticky='w', pady=5, padx=10)
-        name_entry = tk.Entry(frame, font=('Arial', 10), width=30)
+        name_entry = tk.Entry(form_frame, font=('Arial', 10), width=30)
         name_entry.grid(row=1, column=1, pady=5, padx=10)
         
-        tk.Label(frame, text="Course:", font=('Arial', 10), 
+        tk.Label(form_frame, text="Course:", font=('Arial', 10), 
                 bg='white').grid(row=2, column=0, sticky='w', pady=5, padx=10)
-        courses = self.db_ops.get_all_courses()
-        course_dict = {f"{c['course_name']}": c['course_id'] for c in courses}
+        course_dict = {}
         course_var = tk.StringVar()
-        course_combo = ttk.Combobox(frame, textvariable=course_var, 
-                                   values=list(course_dict.keys()), 
+        course_combo = ttk.Combobox(form_frame, textvariable=course_var, 
                                    state='readonly', font=('Arial', 10), width=28)
         course_combo.grid(row=2, column=1, pady=5, padx=10)
-        if course_dict:
-            course_combo.current(0)
         
-        tk.Label(frame, text="Credits:", font=('Arial', 10), 
+        tk.Label(form_frame, text="Credits:", font=('Arial', 10), 
                 bg='white').grid(row=3, column=0, sticky='w', pady=5, padx=10)
         credits_var = tk.StringVar(value='3')
-        credits_combo = ttk.Combobox(frame, textvariable=credits_var, 
+        credits_combo = ttk.Combobox(form_frame, textvariable=credits_var, 
                                     values=['1', '2', '3', '4', '5'], 
                                     state='readonly', font=('Arial', 10), width=28)
         credits_combo.grid(row=3, column=1, pady=5, padx=10)
         
-        tk.Label(frame, text="Semester:", font=('Arial', 10), 
+        tk.Label(form_frame, text="Semester:", font=('Arial', 10), 
                 bg='white').grid(row=4, column=0, sticky='w', pady=5, padx=10)
         semester_var = tk.StringVar(value='1')
-        semester_combo = ttk.Combobox(frame, textvariable=semester_var, 
+        semester_combo = ttk.Combobox(form_frame, textvariable=semester_var, 
                                      values=['1', '2', '3', '4', '5', '6', '7', '8'], 
                                      state='readonly', font=('Arial', 10), width=28)
         semester_combo.grid(row=4, column=1, pady=5, padx=10)
@@ -363,21 +592,37 @@ class AdminDashboard:
                 course_id = course_dict[course_var.get()]
                 credits = int(credits_var.get())
                 semester = int(semester_var.get())
-                
-                self.db_ops.add_subject(code, name, course_id, credits, semester)
+            except Exception as e:
+                show_message("Error", f"Failed to add subject: {str(e)}", "error")
+                return
+            
+            def added(result):
+                if result is None:
+                    show_message("Error", "Failed to add subject (the subject code may already exist)!", "error")
+                    return
                 show_message("Success", "Subject added successfully!", "success")
                 code_entry.delete(0, tk.END)
                 name_entry.delete(0, tk.END)
-            except Exception as e:
-                show_message("Error", f"Failed to add subject: {str(e)}", "error")
+            
+            self.tasks.submit(lambda: self.db_ops.add_subject(code, name, course_id, credits, semester), added, 
+                              lambda e: show_message("Error", f"Failed to add subject: {str(e)}", "error"))
         
-        tk.Button(frame, text="Add Subject", command=submit, bg='#27ae60', 
+        tk.Button(form_frame, text="Add Subject", command=submit, bg='#27ae60', 
                  fg='white', font=('Arial', 11, 'bold'), width=20, 
                  cursor='hand2').grid(row=5, column=0, columnspan=2, pady=20)
+        
+        return lambda: self.fill_courses(course_combo, course_dict)
+    
+    def show_load_error(self, error):
+        show_message("Error", f"Failed to load data: {error}", "error")
     
     def logout(self):
         if messagebox.askyesno("Confirm", "Are you sure you want to logout?"):
-            self.window.destroy()
+            self.close()
     
-    def run(self):
-        self.window.mainloop()
+    # 🔹 Close the dashboard and hand control back to the login window
+    def close(self):
+        self.tasks.shutdown()
+        self.window.destroy()
+        if self.on_close:
+            self.on_close()
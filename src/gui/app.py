@@ -0,0 +1,159 @@
+import importlib
+import time
+import tkinter as tk
+from tkinter import messagebox
+from src.gui.login_window import LoginWindow
+from src.utils.background import TaskRunner
+
+# role: (module, class). A dashboard module is imported the first time someone of that role logs in.
+DASHBOARDS = {
+    'admin': ('src.gui.admin_dashboard', 'AdminDashboard'),
+    'faculty': ('src.gui.faculty_dashboard', 'FacultyDashboard'),
+    'student': ('src.gui.student_dashboard', 'StudentDashboard'),
+}
+
+# One Tk root for the whole session. It holds the login form; dashboards open as Toplevel
+# windows over it and the login form comes back when they close. The database is opened
+# in the background (open_database() builds the DatabaseConfig, which loads the driver)
+# while the login form is already on screen.
+class Application:
+    def __init__(self, open_database, timer):
+        self.open_database = open_database
+        self.timer = timer
+        self.db_config = None
+        self.dashboard = None
+        self.exit_code = 0
+        self._dashboards = {}
+
+        self.root = tk.Tk()
+        self.root.protocol('WM_DELETE_WINDOW', self.quit)
+        self.tasks = TaskRunner(self.root, max_workers=1)
+        self.login = LoginWindow(self.root, self.open_dashboard, self.tasks)
+        self.timer.mark('login window built')
+        self.root.after_idle(lambda: self.timer.mark('login window shown'))
+
+        self.connect()
+
+    # 🔹 Open the database in the background; login is enabled when it is ready
+    def connect(self):
+        print("Checking database connection...")
+        self.login.set_status("Connecting to database...")
+
+        # Returns (db_config, status): 'ready', 'unreachable' or 'unmigrated'
+        def work():
+            db_config = self.db_config or self.open_database()
+            if db_config.connect() is None:
+                return db_config, 'unreachable'
+            if db_config.migrate() is None:
+                return db_config, 'unmigrated'
+            return db_config, 'ready'
+
+        self.tasks.submit(work, self.connect_finished, self.fail)
+
+    def connect_finished(self, result):
+        self.db_config, status = result
+        if status == 'ready':
+            self.connected()
+            return
+        if status == 'unmigrated':
+            # Logging in against an out-of-date schema would only fail later, less clearly
+            self.fail("the schema migrations could not be applied (see the console for details)")
+            return
+
+        backend = self.db_config.backend
+        print(f"\nERROR: Could not connect to {backend.label} database!")
+        hint = ""
+        if backend.name == 'mysql':
+            print("\nPlease ensure:")
+            print("  1. MySQL server is running")
+            print("  2. Database credentials are correct in src/database/db_config.py")
+            print("  3. Database 'student_management' exists or will be created\n")
+            hint = "\n\nMake sure MySQL is running and credentials are correct."
+
+        if not messagebox.askyesno(
+            "Database Connection Error",
+            f"Could not connect to {backend.label} database!\n\n"
+            f"Would you like to initialize the database?{hint}",
+            parent=self.root
+        ):
+            self.exit(1)
+            return
+
+        print("\nAttempting to initialize database...")
+        self.login.set_status("Initializing database...")
+
+        # initialize_database() opens the pool itself and applies every migration
+        def initialized(ok):
+            if not ok:
+                print(f"Failed to initialize database. Please check the {backend.label} connection.")
+                self.exit(1)
+                return
+            self.connected()
+
+        self.tasks.submit(self.db_config.initialize_database, initialized, self.fail)
+
+    def connected(self):
+        self.timer.mark('database connected')
+        print("Database connected successfully!\n")
+
+        print("Default Login Credentials:")
+        print("-" * 40)
+        print("Admin:")
+        print("  Username: admin")
+        print("  Password: admin123")
+        print("\nNote: You can add faculty and students through admin panel")
+        print("-" * 40 + "\n")
+
+        self.login.set_ready(self.db_config)
+
+    def fail(self, error):
+        print(f"\nERROR: Could not open the database: {error}")
+        messagebox.showerror("Database Error", f"Could not open the database:\n\n{error}", parent=self.root)
+        self.exit(1)
+
+    # 🔹 Dashboard class for role, importing its module on first use
+    def dashboard_class(self, role):
+        if role not in self._dashboards:
+            module_name, class_name = DASHBOARDS[role]
+            start = time.perf_counter()
+            module = importlib.import_module(module_name)
+            self.timer.record(f"import {module_name}", time.perf_counter() - start)
+            self._dashboards[role] = getattr(module, class_name)
+        return self._dashboards[role]
+
+    def open_dashboard(self, user_data):
+        role = user_data['role']
+        if role not in DASHBOARDS:
+            return
+
+        print("\nLogin successful!")
+        print(f"Role: {role}")
+        print(f"Username: {user_data['username']}")
+        print(f"Opening {role.title()} Dashboard...")
+
+        start = time.perf_counter()
+        dashboard_class = self.dashboard_class(role)
+        self.root.withdraw()
+        self.dashboard = dashboard_class(self.root, self.db_config, user_data, on_close=self.dashboard_closed)
+        self.root.after_idle(lambda: self.timer.record(f"{role} dashboard shown", time.perf_counter() - start))
+
+    def dashboard_closed(self):
+        print("\nDashboard closed. Returning to login...")
+        self.dashboard = None
+        self.login.reset()
+        self.root.deiconify()
+
+    def quit(self):
+        print("\nLogin cancelled. Exiting application...")
+        self.exit(0)
+
+    def exit(self, code):
+        self.exit_code = code
+        self.tasks.shutdown()
+        self.root.destroy()
+
+    # 🔹 Run until the login window is closed; returns the process exit code
+    def run(self):
+        self.root.mainloop()
+        self.tasks.shutdown()
+        return self.exit_code
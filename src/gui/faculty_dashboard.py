@@ -1,19 +1,25 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
 from src.database.db_operations import DatabaseOperations
-from src.utils.helpers import center_window, show_message, clear_frame, get_current_date
+from src.utils.background import TaskRunner
+from src.utils.helpers import center_window, show_message, show_loading, get_current_date
+from src.utils.typeahead import StudentSearch
+from src.utils.views import TreeRows, ViewManager
 from datetime import datetime
 
 class FacultyDashboard:
-    def __init__(self, db_config, user_data):
+    def __init__(self, master, db_config, user_data, on_close=None):
         self.db_config = db_config
         self.db_ops = DatabaseOperations(db_config)
         self.user_data = user_data
+        self.on_close = on_close
         self.faculty_id = user_data['details']['faculty_id'] if user_data['details'] else None
         
-        self.window = tk.Tk()
+        self.window = tk.Toplevel(master)
+        self.window.protocol('WM_DELETE_WINDOW', self.close)
         self.window.title("Faculty Dashboard - Student Management System")
         self.window.geometry("1200x700")
+        self.tasks = TaskRunner(self.window, max_workers=db_config.pool_size)
         center_window(self.window, 1200, 700)
         
         self.setup_ui()
@@ -34,8 +40,10 @@ class FacultyDashboard:
         
         buttons = [
             ("Mark Attendance", self.mark_attendance),
+            ("Class Attendance", self.mark_class_attendance),
             ("View Attendance", self.view_attendance),
             ("Enter Marks", self.enter_marks),
+            ("Marks Sheet", self.enter_marks_sheet),
             ("View Marks", self.view_marks),
             ("Logout", self.logout)
         ]
@@ -48,36 +56,65 @@ class FacultyDashboard:
         
         self.content_frame = tk.Frame(self.window, bg='white')
         self.content_frame.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True, padx=10, pady=10)
+        self.views = ViewManager(self.content_frame)
         
         self.show_welcome()
     
     def show_welcome(self):
-        clear_frame(self.content_frame)
-        tk.Label(self.content_frame, text="Faculty Dashboard", 
+        self.views.show('welcome', self.build_welcome)
+    
+    def mark_attendance(self):
+        self.views.show('mark_attendance', self.build_mark_attendance, max_age=0)
+    
+    def mark_class_attendance(self):
+        self.views.show('class_attendance', self.build_mark_class_attendance, max_age=0)
+    
+    def view_attendance(self):
+        self.views.show('view_attendance', self.build_view_attendance)
+    
+    def enter_marks(self):
+        self.views.show('enter_marks', self.build_enter_marks, max_age=0)
+    
+    def enter_marks_sheet(self):
+        self.views.show('marks_sheet', self.build_enter_marks_sheet, max_age=0)
+    
+    def view_marks(self):
+        self.views.show('view_marks', self.build_view_marks)
+    
+    # 🔹 Point a subject combobox at the current subject list, loaded in the background
+    def fill_subjects(self, combo, subject_dict):
+        def show(subjects):
+            subject_dict.clear()
+            subject_dict.update({f"{s['subject_code']} - {s['subject_name']}": s['subject_id'] 
+                                 for s in subjects})
+            combo.config(values=list(subject_dict))
+            if subject_dict and combo.get() not in subject_dict:
+                combo.current(0)
+        
+        self.tasks.submit(self.db_ops.get_all_subjects, show, self.show_load_error, 
+                          key=('subjects', str(combo)))
+    
+    # 🔹 Each build_* creates its view once and returns the refresh() that reloads it in place
+    def build_welcome(self, frame):
+        tk.Label(frame, text="Faculty Dashboard", 
                 font=('Arial', 20, 'bold'), bg='white').pack(pady=50)
-        tk.Label(self.content_frame, text="Select an option from the menu", 
+        tk.Label(frame, text="Select an option from the menu", 
                 font=('Arial', 12), bg='white', fg='gray').pack()
     
-    def mark_attendance(self):
-        clear_frame(self.content_frame)
-        
-        tk.Label(self.content_frame, text="Mark Attendance", font=('Arial', 16, 'bold'), 
+    def build_mark_attendance(self, frame):
+        tk.Label(frame, text="Mark Attendance", font=('Arial', 16, 'bold'), 
                 bg='white').pack(pady=10)
         
-        form_frame = tk.Frame(self.content_frame, bg='white')
+        form_frame = tk.Frame(frame, bg='white')
         form_frame.pack(pady=20)
         
         tk.Label(form_frame, text="Subject:", font=('Arial', 10), 
                 bg='white').grid(row=0, column=0, sticky='w', pady=5, padx=10)
-        subjects = self.db_ops.get_all_subjects()
-        subject_dict = {f"{s['subject_code']} - {s['subject_name']}": s['subject_id'] for s in subjects}
+        subject_dict = {}
         subject_var = tk.StringVar()
         subject_combo = ttk.Combobox(form_frame, textvariable=subject_var, 
-                                    values=list(subject_dict.keys()), 
                                     state='readonly', font=('Arial', 10), width=40)
         subject_combo.grid(row=0, column=1, pady=5, padx=10)
-        if subject_dict:
-            subject_combo.current(0)
         
         tk.Label(form_frame, text="Date:", font=('Arial', 10), 
                 bg='white').grid(row=1, column=0, sticky='w', pady=5, padx=10)
@@ -87,7 +124,7 @@ class FacultyDashboard:
         
         tk.Label(form_frame, text="Roll Number:", font=('Arial', 10), 
                 bg='white').grid(row=2, column=0, sticky='w', pady=5, padx=10)
-        roll_entry = tk.Entry(form_frame, font=('Arial', 10), width=42)
+        roll_entry = StudentSearch(form_frame, self.tasks, self.db_ops, width=42)
         roll_entry.grid(row=2, column=1, pady=5, padx=10)
         
         tk.Label(form_frame, text="Status:", font=('Arial', 10), 
@@ -101,107 +138,240 @@ class FacultyDashboard:
         def submit():
             try:
                 roll_number = roll_entry.get().strip()
+                subject_id = subject_dict[subject_var.get()]
+                date = date_entry.get().strip()
+                status = status_var.get()
+            except Exception as e:
+                show_message("Error", f"Failed to mark attendance: {str(e)}", "error")
+                return
+            
+            # 🔹 Lookup and write both run in the background; (student, result) comes back
+            def work():
                 student = self.db_ops.get_student_by_roll(roll_number)
-                
+                if not student:
+                    return None, None
+                return student, self.db_ops.mark_attendance(student['student_id'], subject_id, date, 
+                                                            status, self.faculty_id)
+            
+            def marked(data):
+                student, result = data
                 if not student:
                     show_message("Error", "Student not found!", "error")
                     return
-                
-                subject_id = subject_dict[subject_var.get()]
-                date = date_entry.get().strip()
-                status = status_var.get()
-                
-                self.db_ops.mark_attendance(student['student_id'], subject_id, date, 
-                                           status, self.faculty_id)
+                if result is None:
+                    show_message("Error", "Failed to mark attendance!", "error")
+                    return
                 show_message("Success", "Attendance marked successfully!", "success")
                 roll_entry.delete(0, tk.END)
-            except Exception as e:
-                show_message("Error", f"Failed to mark attendance: {str(e)}", "error")
+            
+            self.tasks.submit(work, marked, 
+                              lambda e: show_message("Error", f"Failed to mark attendance: {str(e)}", "error"))
         
         tk.Button(form_frame, text="Mark Attendance", command=submit, bg='#27ae60', 
                  fg='white', font=('Arial', 11, 'bold'), width=20, 
                  cursor='hand2').grid(row=4, column=0, columnspan=2, pady=20)
+        
+        return lambda: self.fill_subjects(subject_combo, subject_dict)
     
-    def view_attendance(self):
-        clear_frame(self.content_frame)
+    def build_mark_class_attendance(self, frame):
+        tk.Label(frame, text="Class Attendance", font=('Arial', 16, 'bold'), 
+                bg='white').pack(pady=10)
+        
+        form_frame = tk.Frame(frame, bg='white')
+        form_frame.pack(pady=10)
         
-        tk.Label(self.content_frame, text="View Attendance", font=('Arial', 16, 'bold'), 
+        tk.Label(form_frame, text="Subject:", font=('Arial', 10), 
+                bg='white').grid(row=0, column=0, sticky='w', pady=5, padx=10)
+        subject_dict = {}
+        subject_var = tk.StringVar()
+        subject_combo = ttk.Combobox(form_frame, textvariable=subject_var, 
+                                    state='readonly', font=('Arial', 10), width=40)
+        subject_combo.grid(row=0, column=1, pady=5, padx=10)
+        
+        tk.Label(form_frame, text="Date:", font=('Arial', 10), 
+                bg='white').grid(row=1, column=0, sticky='w', pady=5, padx=10)
+        date_entry = tk.Entry(form_frame, font=('Arial', 10), width=42)
+        date_entry.insert(0, get_current_date())
+        date_entry.grid(row=1, column=1, pady=5, padx=10)
+        
+        roster_frame = tk.Frame(frame, bg='white')
+        roster_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
+        
+        scrollbar = tk.Scrollbar(roster_frame)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        
+        columns = ('Roll No', 'Name', 'Status')
+        tree = ttk.Treeview(roster_frame, columns=columns, show='headings', 
+                           yscrollcommand=scrollbar.set, selectmode='extended')
+        for col in columns:
+            tree.heading(col, text=col)
+            tree.column(col, width=200)
+        scrollbar.config(command=tree.yview)
+        tree.pack(fill=tk.BOTH, expand=True)
+        
+        # Loaded roster, keyed by student_id (also used as the Treeview iid), and the
+        # subject/date it was loaded for, which is what Save writes against
+        roster = {}
+        loaded = {'subject_id': None, 'date': None, 'loading': None}
+        
+        def clear_roster():
+            if loaded['loading'] is not None:
+                loaded['loading'].destroy()
+                loaded['loading'] = None
+            tree.delete(*tree.get_children())
+            roster.clear()
+            loaded['subject_id'] = loaded['date'] = None
+        
+        def load_roster():
+            clear_roster()
+            if not subject_var.get():
+                show_message("Error", "Please select a subject!", "error")
+                return
+            
+            subject_id = subject_dict[subject_var.get()]
+            date = date_entry.get().strip()
+            loaded['loading'] = show_loading(roster_frame)
+            
+            def show(students):
+                clear_roster()
+                if not students:
+                    show_message("Info", "No active students found for this subject.", "info")
+                    return
+                
+                loaded['subject_id'], loaded['date'] = subject_id, date
+                for student in students:
+                    status = student['status'] or 'Present'
+                    roster[student['student_id']] = status
+                    tree.insert('', tk.END, iid=str(student['student_id']), 
+                               values=(student['roll_number'], student['name'], status))
+            
+            # A newer load supersedes one still in flight, so only one roster is ever shown
+            self.tasks.submit(lambda: self.db_ops.get_class_roster(subject_id, date), show, 
+                              self.show_load_error, key='class_roster')
+        
+        def set_status(status, items=None):
+            for iid in items if items is not None else tree.selection():
+                roster[int(iid)] = status
+                tree.set(iid, 'Status', status)
+        
+        def save():
+            if not roster:
+                show_message("Error", "Load the class roster first!", "error")
+                return
+            subject_id, date = loaded['subject_id'], loaded['date']
+            statuses = list(roster.items())
+            
+            def saved(result):
+                if result is None:
+                    show_message("Error", "Failed to save attendance!", "error")
+                    return
+                show_message("Success", f"Attendance saved for {len(statuses)} students!", "success")
+            
+            self.tasks.submit(
+                lambda: self.db_ops.mark_attendance_bulk(subject_id, date, statuses, self.faculty_id), 
+                saved, 
+                lambda e: show_message("Error", f"Failed to mark attendance: {str(e)}", "error"))
+        
+        button_frame = tk.Frame(frame, bg='white')
+        button_frame.pack(pady=10)
+        
+        tk.Button(button_frame, text="Load Roster", command=load_roster, bg='#3498db', 
+                 fg='white', font=('Arial', 10, 'bold'), cursor='hand2').pack(side=tk.LEFT, padx=5)
+        for status, color in (('Present', '#27ae60'), ('Absent', '#e74c3c'), ('Leave', '#f39c12')):
+            tk.Button(button_frame, text=f"Mark {status}", command=lambda st=status: set_status(st), 
+                     bg=color, fg='white', font=('Arial', 10), cursor='hand2').pack(side=tk.LEFT, padx=5)
+        tk.Button(button_frame, text="All Present", 
+                 command=lambda: set_status('Present', tree.get_children()), bg='#16a085', 
+                 fg='white', font=('Arial', 10), cursor='hand2').pack(side=tk.LEFT, padx=5)
+        tk.Button(button_frame, text="Save Attendance", command=save, bg='#27ae60', 
+                 fg='white', font=('Arial', 11, 'bold'), width=18, 
+                 cursor='hand2').pack(side=tk.LEFT, padx=15)
+        
+        return lambda: self.fill_subjects(subject_combo, subject_dict)
+    
+    def build_view_attendance(self, frame):
+        tk.Label(frame, text="View Attendance", font=('Arial', 16, 'bold'), 
                 bg='white').pack(pady=10)
         
-        search_frame = tk.Frame(self.content_frame, bg='white')
+        search_frame = tk.Frame(frame, bg='white')
         search_frame.pack(pady=10)
         
         tk.Label(search_frame, text="Roll Number:", font=('Arial', 10), 
                 bg='white').pack(side=tk.LEFT, padx=5)
-        roll_entry = tk.Entry(search_frame, font=('Arial', 10), width=20)
+        # Type a roll number, name or email and pick the student from the suggestions
+        roll_entry = StudentSearch(search_frame, self.tasks, self.db_ops, 
+                                   on_select=lambda student: search(), width=20)
         roll_entry.pack(side=tk.LEFT, padx=5)
         
-        result_frame = tk.Frame(self.content_frame, bg='white')
+        result_frame = tk.Frame(frame, bg='white')
         result_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
         
+        title_label = tk.Label(result_frame, text="", font=('Arial', 12, 'bold'), bg='white')
+        title_label.pack(pady=10)
+        
+        scrollbar = tk.Scrollbar(result_frame)
+        
+        columns = ('Date', 'Subject', 'Status')
+        tree = ttk.Treeview(result_frame, columns=columns, show='headings', 
+                           yscrollcommand=scrollbar.set)
+        
+        for col in columns:
+            tree.heading(col, text=col)
+            tree.column(col, width=200)
+        
+        scrollbar.config(command=tree.yview)
+        rows = TreeRows(tree)
+        
         def search():
-            clear_frame(result_frame)
             roll_number = roll_entry.get().strip()
-            student = self.db_ops.get_student_by_roll(roll_number)
-            
-            if not student:
-                show_message("Error", "Student not found!", "error")
-                return
-            
-            tk.Label(result_frame, text=f"Attendance for {student['name']}", 
-                    font=('Arial', 12, 'bold'), bg='white').pack(pady=10)
-            
-            scrollbar = tk.Scrollbar(result_frame)
-            scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+            title_label.config(text="Loading...")
             
-            columns = ('Date', 'Subject', 'Status')
-            tree = ttk.Treeview(result_frame, columns=columns, show='headings', 
-                               yscrollcommand=scrollbar.set)
-            
-            for col in columns:
-                tree.heading(col, text=col)
-                tree.column(col, width=200)
-            
-            scrollbar.config(command=tree.yview)
+            def load():
+                student = self.db_ops.get_student_by_roll(roll_number)
+                return student, self.db_ops.get_attendance(student['student_id']) if student else []
             
-            attendance_records = self.db_ops.get_attendance(student['student_id'])
-            for record in attendance_records:
-                tree.insert('', tk.END, values=(
+            def show(data):
+                student, records = data
+                if not student:
+                    title_label.config(text="")
+                    rows.clear()
+                    show_message("Error", "Student not found!", "error")
+                    return
+                
+                title_label.config(text=f"Attendance for {student['name']}")
+                scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+                tree.pack(fill=tk.BOTH, expand=True)
+                rows.update((record['attendance_id'], (
                     record['attendance_date'],
                     record['subject_name'],
                     record['status']
-                ))
+                )) for record in records)
             
-            tree.pack(fill=tk.BOTH, expand=True)
+            # A newer search supersedes one still in flight
+            self.tasks.submit(load, show, self.show_load_error, key='view_attendance')
         
         tk.Button(search_frame, text="Search", command=search, bg='#3498db', 
                  fg='white', font=('Arial', 10, 'bold'), cursor='hand2').pack(side=tk.LEFT, padx=5)
     
-    def enter_marks(self):
-        clear_frame(self.content_frame)
-        
-        tk.Label(self.content_frame, text="Enter Marks", font=('Arial', 16, 'bold'), 
+    def build_enter_marks(self, frame):
+        tk.Label(frame, text="Enter Marks", font=('Arial', 16, 'bold'), 
                 bg='white').pack(pady=10)
         
-        form_frame = tk.Frame(self.content_frame, bg='white')
+        form_frame = tk.Frame(frame, bg='white')
         form_frame.pack(pady=20)
         
         tk.Label(form_frame, text="Roll Number:", font=('Arial', 10), 
                 bg='white').grid(row=0, column=0, sticky='w', pady=5, padx=10)
-        roll_entry = tk.Entry(form_frame, font=('Arial', 10), width=40)
+        roll_entry = StudentSearch(form_frame, self.tasks, self.db_ops, width=40)
         roll_entry.grid(row=0, column=1, pady=5, padx=10)
         
         tk.Label(form_frame, text="Subject:", font=('Arial', 10), 
                 bg='white').grid(row=1, column=0, sticky='w', pady=5, padx=10)
-        subjects = self.db_ops.get_all_subjects()
-        subject_dict = {f"{s['subject_code']} - {s['subject_name']}": s['subject_id'] for s in subjects}
+        subject_dict = {}
         subject_var = tk.StringVar()
         subject_combo = ttk.Combobox(form_frame, textvariable=subject_var, 
-                                    values=list(subject_dict.keys()), 
                                     state='readonly', font=('Arial', 10), width=38)
         subject_combo.grid(row=1, column=1, pady=5, padx=10)
-        if subject_dict:
-            subject_combo.current(0)
         
         tk.Label(form_frame, text="Exam Type:", font=('Arial', 10), 
                 bg='white').grid(row=2, column=0, sticky='w', pady=5, padx=10)
@@ -225,95 +395,312 @@ class FacultyDashboard:
         def submit():
             try:
                 roll_number = roll_entry.get().strip()
-                student = self.db_ops.get_student_by_roll(roll_number)
-                
-                if not student:
-                    show_message("Error", "Student not found!", "error")
-                    return
-                
                 subject_id = subject_dict[subject_var.get()]
                 exam_type = exam_var.get()
                 marks_obtained = float(marks_entry.get().strip())
                 max_marks = float(max_marks_entry.get().strip())
-                
-                if marks_obtained > max_marks:
-                    show_message("Error", "Marks obtained cannot exceed maximum marks!", "error")
-                    return
-                
-                self.db_ops.add_marks(student['student_id'], subject_id, exam_type, 
-                                     marks_obtained, max_marks, self.faculty_id)
-                show_message("Success", "Marks entered successfully!", "success")
-                roll_entry.delete(0, tk.END)
-                marks_entry.delete(0, tk.END)
             except ValueError:
                 show_message("Error", "Please enter valid numeric marks!", "error")
+                return
             except Exception as e:
                 show_message("Error", f"Failed to enter marks: {str(e)}", "error")
+                return
+            
+            if marks_obtained > max_marks:
+                show_message("Error", "Marks obtained cannot exceed maximum marks!", "error")
+                return
+            
+            # 🔹 Lookup and write both run in the background; (student, result) comes back
+            def work():
+                student = self.db_ops.get_student_by_roll(roll_number)
+                if not student:
+                    return None, None
+                return student, self.db_ops.add_marks(student['student_id'], subject_id, exam_type, 
+                                                      marks_obtained, max_marks, self.faculty_id)
+            
+            def entered(data):
+                student, result = data
+                if not student:
+                    show_message("Error", "Student not found!", "error")
+                    return
+                if result is None:
+                    show_message("Error", "Failed to enter marks!", "error")
+                    return
+                show_message("Success", "Marks entered successfully!", "success")
+                roll_entry.delete(0, tk.END)
+                marks_entry.delete(0, tk.END)
+            
+            self.tasks.submit(work, entered, 
+                              lambda e: show_message("Error", f"Failed to enter marks: {str(e)}", "error"))
         
         tk.Button(form_frame, text="Submit Marks", command=submit, bg='#27ae60', 
                  fg='white', font=('Arial', 11, 'bold'), width=20, 
                  cursor='hand2').grid(row=5, column=0, columnspan=2, pady=20)
+        
+        return lambda: self.fill_subjects(subject_combo, subject_dict)
     
-    def view_marks(self):
-        clear_frame(self.content_frame)
+    def build_enter_marks_sheet(self, frame):
+        tk.Label(frame, text="Marks Sheet", font=('Arial', 16, 'bold'), 
+                bg='white').pack(pady=10)
+        
+        form_frame = tk.Frame(frame, bg='white')
+        form_frame.pack(pady=10)
+        
+        tk.Label(form_frame, text="Subject:", font=('Arial', 10), 
+                bg='white').grid(row=0, column=0, sticky='w', pady=5, padx=10)
+        subject_dict = {}
+        subject_var = tk.StringVar()
+        subject_combo = ttk.Combobox(form_frame, textvariable=subject_var, 
+                                    state='readonly', font=('Arial', 10), width=38)
+        subject_combo.grid(row=0, column=1, pady=5, padx=10)
+        
+        tk.Label(form_frame, text="Exam Type:", font=('Arial', 10), 
+                bg='white').grid(row=1, column=0, sticky='w', pady=5, padx=10)
+        exam_var = tk.StringVar(value='Internal 1')
+        ttk.Combobox(form_frame, textvariable=exam_var, 
+                    values=['Internal 1', 'Internal 2', 'Internal 3', 'Semester', 'Final'], 
+                    state='readonly', font=('Arial', 10), width=38).grid(row=1, column=1, pady=5, padx=10)
+        
+        tk.Label(form_frame, text="Maximum Marks:", font=('Arial', 10), 
+                bg='white').grid(row=2, column=0, sticky='w', pady=5, padx=10)
+        max_marks_entry = tk.Entry(form_frame, font=('Arial', 10), width=40)
+        max_marks_entry.insert(0, '100')
+        max_marks_entry.grid(row=2, column=1, pady=5, padx=10)
+        
+        sheet_frame = tk.Frame(frame, bg='white')
+        sheet_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
+        
+        scrollbar = tk.Scrollbar(sheet_frame)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        
+        columns = ('Roll No', 'Name', 'Marks')
+        tree = ttk.Treeview(sheet_frame, columns=columns, show='headings', 
+                           yscrollcommand=scrollbar.set, selectmode='browse')
+        for col in columns:
+            tree.heading(col, text=col)
+            tree.column(col, width=200)
+        scrollbar.config(command=tree.yview)
+        tree.pack(fill=tk.BOTH, expand=True)
+        
+        tk.Label(frame, text="Double-click a row (or press Enter) to type marks; blank rows are skipped.", 
+                font=('Arial', 9), bg='white', fg='gray').pack()
+        
+        # Marks typed so far, keyed by student_id (also used as the Treeview iid), and the
+        # subject the sheet was loaded for, which is what Submit writes against
+        sheet = {}
+        editor = {'entry': None}
+        loaded = {'subject_id': None, 'loading': None}
+        
+        def clear_sheet():
+            close_editor()
+            if loaded['loading'] is not None:
+                loaded['loading'].destroy()
+                loaded['loading'] = None
+            tree.delete(*tree.get_children())
+            sheet.clear()
+            loaded['subject_id'] = None
+        
+        def load_sheet():
+            clear_sheet()
+            if not subject_var.get():
+                show_message("Error", "Please select a subject!", "error")
+                return
+            
+            subject_id = subject_dict[subject_var.get()]
+            loaded['loading'] = show_loading(sheet_frame)
+            
+            def show(students):
+                clear_sheet()
+                if not students:
+                    show_message("Info", "No active students found for this subject.", "info")
+                    return
+                loaded['subject_id'] = subject_id
+                for student in students:
+                    sheet[student['student_id']] = ''
+                    tree.insert('', tk.END, iid=str(student['student_id']), 
+                               values=(student['roll_number'], student['name'], ''))
+                first = tree.get_children()[0]
+                tree.selection_set(first)
+                tree.focus(first)
+            
+            # A newer load supersedes one still in flight, so only one sheet is ever shown
+            self.tasks.submit(lambda: self.db_ops.get_class_roster(subject_id), show, 
+                              self.show_load_error, key='marks_sheet')
+        
+        def close_editor(commit=False):
+            entry = editor['entry']
+            if entry is None:
+                return
+            if commit:
+                iid = entry.iid
+                value = entry.get().strip()
+                sheet[int(iid)] = value
+                tree.set(iid, 'Marks', value)
+            entry.destroy()
+            editor['entry'] = None
+        
+        def edit_row(event=None):
+            close_editor(commit=True)
+            iid = tree.focus()
+            if not iid:
+                return
+            tree.see(iid)
+            tree.update_idletasks()
+            x, y, width, height = tree.bbox(iid, 'Marks')
+            entry = tk.Entry(tree, font=('Arial', 10))
+            entry.iid = iid
+            entry.insert(0, sheet[int(iid)])
+            entry.place(x=x, y=y, width=width, height=height)
+            entry.focus_set()
+            
+            def next_row(event):
+                close_editor(commit=True)
+                following = tree.next(iid)
+                if following:
+                    tree.selection_set(following)
+                    tree.focus(following)
+                    edit_row()
+                else:
+                    tree.focus_set()
+                return 'break'
+            
+            entry.bind('<Return>', next_row)
+            entry.bind('<Tab>', next_row)
+            entry.bind('<Escape>', lambda e: close_editor())
+            entry.bind('<FocusOut>', lambda e: close_editor(commit=True))
+            editor['entry'] = entry
+        
+        tree.bind('<Double-1>', edit_row)
+        tree.bind('<Return>', edit_row)
+        
+        def submit():
+            close_editor(commit=True)
+            if not sheet:
+                show_message("Error", "Load the marks sheet first!", "error")
+                return
+            try:
+                max_marks = float(max_marks_entry.get().strip())
+                entries = []
+                for student_id, value in sheet.items():
+                    if not value:
+                        continue
+                    marks_obtained = float(value)
+                    if marks_obtained < 0 or marks_obtained > max_marks:
+                        roll_number = tree.set(str(student_id), 'Roll No')
+                        show_message("Error", f"Marks for {roll_number} must be between 0 and {max_marks}!", "error")
+                        return
+                    entries.append((student_id, marks_obtained, max_marks))
+                
+                if not entries:
+                    show_message("Error", "No marks entered!", "error")
+                    return
+                
+                subject_id = loaded['subject_id']
+                exam_type = exam_var.get()
+                
+                def saved(result):
+                    if result is None:
+                        show_message("Error", "Failed to save marks!", "error")
+                        return
+                    show_message("Success", f"Marks entered for {len(entries)} students!", "success")
+                    load_sheet()
+                
+                self.tasks.submit(
+                    lambda: self.db_ops.add_marks_bulk(subject_id, exam_type, entries, self.faculty_id), 
+                    saved, 
+                    lambda e: show_message("Error", f"Failed to enter marks: {str(e)}", "error"))
+            except ValueError:
+                show_message("Error", "Please enter valid numeric marks!", "error")
+            except Exception as e:
+                show_message("Error", f"Failed to enter marks: {str(e)}", "error")
+        
+        button_frame = tk.Frame(frame, bg='white')
+        button_frame.pack(pady=10)
+        
+        tk.Button(button_frame, text="Load Sheet", command=load_sheet, bg='#3498db', 
+                 fg='white', font=('Arial', 10, 'bold'), cursor='hand2').pack(side=tk.LEFT, padx=5)
+        tk.Button(button_frame, text="Submit Sheet", command=submit, bg='#27ae60', 
+                 fg='white', font=('Arial', 11, 'bold'), width=18, 
+                 cursor='hand2').pack(side=tk.LEFT, padx=15)
         
-        tk.Label(self.content_frame, text="View Marks", font=('Arial', 16, 'bold'), 
+        return lambda: self.fill_subjects(subject_combo, subject_dict)
+    
+    def build_view_marks(self, frame):
+        tk.Label(frame, text="View Marks", font=('Arial', 16, 'bold'), 
                 bg='white').pack(pady=10)
         
-        search_frame = tk.Frame(self.content_frame, bg='white')
+        search_frame = tk.Frame(frame, bg='white')
         search_frame.pack(pady=10)
         
         tk.Label(search_frame, text="Roll Number:", font=('Arial', 10), 
                 bg='white').pack(side=tk.LEFT, padx=5)
-        roll_entry = tk.Entry(search_frame, font=('Arial', 10), width=20)
+        # Type a roll number, name or email and pick the student from the suggestions
+        roll_entry = StudentSearch(search_frame, self.tasks, self.db_ops, 
+                                   on_select=lambda student: search(), width=20)
         roll_entry.pack(side=tk.LEFT, padx=5)
         
-        result_frame = tk.Frame(self.content_frame, bg='white')
+        result_frame = tk.Frame(frame, bg='white')
         result_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
         
+        title_label = tk.Label(result_frame, text="", font=('Arial', 12, 'bold'), bg='white')
+        title_label.pack(pady=10)
+        
+        scrollbar = tk.Scrollbar(result_frame)
+        
+        columns = ('Subject', 'Exam Type', 'Marks', 'Max Marks', 'Grade')
+        tree = ttk.Treeview(result_frame, columns=columns, show='headings', 
+                           yscrollcommand=scrollbar.set)
+        
+        for col in columns:
+            tree.heading(col, text=col)
+            tree.column(col, width=150)
+        
+        scrollbar.config(command=tree.yview)
+        rows = TreeRows(tree)
+        
         def search():
-            clear_frame(result_frame)
             roll_number = roll_entry.get().strip()
-            student = self.db_ops.get_student_by_roll(roll_number)
-            
-            if not student:
-                show_message("Error", "Student not found!", "error")
-                return
-            
-            tk.Label(result_frame, text=f"Marks for {student['name']}", 
-                    font=('Arial', 12, 'bold'), bg='white').pack(pady=10)
-            
-            scrollbar = tk.Scrollbar(result_frame)
-            scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+            title_label.config(text="Loading...")
             
-            columns = ('Subject', 'Exam Type', 'Marks', 'Max Marks', 'Grade')
-            tree = ttk.Treeview(result_frame, columns=columns, show='headings', 
-                               yscrollcommand=scrollbar.set)
-            
-            for col in columns:
-                tree.heading(col, text=col)
-                tree.column(col, width=150)
-            
-            scrollbar.config(command=tree.yview)
+            def load():
+                student = self.db_ops.get_student_by_roll(roll_number)
+                return student, self.db_ops.get_marks(student['student_id']) if student else []
             
-            marks_records = self.db_ops.get_marks(student['student_id'])
-            for record in marks_records:
-                tree.insert('', tk.END, values=(
+            def show(data):
+                student, records = data
+                if not student:
+                    title_label.config(text="")
+                    rows.clear()
+                    show_message("Error", "Student not found!", "error")
+                    return
+                
+                title_label.config(text=f"Marks for {student['name']}")
+                scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+                tree.pack(fill=tk.BOTH, expand=True)
+                rows.update((record['mark_id'], (
                     record['subject_name'],
                     record['exam_type'],
                     record['marks_obtained'],
                     record['max_marks'],
                     record['grade']
-                ))
+                )) for record in records)
             
-            tree.pack(fill=tk.BOTH, expand=True)
+            # A newer search supersedes one still in flight
+            self.tasks.submit(load, show, self.show_load_error, key='view_marks')
         
         tk.Button(search_frame, text="Search", command=search, bg='#3498db', 
                  fg='white', font=('Arial', 10, 'bold'), cursor='hand2').pack(side=tk.LEFT, padx=5)
     
+    def show_load_error(self, error):
+        show_message("Error", f"Failed to load data: {error}", "error")
+    
     def logout(self):
         if messagebox.askyesno("Confirm", "Are you sure you want to logout?"):
-            self.window.destroy()
+            self.close()
     
-    def run(self):
-        self.window.mainloop()
+    # 🔹 Close the dashboard and hand control back to the login window
+    def close(self):
+        self.tasks.shutdown()
+        self.window.destroy()
+        if self.on_close:
+            self.on_close()
@@ -3,16 +3,20 @@ from tkinter import ttk, messagebox
 from src.auth.authentication import Authentication
 from src.utils.helpers import center_window
 
+# Built once into the application's root window, which stays up for the whole session.
+# Login stays disabled until the database being opened in the background is ready, and
+# credentials are checked on the application's TaskRunner so the window never freezes.
 class LoginWindow:
-    def __init__(self, db_config):
-        self.db_config = db_config
-        self.auth = Authentication(db_config)
-        self.window = tk.Tk()
+    def __init__(self, window, on_login, tasks):
+        self.auth = None
+        self.on_login = on_login
+        self.tasks = tasks
+        self.busy = False
+        self.window = window
         self.window.title("Student Management System - Login")
-        center_window(self.window, 400, 300)
+        center_window(self.window, 400, 330)
         self.window.resizable(False, False)
         
-        self.user_data = None
         self.setup_ui()
     
     def setup_ui(self):
@@ -41,14 +45,40 @@ class LoginWindow:
                                   state='readonly', font=('Arial', 11), width=23)
         role_combo.grid(row=2, column=1, pady=5, padx=10)
         
-        login_btn = tk.Button(login_frame, text="Login", command=self.login, 
-                            bg='#27ae60', fg='white', font=('Arial', 11, 'bold'), 
-                            width=20, cursor='hand2')
-        login_btn.grid(row=3, column=0, columnspan=2, pady=20)
+        self.login_btn = tk.Button(login_frame, text="Login", command=self.login, 
+                                  bg='#27ae60', fg='white', font=('Arial', 11, 'bold'), 
+                                  width=20, cursor='hand2', state=tk.DISABLED)
+        self.login_btn.grid(row=3, column=0, columnspan=2, pady=20)
+        
+        self.status_label = tk.Label(main_frame, text="", font=('Arial', 9, 'italic'), 
+                                    bg='#2c3e50', fg='#bdc3c7')
+        self.status_label.pack()
         
         self.password_entry.bind('<Return>', lambda e: self.login())
     
+    def set_status(self, text):
+        self.status_label.config(text=text)
+    
+    # 🔹 Called once the background connection is up
+    def set_ready(self, db_config):
+        self.auth = Authentication(db_config)
+        self.login_btn.config(state=tk.NORMAL)
+        self.set_status("")
+    
+    # 🔹 Blank password again when the user comes back from a dashboard
+    def reset(self):
+        self.password_entry.delete(0, tk.END)
+        self.password_entry.focus_set()
+    
+    def set_busy(self, busy):
+        self.busy = busy
+        self.login_btn.config(state=tk.DISABLED if busy else tk.NORMAL)
+        self.set_status("Signing in..." if busy else "")
+    
     def login(self):
+        if self.auth is None or self.busy:
+            return
+        
         username = self.username_entry.get().strip()
         password = self.password_entry.get().strip()
         role = self.role_var.get()
@@ -57,21 +87,29 @@ class LoginWindow:
             messagebox.showerror("Error", "Please enter username and password!")
             return
         
-        user = self.auth.verify_login(username, password)
+        def work():
+            user = self.auth.verify_login(username, password)
+            if user and user['role'] == role:
+                return user, self.auth.get_user_details(user['user_id'], role)
+            return None, None
         
-        if user and user['role'] == role:
-            user_details = self.auth.get_user_details(user['user_id'], role)
-            self.user_data = {
-                'user_id': user['user_id'],
-                'username': user['username'],
-                'role': user['role'],
-                'details': user_details
-            }
-            self.window.destroy()
-        else:
-            messagebox.showerror("Login Failed", "Invalid username, password, or role!")
-            self.password_entry.delete(0, tk.END)
-    
-    def run(self):
-        self.window.mainloop()
-        return self.user_data
+        def verified(data):
+            self.set_busy(False)
+            user, user_details = data
+            if user:
+                self.on_login({
+                    'user_id': user['user_id'],
+                    'username': user['username'],
+                    'role': user['role'],
+                    'details': user_details
+                })
+            else:
+                messagebox.showerror("Login Failed", "Invalid username, password, or role!")
+                self.password_entry.delete(0, tk.END)
+        
+        def failed(error):
+            self.set_busy(False)
+            messagebox.showerror("Login Failed", f"Could not check your login: {error}")
+        
+        self.set_busy(True)
+        self.tasks.submit(work, verified, failed)
@@ -1,18 +1,23 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
 from src.database.db_operations import DatabaseOperations
-from src.utils.helpers import center_window, show_message, clear_frame
+from src.utils.background import TaskRunner
+from src.utils.helpers import center_window, show_message, clear_frame, show_loading
+from src.utils.views import TreeRows, ViewManager
 
 class StudentDashboard:
-    def __init__(self, db_config, user_data):
+    def __init__(self, master, db_config, user_data, on_close=None):
         self.db_config = db_config
         self.db_ops = DatabaseOperations(db_config)
         self.user_data = user_data
+        self.on_close = on_close
         self.student_id = user_data['details']['student_id'] if user_data['details'] else None
         
-        self.window = tk.Tk()
+        self.window = tk.Toplevel(master)
+        self.window.protocol('WM_DELETE_WINDOW', self.close)
         self.window.title("Student Dashboard - Student Management System")
         self.window.geometry("1000x600")
+        self.tasks = TaskRunner(self.window, max_workers=db_config.pool_size)
         center_window(self.window, 1000, 600)
         
         self.setup_ui()
@@ -47,63 +52,85 @@ class StudentDashboard:
         
         self.content_frame = tk.Frame(self.window, bg='white')
         self.content_frame.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True, padx=10, pady=10)
+        self.views = ViewManager(self.content_frame)
         
         self.view_profile()
     
     def view_profile(self):
-        clear_frame(self.content_frame)
-        
-        tk.Label(self.content_frame, text="My Profile", font=('Arial', 16, 'bold'), 
+        self.views.show('profile', self.build_profile)
+    
+    def view_attendance(self):
+        self.views.show('attendance', self.build_attendance)
+    
+    def view_marks(self):
+        self.views.show('marks', self.build_marks)
+    
+    def view_report(self):
+        self.views.show('report', self.build_report)
+    
+    # 🔹 Each build_* creates its view once and returns the refresh() that reloads it in place
+    def build_profile(self, frame):
+        tk.Label(frame, text="My Profile", font=('Arial', 16, 'bold'), 
                 bg='white').pack(pady=10)
         
         if not self.student_id:
-            tk.Label(self.content_frame, text="No profile data available", 
+            tk.Label(frame, text="No profile data available", 
                     font=('Arial', 12), bg='white', fg='red').pack(pady=50)
-            return
-        
-        student = self.db_ops.get_student_by_id(self.student_id)
+            return None
+        
+        loading = show_loading(frame)
+        profile_frame = tk.Frame(frame, bg='#ecf0f1', relief=tk.RIDGE, bd=2)
+        
+        fields = [
+            ('Roll Number', 'roll_number'),
+            ('Name', 'name'),
+            ('Email', 'email'),
+            ('Phone', 'phone'),
+            ('Date of Birth', 'date_of_birth'),
+            ('Gender', 'gender'),
+            ('Semester', 'semester'),
+            ('Status', 'status'),
+            ('Address', 'address')
+        ]
         
-        if student:
-            profile_frame = tk.Frame(self.content_frame, bg='#ecf0f1', relief=tk.RIDGE, bd=2)
-            profile_frame.pack(pady=20, padx=40, fill=tk.BOTH, expand=True)
-            
-            fields = [
-                ('Roll Number', student['roll_number']),
-                ('Name', student['name']),
-                ('Email', student['email']),
-                ('Phone', student['phone']),
-                ('Date of Birth', student['date_of_birth']),
-                ('Gender', student['gender']),
-                ('Semester', student['semester']),
-                ('Status', student['status']),
-                ('Address', student['address'])
-            ]
-            
-            for i, (label, value) in enumerate(fields):
-                tk.Label(profile_frame, text=f"{label}:", font=('Arial', 11, 'bold'), 
-                        bg='#ecf0f1').grid(row=i, column=0, sticky='w', pady=8, padx=20)
-                tk.Label(profile_frame, text=str(value), font=('Arial', 11), 
-                        bg='#ecf0f1').grid(row=i, column=1, sticky='w', pady=8, padx=20)
+        values = {}
+        for i, (label, field) in enumerate(fields):
+            tk.Label(profile_frame, text=f"{label}:", font=('Arial', 11, 'bold'), 
+                    bg='#ecf0f1').grid(row=i, column=0, sticky='w', pady=8, padx=20)
+            values[field] = tk.Label(profile_frame, text="", font=('Arial', 11), bg='#ecf0f1')
+            values[field].grid(row=i, column=1, sticky='w', pady=8, padx=20)
+        
+        def show(student):
+            loading.pack_forget()
+            if student:
+                for field, label in values.items():
+                    label.config(text=str(student[field]))
+                profile_frame.pack(pady=20, padx=40, fill=tk.BOTH, expand=True)
+        
+        def refresh():
+            self.tasks.submit(lambda: self.db_ops.get_student_by_id(self.student_id), 
+                              show, self.show_load_error, key='profile')
+        return refresh
     
-    def view_attendance(self):
-        clear_frame(self.content_frame)
-        
-        tk.Label(self.content_frame, text="My Attendance", font=('Arial', 16, 'bold'), 
+    def build_attendance(self, frame):
+        tk.Label(frame, text="My Attendance", font=('Arial', 16, 'bold'), 
                 bg='white').pack(pady=10)
         
         if not self.student_id:
-            tk.Label(self.content_frame, text="No attendance data available", 
+            tk.Label(frame, text="No attendance data available", 
                     font=('Arial', 12), bg='white', fg='red').pack(pady=50)
-            return
+            return None
         
-        frame = tk.Frame(self.content_frame, bg='white')
-        frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        loading = show_loading(frame)
         
-        scrollbar = tk.Scrollbar(frame)
+        table_frame = tk.Frame(frame, bg='white')
+        table_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        
+        scrollbar = tk.Scrollbar(table_frame)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         
         columns = ('Date', 'Subject', 'Status')
-        tree = ttk.Treeview(frame, columns=columns, show='headings', 
+        tree = ttk.Treeview(table_frame, columns=columns, show='headings', 
                            yscrollcommand=scrollbar.set)
         
         for col in columns:
@@ -111,52 +138,59 @@ class StudentDashboard:
             tree.column(col, width=200)
         
         scrollbar.config(command=tree.yview)
+        tree.pack(fill=tk.BOTH, expand=True)
+        rows = TreeRows(tree)
         
-        attendance_records = self.db_ops.get_attendance(self.student_id)
-        for record in attendance_records:
-            tree.insert('', tk.END, values=(
+        summary_frame = tk.Frame(frame, bg='white')
+        summary_frame.pack(pady=10)
+        
+        def show(data):
+            loading.pack_forget()
+            attendance_records, summary = data
+            
+            rows.update((record['attendance_id'], (
                 record['attendance_date'],
                 record['subject_name'],
                 record['status']
-            ))
-        
-        tree.pack(fill=tk.BOTH, expand=True)
-        
-        subjects = self.db_ops.get_all_subjects()
-        if subjects:
-            summary_frame = tk.Frame(self.content_frame, bg='white')
-            summary_frame.pack(pady=10)
+            )) for record in attendance_records)
             
-            tk.Label(summary_frame, text="Attendance Percentage by Subject:", 
-                    font=('Arial', 12, 'bold'), bg='white').pack()
-            
-            for subject in subjects:
-                percentage = self.db_ops.get_attendance_percentage(self.student_id, subject['subject_id'])
-                if percentage > 0:
+            clear_frame(summary_frame)
+            if summary:
+                tk.Label(summary_frame, text="Attendance Percentage by Subject:", 
+                        font=('Arial', 12, 'bold'), bg='white').pack()
+                
+                for subject in summary:
+                    percentage = subject['percentage']
                     color = '#27ae60' if percentage >= 75 else '#e74c3c'
                     tk.Label(summary_frame, 
                             text=f"{subject['subject_name']}: {percentage}%", 
                             font=('Arial', 10), bg='white', fg=color).pack()
-    
-    def view_marks(self):
-        clear_frame(self.content_frame)
         
-        tk.Label(self.content_frame, text="My Marks", font=('Arial', 16, 'bold'), 
+        def refresh():
+            self.tasks.submit(lambda: (self.db_ops.get_attendance(self.student_id), 
+                                       self.db_ops.get_attendance_summary(self.student_id)), 
+                              show, self.show_load_error, key='attendance')
+        return refresh
+    
+    def build_marks(self, frame):
+        tk.Label(frame, text="My Marks", font=('Arial', 16, 'bold'), 
                 bg='white').pack(pady=10)
         
         if not self.student_id:
-            tk.Label(self.content_frame, text="No marks data available", 
+            tk.Label(frame, text="No marks data available", 
                     font=('Arial', 12), bg='white', fg='red').pack(pady=50)
-            return
+            return None
+        
+        loading = show_loading(frame)
         
-        frame = tk.Frame(self.content_frame, bg='white')
-        frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        table_frame = tk.Frame(frame, bg='white')
+        table_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
         
-        scrollbar = tk.Scrollbar(frame)
+        scrollbar = tk.Scrollbar(table_frame)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         
         columns = ('Subject', 'Exam Type', 'Marks Obtained', 'Max Marks', 'Grade')
-        tree = ttk.Treeview(frame, columns=columns, show='headings', 
+        tree = ttk.Treeview(table_frame, columns=columns, show='headings', 
                            yscrollcommand=scrollbar.set)
         
         for col in columns:
@@ -164,95 +198,113 @@ class StudentDashboard:
             tree.column(col, width=150)
         
         scrollbar.config(command=tree.yview)
+        tree.pack(fill=tk.BOTH, expand=True)
+        rows = TreeRows(tree)
         
-        marks_records = self.db_ops.get_marks(self.student_id)
-        for record in marks_records:
-            tree.insert('', tk.END, values=(
+        def show(marks_records):
+            loading.pack_forget()
+            rows.update((record['mark_id'], (
                 record['subject_name'],
                 record['exam_type'],
                 record['marks_obtained'],
                 record['max_marks'],
                 record['grade']
-            ))
+            )) for record in marks_records)
         
-        tree.pack(fill=tk.BOTH, expand=True)
+        def refresh():
+            self.tasks.submit(lambda: self.db_ops.get_marks(self.student_id), 
+                              show, self.show_load_error, key='marks')
+        return refresh
     
-    def view_report(self):
-        clear_frame(self.content_frame)
-        
-        tk.Label(self.content_frame, text="Performance Report", font=('Arial', 16, 'bold'), 
+    def build_report(self, frame):
+        tk.Label(frame, text="Performance Report", font=('Arial', 16, 'bold'), 
                 bg='white').pack(pady=10)
         
         if not self.student_id:
-            tk.Label(self.content_frame, text="No report data available", 
+            tk.Label(frame, text="No report data available", 
                     font=('Arial', 12), bg='white', fg='red').pack(pady=50)
-            return
-        
-        report_frame = tk.Frame(self.content_frame, bg='white')
-        report_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=10)
-        
-        student = self.db_ops.get_student_by_id(self.student_id)
-        
-        tk.Label(report_frame, text=f"Student: {student['name']}", 
-                font=('Arial', 12, 'bold'), bg='white').pack(anchor='w', pady=5)
-        tk.Label(report_frame, text=f"Roll Number: {student['roll_number']}", 
-                font=('Arial', 11), bg='white').pack(anchor='w', pady=2)
-        tk.Label(report_frame, text=f"Semester: {student['semester']}", 
-                font=('Arial', 11), bg='white').pack(anchor='w', pady=2)
+            return None
         
-        tk.Label(report_frame, text="\nAttendance Summary:", 
-                font=('Arial', 12, 'bold'), bg='white').pack(anchor='w', pady=10)
+        loading = show_loading(frame)
         
-        subjects = self.db_ops.get_all_subjects()
-        attendance_frame = tk.Frame(report_frame, bg='#ecf0f1', relief=tk.RIDGE, bd=1)
-        attendance_frame.pack(fill=tk.X, pady=5)
+        report_frame = tk.Frame(frame, bg='white')
+        report_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=10)
         
-        for subject in subjects:
-            percentage = self.db_ops.get_attendance_percentage(self.student_id, subject['subject_id'])
-            if percentage > 0:
+        def show(data):
+            loading.pack_forget()
+            student, summary, marks_records = data
+            clear_frame(report_frame)
+            
+            tk.Label(report_frame, text=f"Student: {student['name']}", 
+                    font=('Arial', 12, 'bold'), bg='white').pack(anchor='w', pady=5)
+            tk.Label(report_frame, text=f"Roll Number: {student['roll_number']}", 
+                    font=('Arial', 11), bg='white').pack(anchor='w', pady=2)
+            tk.Label(report_frame, text=f"Semester: {student['semester']}", 
+                    font=('Arial', 11), bg='white').pack(anchor='w', pady=2)
+            
+            tk.Label(report_frame, text="\nAttendance Summary:", 
+                    font=('Arial', 12, 'bold'), bg='white').pack(anchor='w', pady=10)
+            
+            attendance_frame = tk.Frame(report_frame, bg='#ecf0f1', relief=tk.RIDGE, bd=1)
+            attendance_frame.pack(fill=tk.X, pady=5)
+            
+            for subject in summary:
+                percentage = subject['percentage']
                 color = '#27ae60' if percentage >= 75 else '#e74c3c'
                 label_frame = tk.Frame(attendance_frame, bg='#ecf0f1')
                 label_frame.pack(fill=tk.X, padx=10, pady=3)
                 tk.Label(label_frame, text=f"{subject['subject_name']}: ", 
                         font=('Arial', 10), bg='#ecf0f1').pack(side=tk.LEFT)
-                tk.Label(label_frame, text=f"{percentage}%", 
+                tk.Label(label_frame, text=f"{percentage}% ({subject['present']}/{subject['total']})", 
                         font=('Arial', 10, 'bold'), bg='#ecf0f1', fg=color).pack(side=tk.LEFT)
-        
-        tk.Label(report_frame, text="\nAcademic Performance:", 
-                font=('Arial', 12, 'bold'), bg='white').pack(anchor='w', pady=10)
-        
-        marks_records = self.db_ops.get_marks(self.student_id)
-        
-        if marks_records:
-            subject_marks = {}
-            for record in marks_records:
-                subject = record['subject_name']
-                if subject not in subject_marks:
-                    subject_marks[subject] = []
-                subject_marks[subject].append({
-                    'exam': record['exam_type'],
-                    'marks': record['marks_obtained'],
-                    'max': record['max_marks'],
-                    'grade': record['grade']
-                })
             
-            marks_frame = tk.Frame(report_frame, bg='#ecf0f1', relief=tk.RIDGE, bd=1)
-            marks_frame.pack(fill=tk.X, pady=5)
+            tk.Label(report_frame, text="\nAcademic Performance:", 
+                    font=('Arial', 12, 'bold'), bg='white').pack(anchor='w', pady=10)
             
-            for subject, exams in subject_marks.items():
-                tk.Label(marks_frame, text=f"\n{subject}:", 
-                        font=('Arial', 10, 'bold'), bg='#ecf0f1').pack(anchor='w', padx=10)
-                for exam in exams:
-                    tk.Label(marks_frame, 
-                            text=f"  {exam['exam']}: {exam['marks']}/{exam['max']} (Grade: {exam['grade']})", 
-                            font=('Arial', 9), bg='#ecf0f1').pack(anchor='w', padx=20)
-        else:
-            tk.Label(report_frame, text="No marks recorded yet", 
-                    font=('Arial', 10), bg='white', fg='gray').pack(anchor='w')
+            if marks_records:
+                subject_marks = {}
+                for record in marks_records:
+                    subject = record['subject_name']
+                    if subject not in subject_marks:
+                        subject_marks[subject] = []
+                    subject_marks[subject].append({
+                        'exam': record['exam_type'],
+                        'marks': record['marks_obtained'],
+                        'max': record['max_marks'],
+                        'grade': record['grade']
+                    })
+                
+                marks_frame = tk.Frame(report_frame, bg='#ecf0f1', relief=tk.RIDGE, bd=1)
+                marks_frame.pack(fill=tk.X, pady=5)
+                
+                for subject, exams in subject_marks.items():
+                    tk.Label(marks_frame, text=f"\n{subject}:", 
+                            font=('Arial', 10, 'bold'), bg='#ecf0f1').pack(anchor='w', padx=10)
+                    for exam in exams:
+                        tk.Label(marks_frame, 
+                                text=f"  {exam['exam']}: {exam['marks']}/{exam['max']} (Grade: {exam['grade']})", 
+                                font=('Arial', 9), bg='#ecf0f1').pack(anchor='w', padx=20)
+            else:
+                tk.Label(report_frame, text="No marks recorded yet", 
+                        font=('Arial', 10), bg='white', fg='gray').pack(anchor='w')
+        
+        def refresh():
+            self.tasks.submit(lambda: (self.db_ops.get_student_by_id(self.student_id), 
+                                       self.db_ops.get_attendance_summary(self.student_id), 
+                                       self.db_ops.get_marks(self.student_id)), 
+                              show, self.show_load_error, key='report')
+        return refresh
+    
+    def show_load_error(self, error):
+        show_message("Error", f"Failed to load data: {error}", "error")
     
     def logout(self):
         if messagebox.askyesno("Confirm", "Are you sure you want to logout?"):
-            self.window.destroy()
+            self.close()
     
-    def run(self):
-        self.window.mainloop()
+    # 🔹 Close the dashboard and hand control back to the login window
+    def close(self):
+        self.tasks.shutdown()
+        self.window.destroy()
+        if self.on_close:
+            self.on_close()
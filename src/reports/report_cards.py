@@ -0,0 +1,248 @@
+import argparse
+import hashlib
+import json
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+
+from src.database.db_config import DatabaseConfig
+from src.database.db_operations import DatabaseOperations
+
+# Bump when the layout changes so every card is rendered again
+LAYOUT_VERSION = 1
+MANIFEST_FILE = 'manifest.json'
+FORMATS = {'pdf': 'PDF', 'png': 'PNG'}
+
+# A4 at 150 dpi
+PAGE_WIDTH, PAGE_HEIGHT = 1240, 1754
+MARGIN = 90
+STYLES = {
+    # style: (font size, bold)
+    'title': (40, True),
+    'heading': (28, True),
+    'subheading': (24, True),
+    'body': (24, False),
+    'small': (21, False),
+}
+GOOD, POOR, TEXT, MUTED = '#27ae60', '#e74c3c', '#2c3e50', '#7f8c8d'
+
+
+@lru_cache(maxsize=None)
+def _font(size, bold):
+    from PIL import ImageFont
+
+    candidates = ['arialbd.ttf', 'DejaVuSans-Bold.ttf'] if bold else ['arial.ttf', 'DejaVuSans.ttf']
+    for name in candidates:
+        try:
+            return ImageFont.truetype(name, size)
+        except OSError:
+            continue
+    return ImageFont.load_default(size)
+
+
+# 🔹 The report as (text, style, color, indent) lines, in the order StudentDashboard.view_report shows it
+def _layout(card):
+    lines = [
+        ("Performance Report", 'title', TEXT, 0),
+        ("", 'small', TEXT, 0),
+        (f"Student: {card['name']}", 'subheading', TEXT, 0),
+        (f"Roll Number: {card['roll_number']}", 'body', TEXT, 0),
+        (f"Course: {card['course_name']}", 'body', TEXT, 0),
+        (f"Semester: {card['semester']}", 'body', TEXT, 0),
+        ("", 'small', TEXT, 0),
+        ("Attendance Summary:", 'heading', TEXT, 0),
+    ]
+    for subject, total, present in card['attendance']:
+        percentage = round(present / total * 100, 2) if total else 0.0
+        lines.append((f"{subject}: {percentage}% ({present}/{total})", 'body',
+                      GOOD if percentage >= 75 else POOR, 20))
+    if not card['attendance']:
+        lines.append(("No attendance recorded yet", 'body', MUTED, 20))
+
+    lines += [("", 'small', TEXT, 0), ("Academic Performance:", 'heading', TEXT, 0)]
+    for subject, exams in card['marks']:
+        lines.append((f"{subject}:", 'subheading', TEXT, 20))
+        for exam, obtained, maximum, grade in exams:
+            lines.append((f"{exam}: {obtained}/{maximum} (Grade: {grade})", 'small', TEXT, 50))
+    if not card['marks']:
+        lines.append(("No marks recorded yet", 'body', MUTED, 20))
+    return lines
+
+
+def _line_height(style):
+    return int(STYLES[style][0] * 1.6)
+
+
+# 🔹 Render one card to path. Runs in a worker process, so it only takes plain data.
+# PDF output is paginated at A4; PNG output is a single page that grows to fit.
+def render_report_card(card, path, fmt='pdf'):
+    from PIL import Image, ImageDraw
+
+    lines = _layout(card)
+    pages = [[]]
+    y = MARGIN
+    for line in lines:
+        height = _line_height(line[1])
+        if fmt == 'pdf' and y + height > PAGE_HEIGHT - MARGIN and pages[-1]:
+            pages.append([])
+            y = MARGIN
+        pages[-1].append((y, line))
+        y += height
+
+    page_height = PAGE_HEIGHT if fmt == 'pdf' else max(PAGE_HEIGHT, y + MARGIN)
+    images = []
+    for page in pages:
+        image = Image.new('RGB', (PAGE_WIDTH, page_height), 'white')
+        draw = ImageDraw.Draw(image)
+        for y, (text, style, color, indent) in page:
+            if text:
+                draw.text((MARGIN + indent, y), text, fill=color, font=_font(*STYLES[style]))
+        images.append(image)
+
+    # Write beside the target and rename, so an interrupted run never leaves a half-written card
+    temporary = path + '.tmp'
+    images[0].save(temporary, format=FORMATS[fmt], save_all=len(images) > 1, append_images=images[1:])
+    os.replace(temporary, path)
+    return path
+
+
+def _digest(card, fmt):
+    data = json.dumps([LAYOUT_VERSION, fmt, card], sort_keys=True, default=str)
+    return hashlib.sha1(data.encode()).hexdigest()
+
+
+def _filename(roll_number, fmt):
+    return re.sub(r'[^\w.-]', '_', roll_number) + '.' + fmt
+
+
+# Renders report cards for every active student, course by course. Each course is
+# prefetched with three bulk queries; cards are rendered in a process pool while the
+# next course is being fetched. A manifest of content digests in output_dir lets
+# later runs skip students whose report data has not changed.
+class ReportCardGenerator:
+    def __init__(self, db_config, output_dir='report_cards', fmt='pdf', workers=None):
+        if fmt not in FORMATS:
+            raise ValueError(f"Unknown report format: {fmt}")
+        self.db_ops = DatabaseOperations(db_config)
+        self.output_dir = output_dir
+        self.fmt = fmt
+        self.workers = workers
+        self.manifest_path = os.path.join(output_dir, MANIFEST_FILE)
+
+    def _load_manifest(self):
+        try:
+            with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_manifest(self, manifest):
+        temporary = self.manifest_path + '.tmp'
+        with open(temporary, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f)
+        os.replace(temporary, self.manifest_path)
+
+    # 🔹 Report data for every active student of a course, keyed by student_id
+    def prefetch_course(self, course_id, semester=None):
+        cards = {}
+        for student in self.db_ops.get_course_students(course_id, semester):
+            cards[student['student_id']] = {
+                'roll_number': student['roll_number'],
+                'name': student['name'],
+                'course_name': student['course_name'],
+                'semester': student['semester'],
+                'attendance': [],
+                'marks': [],
+            }
+
+        for student_id, subject, total, present in self.db_ops.iter_course_attendance_summary(course_id, semester):
+            if student_id in cards:
+                cards[student_id]['attendance'].append((subject, int(total), int(present)))
+
+        for student_id, subject, exam, obtained, maximum, grade in self.db_ops.iter_course_marks(course_id, semester):
+            card = cards.get(student_id)
+            if card is None:
+                continue
+            # Rows arrive grouped by student then subject
+            if not card['marks'] or card['marks'][-1][0] != subject:
+                card['marks'].append((subject, []))
+            card['marks'][-1][1].append((exam, str(obtained), str(maximum), grade))
+        return cards
+
+    # 🔹 Render changed cards (all with force=True); progress(rendered, skipped, failed) after each card
+    def generate(self, course_id=None, semester=None, force=False, progress=None):
+        os.makedirs(self.output_dir, exist_ok=True)
+        manifest = self._load_manifest()
+        courses = [c for c in self.db_ops.get_all_courses() if course_id is None or c['course_id'] == course_id]
+        counts = {'rendered': 0, 'skipped': 0, 'failed': 0}
+
+        def collect(jobs):
+            for key, roll_number, digest, future in jobs:
+                try:
+                    future.result()
+                    manifest[key] = digest
+                    counts['rendered'] += 1
+                except Exception as e:
+                    print(f" Error rendering report card for {roll_number}: {e}")
+                    counts['failed'] += 1
+                if progress:
+                    progress(counts['rendered'], counts['skipped'], counts['failed'])
+            self._save_manifest(manifest)
+
+        with ProcessPoolExecutor(self.workers) as executor:
+            pending = []
+            for course in courses:
+                jobs = []
+                for student_id, card in self.prefetch_course(course['course_id'], semester).items():
+                    key = f"{student_id}.{self.fmt}"
+                    path = os.path.join(self.output_dir, _filename(card['roll_number'], self.fmt))
+                    digest = _digest(card, self.fmt)
+                    if not force and manifest.get(key) == digest and os.path.exists(path):
+                        counts['skipped'] += 1
+                        continue
+                    jobs.append((key, card['roll_number'], digest,
+                                 executor.submit(render_report_card, card, path, self.fmt)))
+                # The previous course renders while this one was fetched; collect it now
+                collect(pending)
+                pending = jobs
+            collect(pending)
+        return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Render report cards for all active students")
+    parser.add_argument('--output-dir', default='report_cards')
+    parser.add_argument('--format', choices=sorted(FORMATS), default='pdf')
+    parser.add_argument('--course', metavar='CODE', help="only students of this course code")
+    parser.add_argument('--semester', type=int)
+    parser.add_argument('--workers', type=int, help="render processes (default: CPU count)")
+    parser.add_argument('--force', action='store_true', help="render every card, changed or not")
+    parser.add_argument('--sqlite', metavar='PATH', help="read from this SQLite file instead of MySQL")
+    args = parser.parse_args()
+
+    db_config = DatabaseConfig(query_stats=False, backend='sqlite' if args.sqlite else 'mysql',
+                               sqlite_path=args.sqlite)
+    if not db_config.connect():
+        raise SystemExit(1)
+
+    generator = ReportCardGenerator(db_config, args.output_dir, args.format, args.workers)
+    course_id = None
+    if args.course:
+        courses = {c['course_code']: c['course_id'] for c in generator.db_ops.get_all_courses()}
+        if args.course not in courses:
+            raise SystemExit(f"Unknown course code: {args.course}")
+        course_id = courses[args.course]
+
+    start = time.perf_counter()
+    counts = generator.generate(course_id, args.semester, args.force, progress=lambda *c: print(
+        f"\r  {c[0]:,} rendered, {c[1]:,} unchanged, {c[2]:,} failed", end='', flush=True))
+    print(f"\nReport cards in {args.output_dir}: {counts['rendered']:,} rendered, "
+          f"{counts['skipped']:,} unchanged, {counts['failed']:,} failed "
+          f"in {time.perf_counter() - start:.1f}s")
+    db_config.disconnect()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,125 @@
+import queue
+import tkinter as tk
+from concurrent.futures import ThreadPoolExecutor
+from src.utils.helpers import show_message
+
+
+# Runs blocking work (database calls) on worker threads and delivers results back on
+# the Tk main thread. Size max_workers to the connection pool so workers never queue
+# for a connection. cancel() drops results of everything submitted before it; a submit
+# with a key supersedes any earlier one with the same key, so only the latest load of
+# a view (or the latest search) ever reaches the screen.
+class TaskRunner:
+    POLL_MS = 30
+
+    def __init__(self, window, max_workers=4):
+        self.window = window
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='db-worker')
+        self._results = queue.Queue()
+        self._generation = 0
+        self._latest = {}
+        self._pending = 0
+        self._polling = False
+        self._closed = False
+
+    # 🔹 Run work() in the background; on_success(result) / on_error(exc) run on the Tk thread.
+    # A superseded keyed task is skipped if it hasn't started yet and ignored if it has.
+    def submit(self, work, on_success=None, on_error=None, key=None):
+        if self._closed:
+            return
+        generation = self._generation
+        token = object()
+        if key is not None:
+            self._latest[key] = token
+
+        def run():
+            if key is not None and self._latest.get(key) is not token:
+                self._results.put((generation, key, token, None, None, None, None, True))
+                return
+            try:
+                self._results.put((generation, key, token, on_success, on_error, work(), None, True))
+            except Exception as e:
+                self._results.put((generation, key, token, on_success, on_error, None, e, True))
+
+        self._pending += 1
+        self._executor.submit(run)
+        self._schedule_poll()
+
+    # 🔹 Function that work running in the background can call to deliver intermediate
+    # values to on_progress(value) on the Tk thread while the task is still pending
+    def reporter(self, on_progress):
+        generation = self._generation
+
+        def report(value):
+            self._results.put((generation, None, None, on_progress, None, value, None, False))
+        return report
+
+    # 🔹 Forget every request submitted so far (only the one with this key if given);
+    # their callbacks will never run
+    def cancel(self, key=None):
+        if key is not None:
+            self._latest.pop(key, None)
+            return
+        self._generation += 1
+
+    def _schedule_poll(self):
+        if self._polling or self._closed:
+            return
+        try:
+            self.window.after(self.POLL_MS, self._poll)
+            self._polling = True
+        except tk.TclError:
+            # Window already destroyed
+            self.shutdown()
+
+    def _poll(self):
+        self._polling = False
+        while True:
+            try:
+                generation, key, token, on_success, on_error, result, error, finished = self._results.get_nowait()
+            except queue.Empty:
+                break
+            if finished:
+                self._pending -= 1
+            if key is not None:
+                if self._latest.get(key) is not token:
+                    continue
+                if finished:
+                    del self._latest[key]
+            if generation != self._generation or self._closed:
+                continue
+            if error is not None:
+                self._fail(error, on_error)
+                continue
+            try:
+                if on_success:
+                    on_success(result)
+            except tk.TclError:
+                # The widgets this callback targets are gone
+                pass
+            except Exception as e:
+                # A broken callback must not stop the results queued behind it
+                self._fail(e, on_error)
+
+        if self._pending > 0:
+            self._schedule_poll()
+
+    # 🔹 Hand an error to on_error, or show it when there is none (or on_error fails too)
+    def _fail(self, error, on_error):
+        if on_error:
+            try:
+                on_error(error)
+                return
+            except tk.TclError:
+                return
+            except Exception as e:
+                error = e
+        try:
+            show_message("Error", f"Background task failed: {error}", "error")
+        except tk.TclError:
+            pass
+
+    def shutdown(self):
+        self._closed = True
+        self._generation += 1
+        self._executor.shutdown(wait=False, cancel_futures=True)
@@ -37,6 +37,14 @@ def center_window(window, width, height):
     y = (screen_height - height) // 2
     window.geometry(f'{width}x{height}+{x}+{y}')
 
-def clear_frame(frame):
+def clear_frame(frame, tasks=None):
+    # Passing the view's TaskRunner drops results still in flight for the old view
+    if tasks:
+        tasks.cancel()
     for widget in frame.winfo_children():
         widget.destroy()
+
+def show_loading(frame, text="Loading..."):
+    label = tk.Label(frame, text=text, font=('Arial', 11, 'italic'), bg='white', fg='gray')
+    label.pack(pady=20)
+    return label
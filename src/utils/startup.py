@@ -0,0 +1,36 @@
+import json
+import time
+
+
+# Startup instrumentation. mark(name) records the time since the process began loading
+# main.py; record(name, seconds) stores a measured duration such as a dashboard import
+# or the time from a login click to the dashboard appearing.
+class StartupTimer:
+    def __init__(self, started=None):
+        self.started = time.perf_counter() if started is None else started
+        self.marks = []          # (name, seconds since start)
+        self.durations = []      # (name, seconds)
+
+    def mark(self, name):
+        elapsed = time.perf_counter() - self.started
+        self.marks.append((name, elapsed))
+        print(f"[startup] {name}: {elapsed * 1000:.0f} ms")
+        return elapsed
+
+    def record(self, name, seconds):
+        self.durations.append((name, seconds))
+        print(f"[startup] {name}: {seconds * 1000:.0f} ms")
+
+    def snapshot(self):
+        return {
+            'marks_ms': {name: round(seconds * 1000, 1) for name, seconds in self.marks},
+            'durations_ms': [{'name': name, 'ms': round(seconds * 1000, 1)} for name, seconds in self.durations],
+        }
+
+    # 🔹 Write the snapshot as JSON to path, or return it as a string
+    def dump_json(self, path=None):
+        data = json.dumps(self.snapshot(), indent=2)
+        if path:
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(data)
+        return data
@@ -0,0 +1,128 @@
+import tkinter as tk
+
+
+# An entry that searches as you type. Each keystroke restarts a short delay, and only
+# when typing pauses does search(text) run on the TaskRunner; a search still in flight
+# when the text changes again is cancelled, so only results for the current text are
+# ever shown. Matches appear in a list under the entry; picking one (click, or arrow
+# keys and Enter) puts label(item) into the entry and calls on_select(item).
+class TypeAhead(tk.Frame):
+    DELAY_MS = 200
+
+    def __init__(self, master, tasks, search, describe, on_select=None, label=None,
+                 delay_ms=DELAY_MS, min_chars=1, width=20, rows=6):
+        super().__init__(master, bg=master.cget('bg'))
+        self.tasks = tasks
+        self.search = search
+        self.describe = describe                  # item -> text shown in the list
+        self.label = label or describe            # item -> text put into the entry
+        self.on_select = on_select
+        self.delay_ms = delay_ms
+        self.min_chars = min_chars
+        self.rows = rows
+        self.items = []
+        self._after = None
+        self._key = ('typeahead', str(self))
+
+        self.text = tk.StringVar()
+        self.entry = tk.Entry(self, textvariable=self.text, font=('Arial', 10), width=width)
+        self.entry.pack(fill=tk.X)
+        self.listbox = tk.Listbox(self, font=('Arial', 10), activestyle='dotbox')
+
+        self._trace = self.text.trace_add('write', self._changed)
+        self.entry.bind('<Down>', self._focus_list)
+        self.entry.bind('<Escape>', lambda e: self.hide())
+        self.listbox.bind('<ButtonRelease-1>', lambda e: self._pick())
+        self.listbox.bind('<Return>', lambda e: self._pick())
+        self.listbox.bind('<Escape>', lambda e: (self.hide(), self.entry.focus_set()))
+
+    # Entry-like access so callers can read and clear it like the plain entry it replaces
+    def get(self):
+        return self.text.get()
+
+    def delete(self, first, last=None):
+        self.entry.delete(first, last)
+        self.hide()
+
+    def _changed(self, *args):
+        if self._after is not None:
+            self.after_cancel(self._after)
+        # Results of the previous text are no longer wanted, even if already on their way
+        self.tasks.cancel(self._key)
+        self._after = self.after(self.delay_ms, self._search)
+
+    def _search(self):
+        self._after = None
+        text = self.text.get().strip()
+        if len(text) < self.min_chars:
+            self.hide()
+            return
+        self.tasks.submit(lambda: self.search(text), self.show, self._failed, key=self._key)
+
+    def _failed(self, error):
+        print(f"Search failed: {error}")
+        self.hide()
+
+    def show(self, items):
+        self.items = list(items)
+        self.listbox.delete(0, tk.END)
+        if not self.items:
+            self.hide()
+            return
+        for item in self.items:
+            self.listbox.insert(tk.END, self.describe(item))
+        self.listbox.config(height=min(len(self.items), self.rows))
+        self.listbox.pack(fill=tk.X)
+
+    def hide(self):
+        self.listbox.pack_forget()
+
+    def _focus_list(self, event):
+        if self.items and self.listbox.winfo_ismapped():
+            self.listbox.focus_set()
+            self.listbox.selection_clear(0, tk.END)
+            self.listbox.selection_set(0)
+            self.listbox.activate(0)
+
+    def _pick(self):
+        selection = self.listbox.curselection()
+        if not selection:
+            return
+        item = self.items[selection[0]]
+
+        # Filling in the chosen value must not start another search
+        if self._after is not None:
+            self.after_cancel(self._after)
+            self._after = None
+        self.text.trace_remove('write', self._trace)
+        self.text.set(self.label(item))
+        self._trace = self.text.trace_add('write', self._changed)
+
+        self.hide()
+        self.entry.icursor(tk.END)
+        self.entry.focus_set()
+        if self.on_select:
+            self.on_select(item)
+
+    def destroy(self):
+        if self._after is not None:
+            self.after_cancel(self._after)
+            self._after = None
+        self.tasks.cancel(self._key)
+        super().destroy()
+
+
+# Finds active students by roll-number prefix or by words of their name or email
+# (DatabaseOperations.search_students); the chosen student's roll number fills the entry.
+class StudentSearch(TypeAhead):
+    LIMIT = 20
+
+    def __init__(self, master, tasks, db_ops, on_select=None, **options):
+        super().__init__(master, tasks, lambda text: db_ops.search_students(text, self.LIMIT),
+                         self.describe_student, on_select, label=lambda student: student.roll_number,
+                         **options)
+
+    @staticmethod
+    def describe_student(student):
+        course = f" ({student.course_name})" if student.course_name else ""
+        return f"{student.roll_number}  {student.name}{course}"
@@ -0,0 +1,111 @@
+import time
+import tkinter as tk
+
+
+class _View:
+    def __init__(self, frame, refresh, max_age):
+        self.frame = frame
+        self.refresh = refresh
+        self.max_age = max_age
+        self.loaded_at = None
+
+    def stale(self):
+        return self.loaded_at is None or time.monotonic() - self.loaded_at > self.max_age
+
+
+# Keeps each screen of a dashboard alive once it has been built. Switching screens hides
+# the current frame and shows the cached one instead of destroying and rebuilding every
+# widget, and data is reloaded only when it is older than max_age seconds (or was
+# invalidated), not on every sidebar click.
+class ViewManager:
+    def __init__(self, container, max_age=60):
+        self.container = container
+        self.max_age = max_age
+        self._views = {}
+        self.current = None
+
+    # 🔹 Show view name. The first time, build(frame) creates its widgets inside frame and
+    # returns refresh() (or None for views without data), which reloads the data into the
+    # existing widgets. Clicking the view that is already showing refreshes it.
+    def show(self, name, build, max_age=None):
+        view = self._views.get(name)
+        if view is None:
+            frame = tk.Frame(self.container, bg='white')
+            view = _View(frame, build(frame), self.max_age if max_age is None else max_age)
+            self._views[name] = view
+
+        refresh = view.stale() or name == self.current
+        if name != self.current:
+            if self.current is not None:
+                self._views[self.current].frame.pack_forget()
+            view.frame.pack(fill=tk.BOTH, expand=True)
+            self.current = name
+
+        if view.refresh and refresh:
+            view.loaded_at = time.monotonic()
+            view.refresh()
+
+    # 🔹 Reload name (every view if None) the next time it is shown
+    def invalidate(self, *names):
+        for name in names or list(self._views):
+            if name in self._views:
+                self._views[name].loaded_at = None
+
+
+# Keeps a Treeview in step with a list of rows by key. Only rows that were added, removed,
+# changed or moved touch the widget, so refreshing a long list is cheap and the user's
+# scroll position and selection survive it.
+class TreeRows:
+    def __init__(self, tree):
+        self.tree = tree
+        self.rows = {}
+
+    # 🔹 Make the tree show exactly rows: (key, values) pairs in display order.
+    # The key becomes the item iid.
+    def update(self, rows):
+        rows = [(str(key), tuple(values)) for key, values in rows]
+        wanted = dict(rows)
+        gone = [iid for iid in self.rows if iid not in wanted]
+        if gone:
+            self.tree.delete(*gone)
+            for iid in gone:
+                del self.rows[iid]
+        self.extend(rows)
+
+        order = [iid for iid, _ in rows]
+        if list(self.tree.get_children()) != order:
+            self.tree.set_children('', *order)
+
+    # 🔹 Add rows at the end (or update them in place if already shown), e.g. the next page
+    def extend(self, rows):
+        for key, values in rows:
+            iid, values = str(key), tuple(values)
+            current = self.rows.get(iid)
+            if current is None:
+                self.tree.insert('', tk.END, iid=iid, values=values)
+            elif current != values:
+                self.tree.item(iid, values=values)
+            self.rows[iid] = values
+
+    # 🔹 Add rows above the first one, in the given order, e.g. the previous page
+    def prepend(self, rows):
+        for index, (key, values) in enumerate(rows):
+            iid, values = str(key), tuple(values)
+            if iid in self.rows:
+                self.tree.move(iid, '', index)
+                self.tree.item(iid, values=values)
+            else:
+                self.tree.insert('', index, iid=iid, values=values)
+            self.rows[iid] = values
+
+    def remove(self, keys):
+        iids = [str(key) for key in keys if str(key) in self.rows]
+        if iids:
+            self.tree.delete(*iids)
+            for iid in iids:
+                del self.rows[iid]
+
+    def clear(self):
+        if self.rows:
+            self.tree.delete(*self.rows)
+            self.rows = {}
@@ -0,0 +1,79 @@
+import unittest
+
+from src.database.db_config import DatabaseConfig
+from src.database.db_operations import DatabaseOperations
+
+
+class AttendanceSummaryTest(unittest.TestCase):
+    def setUp(self):
+        self.db = DatabaseConfig(backend='sqlite', query_stats=False)
+        self.db.initialize_database()
+        self.ops = DatabaseOperations(self.db)
+        self.student_id, self.subject_id, self.faculty_id = 1, 1, 1
+
+    def tearDown(self):
+        self.db.disconnect()
+
+    def mark(self, day, status):
+        self.assertIsNotNone(self.ops.mark_attendance(self.student_id, self.subject_id, f'2026-09-{day:02d}',
+                                                      status, self.faculty_id))
+
+    def summary(self):
+        row = self.db.fetch_one("""SELECT total, present, on_leave FROM attendance_summary 
+                                   WHERE student_id = %s AND subject_id = %s""",
+                                (self.student_id, self.subject_id))
+        return row and (row['total'], row['present'], row['on_leave'])
+
+    def recount(self):
+        row = self.db.fetch_one("""SELECT COUNT(*) AS total, 
+                                   SUM(CASE WHEN status = 'Present' THEN 1 ELSE 0 END) AS present, 
+                                   SUM(CASE WHEN status = 'Leave' THEN 1 ELSE 0 END) AS on_leave 
+                                   FROM attendance WHERE student_id = %s AND subject_id = %s""",
+                                (self.student_id, self.subject_id))
+        return row['total'], row['present'] or 0, row['on_leave'] or 0
+
+    def test_inserts_are_counted(self):
+        self.mark(1, 'Present')
+        self.mark(2, 'Absent')
+        self.mark(3, 'Leave')
+        self.assertEqual(self.summary(), (3, 1, 1))
+        self.assertEqual(self.ops.get_attendance_percentage(self.student_id, self.subject_id), 33.33)
+
+    def test_absent_to_present_flip(self):
+        self.mark(1, 'Absent')
+        self.mark(2, 'Present')
+        self.mark(1, 'Present')         # re-marked: the upsert's UPDATE path
+        self.assertEqual(self.summary(), (2, 2, 0))
+        self.mark(1, 'Leave')
+        self.assertEqual(self.summary(), (2, 1, 1))
+        self.mark(1, 'Leave')           # unchanged status changes nothing
+        self.assertEqual(self.summary(), (2, 1, 1))
+        self.assertEqual(self.summary(), self.recount())
+
+    def test_bulk_marking_is_counted(self):
+        self.ops.mark_attendance_bulk(self.subject_id, '2026-09-01', [(self.student_id, 'Absent')], self.faculty_id)
+        self.ops.mark_attendance_bulk(self.subject_id, '2026-09-01', [(self.student_id, 'Present')], self.faculty_id)
+        self.assertEqual(self.summary(), (1, 1, 0))
+
+    def test_deletes_are_counted(self):
+        self.mark(1, 'Present')
+        self.mark(2, 'Leave')
+        self.db.execute_query("DELETE FROM attendance WHERE attendance_date = %s", ('2026-09-01',))
+        self.assertEqual(self.summary(), (1, 0, 1))
+
+    def test_rebuild_repairs_drift(self):
+        self.mark(1, 'Present')
+        self.mark(2, 'Absent')
+        # Drift: totals changed behind the triggers' back, plus a pair with no attendance at all
+        self.db.execute_query("UPDATE attendance_summary SET total = 10, present = 0")
+        self.db.execute_query("""INSERT INTO attendance_summary (student_id, subject_id, total, present, on_leave) 
+                                 VALUES (%s, %s, 4, 4, 0)""", (self.student_id, 2))
+        self.assertTrue(self.ops.rebuild_attendance_summary())
+        self.assertEqual(self.summary(), (2, 1, 0))
+        self.assertEqual(self.ops.get_attendance_percentage(self.student_id, 2), 0.0)
+        self.assertEqual([row['subject_id'] for row in self.ops.get_attendance_summary(self.student_id)],
+                         [self.subject_id])
+
+
+if __name__ == '__main__':
+    unittest.main()
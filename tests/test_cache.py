@@ -0,0 +1,132 @@
+import time
+import unittest
+
+from src.database.cache import TTLCache
+from src.database.db_config import DatabaseConfig
+from src.database.db_operations import DatabaseOperations
+
+
+class TTLCacheTest(unittest.TestCase):
+    def test_hits_and_misses(self):
+        cache = TTLCache()
+        loads = []
+        loader = lambda: loads.append(1) or ['row']
+        self.assertEqual(cache.get_or_load('k', loader), ['row'])
+        self.assertEqual(cache.get_or_load('k', loader), ['row'])
+        self.assertEqual(len(loads), 1)
+        stats = cache.stats()
+        self.assertEqual((stats['hits'], stats['misses'], stats['hit_rate']), (1, 1, 0.5))
+
+    def test_entries_expire_after_ttl(self):
+        cache = TTLCache(ttl=0.02)
+        cache.set('k', 1)
+        self.assertEqual(cache.get('k'), (True, 1))
+        time.sleep(0.03)
+        self.assertEqual(cache.get('k'), (False, None))
+        self.assertEqual(cache.stats()['size'], 0)
+
+    def test_least_recently_used_is_evicted(self):
+        cache = TTLCache(maxsize=2)
+        cache.set('a', 1)
+        cache.set('b', 2)
+        cache.get('a')            # b is now the least recently used
+        cache.set('c', 3)
+        self.assertEqual(cache.get('b'), (False, None))
+        self.assertEqual(cache.get('a'), (True, 1))
+        self.assertEqual(cache.get('c'), (True, 3))
+        self.assertEqual(cache.stats()['evictions'], 1)
+
+    def test_empty_results_optionally_not_cached(self):
+        cache = TTLCache()
+        cache.get_or_load('k', lambda: [], cache_empty=False)
+        self.assertEqual(cache.get('k'), (False, None))
+        cache.get_or_load('k', lambda: [])
+        self.assertEqual(cache.get('k'), (True, []))
+
+    def test_invalidate_prefix(self):
+        cache = TTLCache()
+        cache.set(('subjects', None), 1)
+        cache.set(('subjects', 3), 2)
+        cache.set(('courses',), 3)
+        cache.invalidate('subjects', prefix=True)
+        self.assertEqual(cache.stats()['size'], 1)
+        self.assertEqual(cache.get(('courses',)), (True, 3))
+
+    def test_invalidate_where(self):
+        cache = TTLCache()
+        cache.set(('roll', 'A1'), {'student_id': 1})
+        cache.set(('roll', 'A2'), {'student_id': 2})
+        cache.invalidate_where(lambda key, value: value['student_id'] == 1)
+        self.assertEqual(cache.get(('roll', 'A1')), (False, None))
+        self.assertEqual(cache.get(('roll', 'A2')), (True, {'student_id': 2}))
+
+
+class ReferenceCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.db = DatabaseConfig(backend='sqlite', query_stats=False)
+        self.db.initialize_database()
+        self.ops = DatabaseOperations(self.db)
+
+    def tearDown(self):
+        self.db.disconnect()
+
+    def test_lists_are_served_from_cache(self):
+        courses = self.ops.get_all_courses()
+        # Changed behind the cache's back: still the cached list
+        self.db.execute_query("UPDATE courses SET course_name = 'Renamed'")
+        self.assertIs(self.ops.get_all_courses(), courses)
+        self.assertEqual(self.db.reference_cache.stats()['hits'], 1)
+
+    def test_add_course_invalidates_courses(self):
+        before = len(self.ops.get_all_courses())
+        self.ops.add_course('NEW1', 'New Course', 4, 'Testing')
+        courses = self.ops.get_all_courses()
+        self.assertEqual(len(courses), before + 1)
+        self.assertIn('NEW1', [course.course_code for course in courses])
+
+    def test_add_subject_invalidates_every_subject_list(self):
+        course_id = self.ops.get_all_courses()[0].course_id
+        all_before = len(self.ops.get_all_subjects())
+        course_before = len(self.ops.get_all_subjects(course_id))
+        self.ops.add_subject('NEWSUB1', 'New Subject', course_id, 3, 1)
+        self.assertEqual(len(self.ops.get_all_subjects()), all_before + 1)
+        self.assertEqual(len(self.ops.get_all_subjects(course_id)), course_before + 1)
+
+
+
+class StudentCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.db = DatabaseConfig(backend='sqlite', query_stats=False)
+        self.db.initialize_database()
+        self.ops = DatabaseOperations(self.db)
+        self.student = self.ops.get_student_by_id(1)
+
+    def tearDown(self):
+        self.db.disconnect()
+
+    def lookup(self):
+        return self.ops.get_student_by_roll(self.student.roll_number)
+
+    def test_roll_lookups_are_cached(self):
+        first = self.lookup()
+        self.assertIs(self.lookup(), first)
+        self.assertEqual(self.db.student_cache.stats()['hits'], 1)
+
+    def test_misses_are_not_cached(self):
+        self.assertIsNone(self.ops.get_student_by_roll('NOPE'))
+        self.assertEqual(self.db.student_cache.stats()['size'], 0)
+
+    def test_update_student_invalidates(self):
+        self.lookup()
+        s = self.student
+        self.ops.update_student(s.student_id, 'Changed Name', s.email, s.phone, s.address, s.semester)
+        self.assertEqual(self.lookup().name, 'Changed Name')
+
+    def test_delete_student_invalidates(self):
+        self.lookup()
+        self.ops.delete_student(self.student.student_id)
+        self.assertEqual(self.lookup().status, 'Inactive')
+
+
+if __name__ == '__main__':
+    unittest.main()
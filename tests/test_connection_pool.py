@@ -0,0 +1,152 @@
+import sqlite3
+import threading
+import time
+import unittest
+
+from src.database.connection_pool import ConnectionPool, PoolError
+
+
+class DroppedLink(sqlite3.OperationalError):
+    pass
+
+
+class ConnectionPoolTest(unittest.TestCase):
+    def setUp(self):
+        self.opened = []
+        self.pools = []
+
+    def tearDown(self):
+        for pool in self.pools:
+            pool.close_all()
+
+    def connect(self):
+        connection = sqlite3.connect(':memory:', check_same_thread=False)
+        self.opened.append(connection)
+        return connection
+
+    def pool(self, **options):
+        options.setdefault('disconnect_errors', (DroppedLink,))
+        pool = ConnectionPool(self.connect, **options)
+        self.pools.append(pool)
+        return pool
+
+    @staticmethod
+    def is_open(connection):
+        try:
+            connection.execute("SELECT 1")
+            return True
+        except sqlite3.ProgrammingError:
+            return False
+
+    def test_reuses_idle_connections(self):
+        pool = self.pool(size=2)
+        with pool.connection() as first:
+            pass
+        with pool.connection() as second:
+            self.assertIs(second, first)
+        self.assertEqual(len(self.opened), 1)
+        self.assertEqual(pool.stats()['idle'], 1)
+
+    def test_checkout_times_out_when_exhausted(self):
+        pool = self.pool(size=1, timeout=0.05)
+        connection = pool.get_connection()
+        start = time.monotonic()
+        with self.assertRaises(PoolError):
+            pool.get_connection()
+        self.assertGreaterEqual(time.monotonic() - start, 0.05)
+        pool.release(connection)
+
+    def test_waiting_checkout_gets_released_connection(self):
+        pool = self.pool(size=1, timeout=5)
+        connection = pool.get_connection()
+        threading.Timer(0.05, pool.release, (connection,)).start()
+        self.assertIs(pool.get_connection(), connection)
+
+    def test_old_connections_are_recycled(self):
+        pool = self.pool(recycle=0.01)
+        with pool.connection() as first:
+            pass
+        time.sleep(0.02)
+        with pool.connection() as second:
+            self.assertIsNot(second, first)
+        self.assertFalse(self.is_open(first))
+
+    def test_disconnect_error_discards_connection(self):
+        pool = self.pool()
+        with self.assertRaises(DroppedLink):
+            with pool.connection() as dead:
+                raise DroppedLink("server has gone away")
+        self.assertFalse(self.is_open(dead))
+        self.assertEqual(pool.stats()['open'], 0)
+
+    def test_other_errors_keep_connection(self):
+        pool = self.pool()
+        with self.assertRaises(ValueError):
+            with pool.connection() as connection:
+                raise ValueError("not a database problem")
+        self.assertTrue(self.is_open(connection))
+        self.assertEqual(pool.stats()['idle'], 1)
+
+    def test_uncommitted_work_is_rolled_back_on_release(self):
+        pool = self.pool()
+        with pool.connection() as connection:
+            connection.execute("CREATE TABLE t (a INT)")
+            connection.commit()
+            connection.execute("INSERT INTO t VALUES (1)")
+        with pool.connection() as connection:
+            self.assertEqual(connection.execute("SELECT COUNT(*) FROM t").fetchone(), (0,))
+
+    def test_stale_idle_connections_are_pinged(self):
+        pinged = []
+
+        def ping(connection):
+            pinged.append(connection)
+            raise DroppedLink("server has gone away")
+        pool = self.pool(ping=ping, ping_after=0.01)
+        with pool.connection() as dead:
+            pass
+        # Used again right away: trusted without a ping
+        with pool.connection() as connection:
+            self.assertIs(connection, dead)
+        self.assertEqual(pinged, [])
+
+        time.sleep(0.02)
+        with pool.connection() as connection:
+            self.assertIsNot(connection, dead)
+        self.assertEqual(pinged, [dead])
+        self.assertFalse(self.is_open(dead))
+        self.assertEqual(pool.stats()['open'], 1)
+
+    def test_close_all_with_connections_checked_out(self):
+        pool = self.pool(size=2)
+        idle = pool.get_connection()
+        busy = pool.get_connection()
+        pool.release(idle)
+        pool.close_all()
+        self.assertFalse(self.is_open(idle))
+        # The busy connection keeps working until it is handed back, then it is closed
+        self.assertTrue(self.is_open(busy))
+        pool.release(busy)
+        self.assertFalse(self.is_open(busy))
+        self.assertEqual(pool.stats()['open'], 0)
+        with self.assertRaises(PoolError):
+            pool.get_connection()
+
+    def test_failed_connect_frees_its_slot(self):
+        attempts = []
+
+        def connect():
+            attempts.append(1)
+            if len(attempts) == 1:
+                raise sqlite3.OperationalError("unable to open database")
+            return self.connect()
+        pool = ConnectionPool(connect, size=1, timeout=0.05)
+        self.pools.append(pool)
+        with self.assertRaises(sqlite3.OperationalError):
+            pool.get_connection()
+        with pool.connection():
+            self.assertEqual(pool.stats()['open'], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,149 @@
+import os
+import sqlite3
+import tempfile
+import unittest
+
+from src.auth.authentication import Authentication
+from src.database.backends import SQLiteBackend
+from src.database.db_config import DatabaseConfig
+from src.database.db_operations import DatabaseOperations
+
+
+class DroppedLink(sqlite3.OperationalError):
+    pass
+
+
+# SQLite never loses its link; this backend treats DroppedLink like MySQL's "server has gone away".
+# The next `drops` statements fail as if the link dropped after the server ran them.
+class FlakyBackend(SQLiteBackend):
+    disconnect_errors = (DroppedLink,)
+    drops = 0
+
+    def is_disconnect(self, error):
+        return isinstance(error, DroppedLink)
+
+    def cursor(self, connection, dictionary=False, buffered=False, prepared=False):
+        return FlakyCursor(self, super().cursor(connection, dictionary))
+
+
+class FlakyCursor:
+    def __init__(self, backend, cursor):
+        self.backend = backend
+        self.cursor = cursor
+
+    def __getattr__(self, name):
+        return getattr(self.cursor, name)
+
+    def _run(self, method, *args):
+        result = method(*args)
+        if self.backend.drops:
+            self.backend.drops -= 1
+            raise DroppedLink("server has gone away")
+        return result
+
+    def execute(self, *args):
+        return self._run(self.cursor.execute, *args)
+
+    def executemany(self, *args):
+        return self._run(self.cursor.executemany, *args)
+
+
+class ReconnectTest(unittest.TestCase):
+    def setUp(self):
+        handle, self.path = tempfile.mkstemp(suffix='.db')
+        os.close(handle)
+        self.db = DatabaseConfig(backend='sqlite', sqlite_path=self.path, query_stats=False)
+        self.db.backend = FlakyBackend(self.path)
+        self.db.connect()
+        self.db.execute_query("CREATE TABLE t (id INTEGER PRIMARY KEY, name TEXT)")
+        self.db.execute_query("INSERT INTO t (name) VALUES ('a')")
+
+    def tearDown(self):
+        self.db.disconnect()
+        os.remove(self.path)
+
+    def count(self):
+        return self.db.fetch_one("SELECT COUNT(*) AS n FROM t")['n']
+
+    def test_reads_are_retried(self):
+        self.db.backend.drops = 1
+        self.assertEqual(self.db.fetch_all("SELECT name FROM t"), [{'name': 'a'}])
+        self.db.backend.drops = 1
+        self.assertEqual(self.db.fetch_one("SELECT name FROM t"), {'name': 'a'})
+        self.db.backend.drops = 1
+        self.assertEqual(list(self.db.iter_rows("SELECT name FROM t", row_type='tuple')), [('a',)])
+
+    def test_a_read_is_retried_only_once(self):
+        self.db.backend.drops = 2
+        self.assertEqual(self.db.fetch_all("SELECT name FROM t"), [])
+
+    def test_writes_are_not_retried(self):
+        self.db.backend.drops = 1
+        self.assertIsNone(self.db.execute_query("INSERT INTO t (name) VALUES ('b')"))
+        self.db.backend.drops = 1
+        self.assertIsNone(self.db.execute_many("INSERT INTO t (name) VALUES (%s)", [('c',), ('d',)]))
+        # Each write ran exactly once (and was rolled back with its connection), never twice
+        self.assertEqual(self.count(), 1)
+
+    def test_dead_connections_are_dropped(self):
+        self.db.backend.drops = 1
+        self.db.execute_query("INSERT INTO t (name) VALUES ('b')")
+        stats = self.db.pool.stats()
+        self.assertEqual((stats['open'], stats['idle']), (0, 0))
+        self.assertEqual(self.count(), 1)
+
+
+
+class TransactionTest(unittest.TestCase):
+    def setUp(self):
+        self.db = DatabaseConfig(backend='sqlite', query_stats=False)
+        self.db.initialize_database()
+        self.auth = Authentication(self.db)
+        self.ops = DatabaseOperations(self.db)
+
+    def tearDown(self):
+        self.db.disconnect()
+
+    def user_exists(self, username):
+        return self.db.fetch_one("SELECT user_id FROM users WHERE username = %s", (username,)) is not None
+
+    def add_student(self, username, roll_number):
+        with self.db.transaction():
+            user_id = self.auth.create_user(username, 'secret', 'student')
+            self.ops.add_student(user_id, roll_number, 'New Student', f'{username}@student.edu', '9876543210',
+                                 '2005-01-31', 'Male', '', 1, 1)
+
+    def test_commits_together(self):
+        self.add_student('new1', 'NEW0001')
+        self.assertTrue(self.user_exists('new1'))
+        self.assertIsNotNone(self.ops.get_student_by_roll('NEW0001'))
+
+    def test_failed_student_insert_rolls_back_the_users_row(self):
+        taken_roll = self.ops.get_student_by_id(1).roll_number
+        with self.assertRaises(self.db.Error):
+            self.add_student('new2', taken_roll)
+        # Without the transaction this users row would be left behind with no student
+        self.assertFalse(self.user_exists('new2'))
+
+    def test_any_exception_rolls_back(self):
+        with self.assertRaises(RuntimeError):
+            with self.db.transaction():
+                self.auth.create_user('new3', 'secret', 'student')
+                raise RuntimeError("step failed")
+        self.assertFalse(self.user_exists('new3'))
+
+    def test_nested_transaction_joins_the_outer_one(self):
+        with self.assertRaises(RuntimeError):
+            with self.db.transaction():
+                with self.db.transaction():
+                    self.auth.create_user('new4', 'secret', 'student')
+                raise RuntimeError("outer block failed")
+        self.assertFalse(self.user_exists('new4'))
+
+    def test_errors_are_printed_outside_a_transaction(self):
+        self.assertIsNone(self.db.execute_query("INSERT INTO no_such_table VALUES (1)"))
+        self.assertEqual(self.db.fetch_all("SELECT * FROM no_such_table"), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
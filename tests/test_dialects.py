@@ -0,0 +1,140 @@
+import sqlite3
+import unittest
+
+from src.database.dialects import MySQLDialect, SQLiteDialect
+
+
+class MySQLDialectTest(unittest.TestCase):
+    def test_passes_queries_through(self):
+        query = "INSERT INTO t (a) VALUES (%s) ON DUPLICATE KEY UPDATE a = VALUES(a)"
+        self.assertEqual(MySQLDialect().translate(query), query)
+
+
+class SQLiteDialectTest(unittest.TestCase):
+    def setUp(self):
+        self.translate = SQLiteDialect().translate
+
+    def test_placeholders(self):
+        self.assertEqual(self.translate("SELECT * FROM t WHERE a = %s AND b = '%s'"),
+                         "SELECT * FROM t WHERE a = ? AND b = '%s'")
+
+    def test_auto_increment_primary_key(self):
+        self.assertEqual(self.translate("CREATE TABLE t (id INT AUTO_INCREMENT PRIMARY KEY, a INT)"),
+                         "CREATE TABLE t (id INTEGER PRIMARY KEY AUTOINCREMENT, a INT)")
+
+    def test_enum_column(self):
+        self.assertEqual(self.translate("CREATE TABLE t (status ENUM('Active', 'Inactive') DEFAULT 'Active')"),
+                         "CREATE TABLE t (status TEXT CHECK (status IN ('Active', 'Inactive')) DEFAULT 'Active')")
+
+    def test_unique_key(self):
+        self.assertEqual(self.translate("CREATE TABLE t (a INT, b INT, UNIQUE KEY unique_ab (a, b))"),
+                         "CREATE TABLE t (a INT, b INT, UNIQUE (a, b))")
+
+    def test_date_functions(self):
+        self.assertEqual(self.translate("INSERT INTO t (d, ts) VALUES (CURDATE(), NOW())"),
+                         "INSERT INTO t (d, ts) VALUES (DATE('now', 'localtime'), DATETIME('now', 'localtime'))")
+
+    def test_limit_is_unchanged(self):
+        self.assertEqual(self.translate("SELECT * FROM t ORDER BY id LIMIT %s"),
+                         "SELECT * FROM t ORDER BY id LIMIT ?")
+
+    def test_like_escape(self):
+        self.assertEqual(self.translate("SELECT * FROM t WHERE a LIKE %s"),
+                         "SELECT * FROM t WHERE a LIKE ? ESCAPE '\\'")
+
+    def test_alter_table_add_index(self):
+        self.assertEqual(self.translate("ALTER TABLE marks ADD INDEX idx_marks_student (student_id, subject_id)"),
+                         "CREATE INDEX IF NOT EXISTS idx_marks_student ON marks (student_id, subject_id)")
+        self.assertEqual(self.translate("ALTER TABLE t ADD UNIQUE INDEX idx_a (a)"),
+                         "CREATE UNIQUE INDEX IF NOT EXISTS idx_a ON t (a)")
+        self.assertEqual(self.translate("ALTER TABLE students ADD FULLTEXT INDEX ft_name (name, email)"),
+                         "SELECT 1")
+
+    def test_upsert_with_values(self):
+        self.assertEqual(
+            self.translate("INSERT INTO t (k, a, b) VALUES (%s, %s, %s) "
+                           "ON DUPLICATE KEY UPDATE a = VALUES(a), b = b + VALUES(b)"),
+            "INSERT INTO t (k, a, b) VALUES (?, ?, ?) ON CONFLICT DO UPDATE SET a = excluded.a, b = b + excluded.b")
+
+    def test_upsert_with_only_self_assignments_ignores(self):
+        self.assertEqual(self.translate("INSERT INTO t (k, a) VALUES (%s, %s) ON DUPLICATE KEY UPDATE k = k"),
+                         "INSERT OR IGNORE INTO t (k, a) VALUES (?, ?)")
+
+    def test_insert_select_upsert_gets_where(self):
+        self.assertEqual(
+            self.translate("INSERT INTO s (k, n) SELECT k, COUNT(*) FROM t "
+                           "ON DUPLICATE KEY UPDATE n = VALUES(n)"),
+            "INSERT INTO s (k, n) SELECT k, COUNT(*) FROM t WHERE true ON CONFLICT DO UPDATE SET n = excluded.n")
+        # An existing WHERE or GROUP BY already separates the SELECT from ON CONFLICT
+        self.assertEqual(
+            self.translate("INSERT INTO s (k, n) SELECT k, COUNT(*) FROM t GROUP BY k "
+                           "ON DUPLICATE KEY UPDATE n = VALUES(n)"),
+            "INSERT INTO s (k, n) SELECT k, COUNT(*) FROM t GROUP BY k ON CONFLICT DO UPDATE SET n = excluded.n")
+
+    def test_update_join(self):
+        self.assertEqual(
+            self.translate("UPDATE marks m JOIN grade_bands b ON b.scheme_id = %s SET m.grade = b.grade "
+                           "WHERE m.scheme_id <> %s"),
+            "UPDATE marks AS m SET grade = b.grade FROM grade_bands AS b "
+            "WHERE (b.scheme_id = ?) AND (m.scheme_id <> ?)")
+
+    def test_analyze_table(self):
+        self.assertEqual(self.translate("ANALYZE TABLE students, marks"), "ANALYZE")
+
+    def test_single_statement_trigger_gets_begin_end(self):
+        self.assertEqual(
+            self.translate("CREATE TRIGGER t_ai AFTER INSERT ON t FOR EACH ROW INSERT INTO log VALUES (NEW.id)"),
+            "CREATE TRIGGER t_ai AFTER INSERT ON t FOR EACH ROW BEGIN INSERT INTO log VALUES (NEW.id); END")
+
+
+# The translated statements must not just look right: run them on a real SQLite database
+class SQLiteDialectExecutionTest(unittest.TestCase):
+    def setUp(self):
+        self.translate = SQLiteDialect().translate
+        self.connection = sqlite3.connect(':memory:')
+        self.execute(
+            "CREATE TABLE t (id INT AUTO_INCREMENT PRIMARY KEY, k INT, n INT, "
+            "status ENUM('Active', 'Inactive') DEFAULT 'Active', added DATE, UNIQUE KEY unique_k (k))")
+
+    def tearDown(self):
+        self.connection.close()
+
+    def execute(self, query, params=()):
+        return self.connection.execute(self.translate(query), params)
+
+    def rows(self):
+        return self.execute("SELECT k, n FROM t ORDER BY k").fetchall()
+
+    def test_upsert(self):
+        query = "INSERT INTO t (k, n, added) VALUES (%s, %s, CURDATE()) ON DUPLICATE KEY UPDATE n = n + VALUES(n)"
+        self.execute(query, (1, 5))
+        self.execute(query, (1, 2))
+        self.execute(query, (2, 1))
+        self.assertEqual(self.rows(), [(1, 7), (2, 1)])
+
+    def test_insert_ignore(self):
+        query = "INSERT INTO t (k, n) VALUES (%s, %s) ON DUPLICATE KEY UPDATE k = k"
+        self.execute(query, (1, 5))
+        self.execute(query, (1, 9))
+        self.assertEqual(self.rows(), [(1, 5)])
+
+    def test_insert_select_upsert(self):
+        self.execute("CREATE TABLE src (k INT, n INT)")
+        self.connection.executemany("INSERT INTO src VALUES (?, ?)", [(1, 1), (2, 4)])
+        self.execute("INSERT INTO t (k, n) VALUES (1, 100)")
+        self.execute("INSERT INTO t (k, n) SELECT k, n FROM src ON DUPLICATE KEY UPDATE n = VALUES(n)")
+        self.assertEqual(self.rows(), [(1, 1), (2, 4)])
+
+    def test_enum_check(self):
+        with self.assertRaises(sqlite3.IntegrityError):
+            self.execute("INSERT INTO t (k, status) VALUES (%s, %s)", (1, 'Deleted'))
+
+    def test_like_escape(self):
+        self.execute("CREATE TABLE names (name TEXT)")
+        self.connection.executemany("INSERT INTO names VALUES (?)", [('a_b',), ('axb',)])
+        rows = self.execute("SELECT name FROM names WHERE name LIKE %s", ('a\\_b',)).fetchall()
+        self.assertEqual(rows, [('a_b',)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,65 @@
+import os
+import tempfile
+import unittest
+
+from src.database.db_config import DatabaseConfig
+from src.database.db_operations import GRADE_LETTERS, GRADE_THRESHOLDS, DatabaseOperations, grade
+
+
+class GradeTest(unittest.TestCase):
+    def test_band_boundaries(self):
+        cases = [(0, 'F'), (39.99, 'F'), (40, 'D'), (59.5, 'C'), (70, 'B+'), (89.99, 'A'), (90, 'A+'), (100, 'A+')]
+        for obtained, expected in cases:
+            self.assertEqual(grade(GRADE_THRESHOLDS, GRADE_LETTERS, obtained, 100), expected, obtained)
+
+    def test_percentage_of_max_marks(self):
+        self.assertEqual(grade(GRADE_THRESHOLDS, GRADE_LETTERS, 35, 50), 'B+')
+
+    def test_calculate_grade_uses_the_given_scale(self):
+        scale = (None, [50], ['F', 'P'])
+        self.assertEqual(DatabaseOperations.calculate_grade(49, 100, scale), 'F')
+        self.assertEqual(DatabaseOperations.calculate_grade(50, 100, scale), 'P')
+
+
+class GradingSchemeTest(unittest.TestCase):
+    def setUp(self):
+        handle, self.path = tempfile.mkstemp(suffix='.db')
+        os.close(handle)
+        self.db = DatabaseConfig(backend='sqlite', sqlite_path=self.path)
+        self.db.initialize_database()
+        self.ops = DatabaseOperations(self.db)
+        # A second client sharing the database file
+        self.other_db = DatabaseConfig(backend='sqlite', sqlite_path=self.path)
+        self.other = DatabaseOperations(self.other_db)
+
+    def tearDown(self):
+        self.db.disconnect()
+        self.other_db.disconnect()
+        os.remove(self.path)
+
+    def marks(self):
+        return [(row['exam_type'], row['grade']) for row in
+                self.db.fetch_all("SELECT exam_type, grade FROM marks ORDER BY mark_id")]
+
+    def test_scheme_activated_elsewhere_applies_to_new_marks(self):
+        self.ops.add_marks(1, 1, 'Internal 1', 60, 100, 1)
+        self.other.create_grading_scheme('Pass/Fail', [(0, 'F'), (50, 'P')], activate=True)
+        self.ops.add_marks(1, 1, 'Internal 2', 45, 100, 1)
+        self.assertEqual(self.marks(), [('Internal 1', 'P'), ('Internal 2', 'F')])
+
+    def test_marks_saved_during_a_switch_are_regraded(self):
+        scheme_id = self.other.create_grading_scheme('Pass/Fail', [(0, 'F'), (50, 'P')])
+        read_scale = self.ops.get_grading_scale
+
+        # The switch lands between reading the scale and inserting the marks
+        def racing_read():
+            scale = read_scale()
+            self.other.activate_grading_scheme(scheme_id)
+            return scale
+        self.ops.get_grading_scale = racing_read
+        self.ops.add_marks_bulk(1, 'Internal 1', [(1, 55, 100), (1, 20, 100)], 1)
+        self.assertEqual(self.marks(), [('Internal 1', 'P'), ('Internal 1', 'F')])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,118 @@
+import os
+import tempfile
+import threading
+import unittest
+
+from src.database.db_config import DatabaseConfig
+from src.database.db_operations import DatabaseOperations
+from src.database.group_commit import GroupCommitter
+
+
+class GroupCommitterTest(unittest.TestCase):
+    def setUp(self):
+        self.batches = []
+        self.committer = None
+
+    def tearDown(self):
+        if self.committer:
+            self.committer.close()
+
+    # Records each batch; a statement whose query is 'bad' fails the whole batch
+    def write_batch(self, statements):
+        self.batches.append([query for query, _, _ in statements])
+        if any(query == 'bad' for query, _, _ in statements):
+            raise ValueError("batch rejected")
+        return [params for _, params, _ in statements]
+
+    def submit_concurrently(self, queries):
+        results, errors = {}, {}
+        start = threading.Barrier(len(queries))
+
+        def submit(index, query):
+            start.wait()
+            try:
+                results[index] = self.committer.submit(query, index)
+            except Exception as e:
+                errors[index] = e
+        threads = [threading.Thread(target=submit, args=item) for item in enumerate(queries)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return results, errors
+
+    def test_concurrent_writes_share_one_batch(self):
+        self.committer = GroupCommitter(self.write_batch, window=0.2)
+        results, errors = self.submit_concurrently(['w'] * 5)
+        self.assertEqual(self.batches, [['w'] * 5])
+        # Every caller gets its own statement's result
+        self.assertEqual(results, {index: index for index in range(5)})
+        self.assertEqual(errors, {})
+
+    def test_max_batch(self):
+        self.committer = GroupCommitter(self.write_batch, window=0.2, max_batch=2)
+        results, _ = self.submit_concurrently(['w'] * 5)
+        self.assertEqual(len(results), 5)
+        self.assertTrue(all(len(batch) <= 2 for batch in self.batches))
+
+    def test_a_bad_write_fails_alone(self):
+        self.committer = GroupCommitter(self.write_batch, window=0.2)
+        results, errors = self.submit_concurrently(['w', 'bad', 'w'])
+        self.assertEqual(set(results), {0, 2})
+        self.assertEqual(list(errors), [1])
+        self.assertIsInstance(errors[1], ValueError)
+        # The rejected batch, then each statement on its own
+        self.assertEqual(len(self.batches[0]), 3)
+        self.assertEqual(sorted(map(len, self.batches[1:])), [1, 1, 1])
+
+    def test_single_error_reaches_the_caller(self):
+        self.committer = GroupCommitter(self.write_batch, window=0)
+        with self.assertRaises(ValueError):
+            self.committer.submit('bad')
+        self.assertEqual(self.committer.submit('w', 7), 7)
+
+
+class DatabaseGroupCommitTest(unittest.TestCase):
+    def setUp(self):
+        handle, self.path = tempfile.mkstemp(suffix='.db')
+        os.close(handle)
+        self.db = DatabaseConfig(backend='sqlite', sqlite_path=self.path, group_commit_ms=50, query_stats=False)
+        self.db.initialize_database()
+        self.ops = DatabaseOperations(self.db)
+
+    def tearDown(self):
+        self.db.disconnect()
+        os.remove(self.path)
+
+    def test_refused_for_a_single_connection_pool(self):
+        with self.assertRaises(ValueError):
+            DatabaseConfig(backend='sqlite', group_commit_ms=5)
+        with self.assertRaises(ValueError):
+            DatabaseConfig(backend='sqlite', sqlite_path=self.path, pool_size=1, group_commit_ms=5)
+
+    def test_only_opted_in_writes_are_grouped(self):
+        submitted = []
+        submit = self.db.group_commit.submit
+        self.db.group_commit.submit = lambda *args: submitted.append(args[0]) or submit(*args)
+        self.ops.add_course('GC1', 'Grouped?', 4, 'Testing')
+        self.assertEqual(submitted, [])
+        self.assertEqual(self.ops.mark_attendance(1, 1, '2026-09-01', 'Present', 1), 1)
+        self.assertEqual(len(submitted), 1)
+
+    def test_concurrent_attendance_is_committed(self):
+        threads = [threading.Thread(target=self.ops.mark_attendance, args=(1, subject_id, '2026-09-01', 'Present', 1))
+                   for subject_id in range(1, 5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(self.db.fetch_one("SELECT COUNT(*) AS n FROM attendance")['n'], 4)
+
+    def test_errors_propagate_to_the_caller(self):
+        # student 999 doesn't exist: the foreign key fails this write only
+        self.assertIsNone(self.ops.mark_attendance(999, 1, '2026-09-01', 'Present', 1))
+        self.assertEqual(self.ops.mark_attendance(1, 1, '2026-09-01', 'Present', 1), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
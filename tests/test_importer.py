@@ -0,0 +1,112 @@
+import csv
+import os
+import tempfile
+import unittest
+
+from src.database.db_config import DatabaseConfig
+from src.database.importer import StudentImporter
+
+COLUMNS = ['username', 'password', 'roll_number', 'name', 'email', 'phone', 'course_code', 'semester',
+           'date_of_birth', 'gender', 'address']
+
+
+def student(n, **changes):
+    row = {'username': f'imp{n}', 'password': 'secret', 'roll_number': f'IMP{n:04d}', 'name': f'Student {n}',
+           'email': f'imp{n}@student.edu', 'phone': '9876543210', 'course_code': 'CSE', 'semester': '1',
+           'date_of_birth': '2005-01-31', 'gender': 'Female', 'address': ''}
+    row.update(changes)
+    return row
+
+
+class StudentImporterTest(unittest.TestCase):
+    def setUp(self):
+        self.db = DatabaseConfig(backend='sqlite', query_stats=False)
+        self.db.initialize_database()
+        self.importer = StudentImporter(self.db, chunk_size=4)
+        self.files = []
+
+    def tearDown(self):
+        self.db.disconnect()
+        for path in self.files:
+            os.remove(path)
+
+    def temp_path(self):
+        handle, path = tempfile.mkstemp(suffix='.csv')
+        os.close(handle)
+        self.files.append(path)
+        return path
+
+    def run_import(self, rows):
+        path = self.temp_path()
+        with open(path, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, COLUMNS)
+            writer.writeheader()
+            writer.writerows(rows)
+        return self.importer.import_csv(path)
+
+    def imported_rolls(self):
+        return [row['roll_number'] for row in self.db.fetch_all(
+            "SELECT roll_number FROM students WHERE roll_number LIKE 'IMP%' ORDER BY roll_number")]
+
+    def test_imports_valid_rows(self):
+        result = self.run_import([student(n) for n in range(1, 11)])
+        self.assertEqual((result.processed, result.imported, result.failed), (10, 10, 0))
+        self.assertEqual(len(self.imported_rolls()), 10)
+        row = self.db.fetch_one("""SELECT s.enrollment_date, s.course_id, u.role FROM students s 
+                                   JOIN users u ON u.user_id = s.user_id WHERE s.roll_number = 'IMP0001'""")
+        self.assertIsNotNone(row['enrollment_date'])
+        self.assertEqual(row['role'], 'student')
+
+    def test_invalid_rows_are_reported_and_the_rest_of_the_chunk_commits(self):
+        rows = [student(1), student(2, email='not-an-email'), student(3, semester='9'),
+                student(4), student(5, username='imp1'), student(6, course_code='XYZ', phone='123')]
+        result = self.run_import(rows)
+        self.assertEqual((result.processed, result.imported, result.failed), (6, 2, 4))
+        self.assertEqual(self.imported_rolls(), ['IMP0001', 'IMP0004'])
+        # CSV line numbers (the header is line 1)
+        self.assertEqual(result.errors, [
+            (3, 'IMP0002', 'invalid email'),
+            (4, 'IMP0003', 'semester must be 1-8'),
+            (6, 'IMP0005', 'duplicate username in file'),
+            (7, 'IMP0006', 'phone must be 10 digits; unknown course XYZ'),
+        ])
+
+    def test_existing_usernames_and_rolls_are_rejected(self):
+        self.run_import([student(1)])
+        result = self.run_import([student(1, roll_number='IMP0100'), student(2, roll_number='IMP0001'), student(3)])
+        self.assertEqual(result.imported, 1)
+        self.assertEqual([error[2] for error in result.errors],
+                         ["username already exists", "roll number already exists"])
+
+    def test_chunk_rejected_by_the_database_is_retried_row_by_row(self):
+        # A row only the database refuses, so the whole chunk's transaction fails first
+        with self.db.pool.connection() as connection:
+            connection.execute("""CREATE TRIGGER reject_student BEFORE INSERT ON students 
+                                  WHEN NEW.name = 'Rejected' BEGIN SELECT RAISE(ABORT, 'rejected by test'); END""")
+        result = self.run_import([student(1), student(2, name='Rejected'), student(3)])
+        self.assertEqual(result.imported, 2)
+        self.assertEqual(result.errors, [(3, 'IMP0002', 'rejected by test')])
+        self.assertEqual(self.imported_rolls(), ['IMP0001', 'IMP0003'])
+        # The rejected row's users insert was rolled back with it
+        self.assertIsNone(self.db.fetch_one("SELECT user_id FROM users WHERE username = 'imp2'"))
+
+    def test_error_report(self):
+        result = self.run_import([student(1, gender='Unknown')])
+        path = self.temp_path()
+        result.write_error_report(path)
+        with open(path, newline='', encoding='utf-8') as f:
+            self.assertEqual(list(csv.reader(f)), [
+                ['line', 'roll_number', 'error'],
+                ['2', 'IMP0001', 'gender must be one of Male, Female, Other'],
+            ])
+
+    def test_missing_columns(self):
+        path = self.temp_path()
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write("username,password\nx,y\n")
+        with self.assertRaises(ValueError):
+            self.importer.import_csv(path)
+
+
+if __name__ == '__main__':
+    unittest.main()
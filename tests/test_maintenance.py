@@ -0,0 +1,62 @@
+import argparse
+import unittest
+
+from src.database import maintenance
+from src.database.db_config import DatabaseConfig
+from src.database.db_operations import DatabaseOperations
+
+
+class ParseBandsTest(unittest.TestCase):
+    def test_parses_bands(self):
+        self.assertEqual(maintenance.parse_bands("0=F, 45=D,72.5=A"), [(0.0, 'F'), (45.0, 'D'), (72.5, 'A')])
+
+    def test_rejects_malformed_bands(self):
+        for text in ("0F", "0=", "x=F", "0=F,"):
+            with self.assertRaises(argparse.ArgumentTypeError, msg=text):
+                maintenance.parse_bands(text)
+
+
+class GradingSchemeCommandsTest(unittest.TestCase):
+    def setUp(self):
+        self.db = DatabaseConfig(backend='sqlite', query_stats=False)
+        self.db.initialize_database()
+        self.ops = DatabaseOperations(self.db)
+        self.ops.add_marks(1, 1, 'Internal 1', 50, 100, 1)
+
+    def tearDown(self):
+        self.db.disconnect()
+
+    def grade(self):
+        return self.db.fetch_one("SELECT grade FROM marks")['grade']
+
+    def create(self, bands, activate=False, no_regrade=False):
+        args = argparse.Namespace(name='Pass/Fail', bands=maintenance.parse_bands(bands),
+                                  activate=activate, no_regrade=no_regrade)
+        return maintenance.create_scheme(self.ops, args)
+
+    def test_create_without_activating(self):
+        self.assertTrue(self.create("0=F,50=P"))
+        self.assertEqual(self.ops.get_grading_scale()[0], 1)
+        self.assertEqual(self.grade(), 'C')
+
+    def test_create_and_activate_regrades(self):
+        self.assertTrue(self.create("0=F,50=P", activate=True))
+        self.assertEqual(self.ops.get_grading_scale()[0], 2)
+        self.assertEqual(self.grade(), 'P')
+
+    def test_activate_without_regrading(self):
+        self.create("0=F,50=P")
+        self.assertTrue(maintenance.activate_scheme(self.ops, argparse.Namespace(scheme_id=2, no_regrade=True)))
+        self.assertEqual(self.ops.get_grading_scale()[0], 2)
+        self.assertEqual(self.grade(), 'C')
+        self.assertTrue(maintenance.activate_scheme(self.ops, argparse.Namespace(scheme_id=2, no_regrade=False)))
+        self.assertEqual(self.grade(), 'P')
+
+    def test_failures(self):
+        self.assertFalse(self.create("10=F"))
+        self.assertFalse(maintenance.activate_scheme(self.ops, argparse.Namespace(scheme_id=99, no_regrade=False)))
+        self.assertEqual(self.ops.get_grading_scale()[0], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
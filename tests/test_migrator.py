@@ -0,0 +1,141 @@
+import os
+import re
+import sqlite3
+import tempfile
+import unittest
+
+from src.database.dialects import SQLiteDialect
+from src.database.migrator import MigrationRunner, discover_migrations, split_sql_statements
+
+
+class SplitSqlStatementsTest(unittest.TestCase):
+    def test_splits_on_semicolons(self):
+        script = "CREATE TABLE a (id INT);\nCREATE TABLE b (id INT);\n"
+        self.assertEqual(split_sql_statements(script),
+                         ["CREATE TABLE a (id INT)", "CREATE TABLE b (id INT)"])
+
+    def test_last_statement_without_semicolon(self):
+        self.assertEqual(split_sql_statements("SELECT 1;\nSELECT 2"), ["SELECT 1", "SELECT 2"])
+
+    def test_blank_statements_are_dropped(self):
+        self.assertEqual(split_sql_statements(";;\n  ;SELECT 1;;\n"), ["SELECT 1"])
+
+    def test_semicolon_inside_quotes(self):
+        script = """INSERT INTO t VALUES ('a;b', "c;d");\nSELECT `odd;name` FROM t;"""
+        self.assertEqual(split_sql_statements(script),
+                         ["INSERT INTO t VALUES ('a;b', \"c;d\")", "SELECT `odd;name` FROM t"])
+
+    def test_escaped_and_doubled_quotes(self):
+        script = r"INSERT INTO t VALUES ('it\'s;', 'it''s;');" + "\nSELECT 1;"
+        self.assertEqual(split_sql_statements(script),
+                         [r"INSERT INTO t VALUES ('it\'s;', 'it''s;')", "SELECT 1"])
+
+    def test_line_comments_are_removed(self):
+        script = "-- header; not a statement\nSELECT 1; -- trailing;\n# hash comment;\nSELECT 2;"
+        self.assertEqual(split_sql_statements(script), ["SELECT 1", "SELECT 2"])
+
+    def test_block_comments_are_removed(self):
+        script = "/* one;\n two; */ SELECT 1 /* inline; */ + 1;\nSELECT 2;"
+        self.assertEqual(split_sql_statements(script), ["SELECT 1  + 1", "SELECT 2"])
+
+    def test_comment_markers_inside_quotes_are_kept(self):
+        script = "SELECT '-- not a comment', '/* nor this */', '# nor this';"
+        self.assertEqual(split_sql_statements(script),
+                         ["SELECT '-- not a comment', '/* nor this */', '# nor this'"])
+
+    def test_delimiter_for_trigger_bodies(self):
+        script = """CREATE TABLE t (id INT);
+
+DELIMITER $$
+CREATE TRIGGER t_ai AFTER INSERT ON t FOR EACH ROW
+BEGIN
+    INSERT INTO log VALUES (NEW.id);
+    UPDATE counts SET n = n + 1;
+END$$
+DELIMITER ;
+
+SELECT 1;
+"""
+        statements = split_sql_statements(script)
+        self.assertEqual(len(statements), 3)
+        self.assertEqual(statements[0], "CREATE TABLE t (id INT)")
+        self.assertTrue(statements[1].startswith("CREATE TRIGGER t_ai"))
+        self.assertTrue(statements[1].endswith("END"))
+        self.assertIn("INSERT INTO log VALUES (NEW.id);", statements[1])
+        self.assertIn("UPDATE counts SET n = n + 1;", statements[1])
+        self.assertEqual(statements[2], "SELECT 1")
+
+    def test_delimiter_directive_is_case_insensitive(self):
+        script = "delimiter //\nSELECT 1; SELECT 2//\ndelimiter ;\nSELECT 3;"
+        self.assertEqual(split_sql_statements(script), ["SELECT 1; SELECT 2", "SELECT 3"])
+
+    def test_bundled_migrations_split(self):
+        migrations = discover_migrations()
+        self.assertTrue(migrations)
+        for version, name, path in migrations:
+            with open(path, encoding='utf-8') as f:
+                statements = split_sql_statements(f.read())
+            self.assertTrue(statements, f"{version}_{name} has no statements")
+            for statement in statements:
+                self.assertFalse(statement.startswith(('--', '#', '/*')), statement)
+
+
+
+# Like MySQL, fails on an index that already exists instead of translating to IF NOT EXISTS
+class StrictSQLiteDialect(SQLiteDialect):
+    def translate(self, query):
+        query = super().translate(query)
+        return re.sub(r"INDEX IF NOT EXISTS", "INDEX", query)
+
+
+class MigrationRunnerTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.connection = sqlite3.connect(':memory:')
+        self.runner = MigrationRunner(self.connection, self.directory, StrictSQLiteDialect())
+
+    def tearDown(self):
+        self.connection.close()
+        for name in os.listdir(self.directory):
+            os.remove(os.path.join(self.directory, name))
+        os.rmdir(self.directory)
+
+    def write(self, name, script):
+        with open(os.path.join(self.directory, name), 'w', encoding='utf-8') as f:
+            f.write(script)
+
+    def indexes(self):
+        return {row[0] for row in self.connection.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = 't'")}
+
+    def test_applies_pending_in_order_once(self):
+        self.write('001_create.sql', "CREATE TABLE t (a INT);")
+        self.write('002_index.sql', "ALTER TABLE t ADD INDEX idx_a (a);")
+        self.assertEqual(self.runner.apply_pending(), [1, 2])
+        self.assertEqual(self.runner.apply_pending(), [])
+        self.assertEqual(self.runner.current_version(), 2)
+        self.assertEqual(self.indexes(), {'idx_a'})
+
+    def test_failure_stops_the_run_and_is_not_recorded(self):
+        self.write('001_create.sql', "CREATE TABLE t (a INT);")
+        self.write('002_broken.sql', "ALTER TABLE t ADD INDEX idx_a (a);\nALTER TABLE t ADD INDEX idx_x (missing);")
+        self.write('003_later.sql', "CREATE TABLE u (a INT);")
+        with self.assertRaises(sqlite3.OperationalError):
+            self.runner.apply_pending()
+        self.assertEqual(self.runner.current_version(), 1)
+
+    def test_half_applied_migration_can_be_rerun(self):
+        self.write('001_create.sql', "CREATE TABLE t (a INT, b INT);")
+        self.runner.apply_pending()
+        # What a MySQL run that failed after its first ALTER TABLE leaves behind
+        self.connection.execute("CREATE INDEX idx_a ON t (a)")
+        self.connection.execute("ALTER TABLE t ADD COLUMN c INT")
+        self.write('002_more.sql', """ALTER TABLE t ADD INDEX idx_a (a);
+ALTER TABLE t ADD COLUMN c INT;
+ALTER TABLE t ADD UNIQUE INDEX idx_b (b);""")
+        self.assertEqual(self.runner.apply_pending(), [2])
+        self.assertEqual(self.indexes(), {'idx_a', 'idx_b'})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,102 @@
+import json
+import os
+import tempfile
+import unittest
+
+from src.database.db_config import DatabaseConfig
+from src.database.query_stats import LatencyHistogram, QueryStats, fingerprint
+
+
+class FingerprintTest(unittest.TestCase):
+    def test_literals_and_placeholders_fold(self):
+        self.assertEqual(fingerprint("SELECT * FROM t WHERE a = 5 AND b = 'x'"),
+                         fingerprint("SELECT *  FROM t\n WHERE a = %s AND b = %s"))
+
+    def test_lists_collapse(self):
+        self.assertEqual(fingerprint("SELECT * FROM t WHERE id IN (%s, %s, %s)"),
+                         "SELECT * FROM t WHERE id IN (?+)")
+        self.assertEqual(fingerprint("INSERT INTO t VALUES (1, 'a'), (2, 'b'), (3, 'c')"),
+                         "INSERT INTO t VALUES (?+), ...")
+
+
+class LatencyHistogramTest(unittest.TestCase):
+    def test_percentiles_within_a_bucket(self):
+        histogram = LatencyHistogram()
+        for ms in range(1, 101):
+            histogram.record(ms / 1000, rows=1)
+        for fraction, exact in ((0.50, 0.050), (0.95, 0.095), (0.99, 0.099)):
+            value = histogram.percentile(fraction)
+            # Bucket upper bounds overestimate by at most one 25% bucket
+            self.assertGreaterEqual(value, exact)
+            self.assertLessEqual(value, exact * 1.25)
+        self.assertEqual(histogram.percentile(1.0), 0.1)
+
+    def test_summary(self):
+        histogram = LatencyHistogram()
+        self.assertEqual(histogram.summary()['p99_ms'], 0.0)
+        histogram.record(0.002, rows=3)
+        histogram.record(0.004, rows=0, failed=True)
+        summary = histogram.summary()
+        self.assertEqual((summary['count'], summary['errors'], summary['rows']), (2, 1, 3))
+        self.assertEqual(summary['mean_ms'], 3.0)
+        self.assertEqual(summary['max_ms'], 4.0)
+
+
+class QueryStatsTest(unittest.TestCase):
+    def setUp(self):
+        handle, self.path = tempfile.mkstemp(suffix='.log')
+        os.close(handle)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def test_snapshot_groups_by_fingerprint_slowest_first(self):
+        stats = QueryStats(slow_query_threshold=None)
+        stats.record("SELECT * FROM t WHERE id = 1", 0.001, 1)
+        stats.record("SELECT * FROM t WHERE id = 2", 0.003, 1)
+        stats.record("SELECT * FROM u", 0.010, 5)
+        queries = stats.snapshot()['queries']
+        self.assertEqual([(q['fingerprint'], q['count']) for q in queries],
+                         [("SELECT * FROM u", 1), ("SELECT * FROM t WHERE id = ?", 2)])
+
+    def test_dump_json(self):
+        stats = QueryStats(slow_query_threshold=0.5)
+        stats.record("SELECT 1", 0.002, 1)
+        data = json.loads(stats.dump_json(self.path))
+        with open(self.path, encoding='utf-8') as f:
+            self.assertEqual(json.load(f), data)
+        self.assertEqual(data['slow_query_threshold_ms'], 500)
+        self.assertEqual(data['queries'][0]['fingerprint'], "SELECT ?")
+        self.assertEqual(data['queries'][0]['count'], 1)
+
+    def test_slow_queries_are_logged(self):
+        stats = QueryStats(slow_query_threshold=0.1, slow_query_log=self.path)
+        stats.record("SELECT * FROM t WHERE id = 1", 0.05, 1)
+        stats.record("SELECT * FROM t WHERE id = 2", 0.2, 1)
+        with open(self.path, encoding='utf-8') as f:
+            lines = f.read().splitlines()
+        self.assertEqual(len(lines), 1)
+        self.assertIn("slow query 200.0 ms, 1 rows: SELECT * FROM t WHERE id = ?", lines[0])
+
+    def test_reset(self):
+        stats = QueryStats()
+        stats.record("SELECT 1", 0.001)
+        stats.reset()
+        self.assertEqual(stats.snapshot()['queries'], [])
+
+    def test_database_calls_are_recorded(self):
+        db = DatabaseConfig(backend='sqlite', slow_query_threshold=None)
+        try:
+            db.connect()
+            db.fetch_all("SELECT * FROM sqlite_master WHERE name = %s", ('x',))
+            db.fetch_all("SELECT * FROM sqlite_master WHERE name = %s", ('y',))
+            db.execute_query("SELECT * FROM no_such_table")
+            queries = {q['fingerprint']: q for q in db.query_stats.snapshot()['queries']}
+            self.assertEqual(queries["SELECT * FROM sqlite_master WHERE name = ?"]['count'], 2)
+            self.assertEqual(queries["SELECT * FROM no_such_table"]['errors'], 1)
+        finally:
+            db.disconnect()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,45 @@
+import unittest
+
+from src.database.records import Record, Student, record_reader, record_type
+
+
+class RecordReaderTest(unittest.TestCase):
+    def test_all_columns_in_order(self):
+        read = record_reader(Student, Student.__slots__)
+        student = read(tuple(range(len(Student.__slots__))))
+        self.assertEqual(tuple(student), tuple(range(len(Student.__slots__))))
+
+    def test_subset_of_columns(self):
+        student = record_reader(Student, ('name', 'student_id'))(('Asha', 7))
+        self.assertEqual(student.student_id, 7)
+        self.assertEqual(student['name'], 'Asha')
+        self.assertEqual(student.keys(), ['student_id', 'name'])
+        self.assertNotIn('email', student)
+        with self.assertRaises(KeyError):
+            student['email']
+
+    def test_unknown_columns_are_skipped(self):
+        # e.g. SELECT s.* after a migration added a column Student doesn't declare
+        read = record_reader(Student, ('student_id', 'nickname', 'name', 'updated_at'))
+        student = read((7, 'Ash', 'Asha', '2026-01-01'))
+        self.assertEqual(student.as_dict(), {'student_id': 7, 'name': 'Asha'})
+        self.assertFalse(hasattr(student, 'nickname'))
+        self.assertIsNone(student.get('updated_at'))
+
+
+class RecordTypeTest(unittest.TestCase):
+    def test_builds_one_type_per_column_list(self):
+        row_type = record_type(('a', 'b'))
+        self.assertIs(record_type(('a', 'b')), row_type)
+        self.assertTrue(issubclass(row_type, Record))
+        self.assertEqual(row_type._make((1, 2)).as_dict(), {'a': 1, 'b': 2})
+
+    def test_rejects_unusable_column_names(self):
+        with self.assertRaises(ValueError):
+            record_type(('COUNT(*)',))
+        with self.assertRaises(ValueError):
+            record_type(('a', 'a'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,92 @@
+import tkinter as tk
+import unittest
+
+from src.database.db_config import DatabaseConfig
+from src.database.db_operations import DatabaseOperations
+from src.utils.views import TreeRows
+
+
+# Just enough of ttk.Treeview (flat, no display needed) for TreeRows
+class FakeTree:
+    def __init__(self):
+        self.order = []
+        self.values = {}
+
+    def insert(self, parent, index, iid, values):
+        self.order.insert(len(self.order) if index == tk.END else index, iid)
+        self.values[iid] = values
+
+    def item(self, iid, values):
+        self.values[iid] = values
+
+    def move(self, iid, parent, index):
+        self.order.remove(iid)
+        self.order.insert(index, iid)
+
+    def delete(self, *iids):
+        for iid in iids:
+            self.order.remove(iid)
+            del self.values[iid]
+
+    def get_children(self, item=''):
+        return tuple(self.order)
+
+    def set_children(self, item, *iids):
+        self.order = list(iids)
+
+
+class TreeRowsTest(unittest.TestCase):
+    def setUp(self):
+        self.tree = FakeTree()
+        self.rows = TreeRows(self.tree)
+
+    def shown(self):
+        return [(int(iid), self.tree.values[iid]) for iid in self.tree.order]
+
+    def test_extend_and_update(self):
+        self.rows.extend([(1, ('a',)), (2, ('b',))])
+        self.rows.update([(3, ('c',)), (1, ('A',))])
+        self.assertEqual(self.shown(), [(3, ('c',)), (1, ('A',))])
+
+    def test_prepend_keeps_order(self):
+        self.rows.extend([(3, ('c',)), (4, ('d',))])
+        self.rows.prepend([(1, ('a',)), (2, ('b',))])
+        self.assertEqual([key for key, _ in self.shown()], [1, 2, 3, 4])
+        self.rows.prepend([(0, ('z',)), (3, ('C',))])
+        self.assertEqual(self.shown()[:2], [(0, ('z',)), (3, ('C',))])
+
+    def test_remove(self):
+        self.rows.extend([(1, ('a',)), (2, ('b',)), (3, ('c',))])
+        self.rows.remove(['1', 3, 99])
+        self.assertEqual(self.shown(), [(2, ('b',))])
+        self.assertEqual(list(self.rows.rows), ['2'])
+
+
+class StudentsPageTest(unittest.TestCase):
+    def setUp(self):
+        self.db = DatabaseConfig(backend='sqlite', query_stats=False)
+        self.db.initialize_database()
+        self.ops = DatabaseOperations(self.db)
+        for n in range(30):
+            self.ops.add_student(None, f'PG{n:04d}', f'Student {n}', f'pg{n}@student.edu', '9876543210',
+                                 None, None, None, 1, 1)
+        self.ids = [row['student_id'] for row in
+                    self.db.fetch_all("SELECT student_id FROM students WHERE status = 'Active' ORDER BY student_id")]
+
+    def tearDown(self):
+        self.db.disconnect()
+
+    def page(self, **options):
+        return [student.student_id for student in self.ops.get_students_page(**options)]
+
+    def test_pages_forward(self):
+        self.assertEqual(self.page(limit=10), self.ids[:10])
+        self.assertEqual(self.page(after_id=self.ids[9], limit=10), self.ids[10:20])
+
+    def test_pages_backward_in_id_order(self):
+        self.assertEqual(self.page(before_id=self.ids[20], limit=10), self.ids[10:20])
+        self.assertEqual(self.page(before_id=self.ids[3], limit=10), self.ids[:3])
+
+
+if __name__ == '__main__':
+    unittest.main()